@@ -0,0 +1,82 @@
+import threading
+import time
+from datetime import date, timedelta
+from typing import Dict, Optional, Tuple
+
+
+class CrawlAdmission:
+    """캐시 미스로 인한 크롤링 요청을 걸러냅니다.
+
+    - 허용 날짜 범위: 오늘 기준 past_days 전 ~ future_days 후
+    - 네거티브 캐시: 크롤링해도 메뉴가 없던 주(empty_ttl)나 실패한 주(failure_ttl)는 일정 시간 재시도하지 않음
+    - 클라이언트별 토큰 버킷: 분당 rate_per_minute개, 최대 burst개까지
+    """
+
+    def __init__(
+        self,
+        past_days: int = 28,
+        future_days: int = 14,
+        empty_ttl: float = 1800,
+        failure_ttl: float = 300,
+        rate_per_minute: float = 2,
+        burst: int = 2,
+        max_clients: int = 10000,
+    ):
+        self.past_days = past_days
+        self.future_days = future_days
+        self.empty_ttl = empty_ttl
+        self.failure_ttl = failure_ttl
+        self.rate_per_second = rate_per_minute / 60
+        self.burst = burst
+        self.max_clients = max_clients
+        self._negative_cache: Dict[date, Tuple[float, str]] = {}
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def check(self, target_date: date, client_key: str) -> Optional[str]:
+        """크롤링을 허용하면 None, 거절하면 사유를 반환합니다."""
+        today = date.today()
+        if not (today - timedelta(days=self.past_days) <= target_date <= today + timedelta(days=self.future_days)):
+            return "out_of_window"
+
+        monday = target_date - timedelta(days=target_date.weekday())
+        now = time.monotonic()
+        with self._lock:
+            cached = self._negative_cache.get(monday)
+            if cached:
+                expires_at, reason = cached
+                if now < expires_at:
+                    return reason
+                del self._negative_cache[monday]
+
+            if not self._take_token(client_key, now):
+                return "rate_limited"
+        return None
+
+    def record_result(self, target_date: date, found: bool, failed: bool = False):
+        """크롤링 결과를 기록합니다. 메뉴를 찾지 못했거나 실패한 주는 네거티브 캐시에 넣습니다."""
+        monday = target_date - timedelta(days=target_date.weekday())
+        with self._lock:
+            if found:
+                self._negative_cache.pop(monday, None)
+            elif failed:
+                self._negative_cache[monday] = (time.monotonic() + self.failure_ttl, "recently_failed")
+            else:
+                self._negative_cache[monday] = (time.monotonic() + self.empty_ttl, "known_empty")
+
+    def _take_token(self, client_key: str, now: float) -> bool:
+        tokens, updated_at = self._buckets.get(client_key, (float(self.burst), now))
+        tokens = min(self.burst, tokens + (now - updated_at) * self.rate_per_second)
+        if tokens < 1:
+            self._buckets[client_key] = (tokens, now)
+            return False
+
+        self._buckets[client_key] = (tokens - 1, now)
+        if len(self._buckets) > self.max_clients:
+            # 토큰이 가득 찬(오래 쉬고 있는) 클라이언트부터 정리
+            idle_after = self.burst / self.rate_per_second if self.rate_per_second else 0
+            self._buckets = {
+                key: value for key, value in self._buckets.items()
+                if now - value[1] < idle_after
+            }
+        return True
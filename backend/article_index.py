@@ -0,0 +1,58 @@
+import json
+import logging
+import os
+import threading
+from datetime import date
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ArticleIndex:
+    """천안 식단 게시판의 주차별 게시글 정보 (주 -> 게시글 URL, 이미지 URL, ETag/Last-Modified, OCR 결과)
+
+    path를 지정하면 JSON 파일로 저장해 서버를 재시작해도 유지됩니다.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_weeks_per_source: int = 12):
+        self.path = path
+        self.max_weeks_per_source = max_weeks_per_source
+        self._entries: Dict[str, Dict[str, dict]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def get(self, source: str, monday: date) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(source, {}).get(monday.isoformat())
+            return dict(entry) if entry else None
+
+    def put(self, source: str, monday: date, entry: dict):
+        with self._lock:
+            weeks = self._entries.setdefault(source, {})
+            weeks[monday.isoformat()] = entry
+            # 오래된 주차부터 정리
+            for week in sorted(weeks)[: max(len(weeks) - self.max_weeks_per_source, 0)]:
+                del weeks[week]
+            self._save()
+
+    def _load(self):
+        if not self.path:
+            return
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                self._entries = json.load(file)
+        except FileNotFoundError:
+            pass
+        except ValueError as error:
+            logger.warning(f"Article index is corrupted, starting empty: {error}")
+
+    def _save(self):
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(self._entries, file, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
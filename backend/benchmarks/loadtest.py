@@ -0,0 +1,352 @@
+"""ASGI 앱 부하 테스트 하네스
+
+FastAPI `app`을 프로세스 안에서 직접 호출해 실제와 비슷한 요청 비율(today/week/date/restaurant/push subscribe)로
+부하를 주고, 경로별 처리량과 p50/p95/p99 지연 시간을 출력합니다.
+상명대 홈페이지, OCR.space, 웹 푸시 서비스는 로컬 스텁 서버로 대체합니다.
+
+시나리오
+- steady: 메뉴가 채워진 상태에서 조회 트래픽만 발생
+- crawl: 조회 트래픽 중에 전체 크롤링(업스트림 지연 포함)이 계속 진행
+- push: 조회 트래픽 중에 등록된 구독 전체로 푸시 발송(fan-out)
+
+    cd backend
+    python benchmarks/loadtest.py --duration 10 --concurrency 50
+    python benchmarks/loadtest.py --scenario crawl --upstream-latency 200
+"""
+import argparse
+import asyncio
+import base64
+import json
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from typing import Dict, List, Optional
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from PIL import Image
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+RESTAURANT_VALUES = ["서울_학생식당", "서울_교직원식당", "서울_푸드코트", "천안_학생식당", "천안_교직원식당"]
+ROUTE_MIX = [
+    ("today", 40),
+    ("week", 25),
+    ("date", 15),
+    ("restaurant", 15),
+    ("push_subscribe", 5),
+]
+
+
+def _urlsafe_b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def generate_vapid_private_key() -> str:
+    key = ec.generate_private_key(ec.SECP256R1())
+    return _urlsafe_b64(key.private_bytes(
+        serialization.Encoding.DER,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ))
+
+
+def generate_subscription(endpoint: str) -> dict:
+    key = ec.generate_private_key(ec.SECP256R1())
+    public_key = key.public_key().public_bytes(
+        serialization.Encoding.X962,
+        serialization.PublicFormat.UncompressedPoint,
+    )
+    return {
+        "endpoint": endpoint,
+        "expirationTime": None,
+        "keys": {"p256dh": _urlsafe_b64(public_key), "auth": _urlsafe_b64(os.urandom(16))},
+    }
+
+
+class StubUpstreamHandler(BaseHTTPRequestHandler):
+    """상명대 식단 페이지/천안 게시판, OCR.space, 웹 푸시 엔드포인트를 흉내 내는 스텁"""
+
+    latency = 0.0
+    counts: Dict[str, int] = {}
+    monday = date.today() - timedelta(days=date.today().weekday())
+    image_bytes = b""
+
+    def log_message(self, *args):
+        pass
+
+    def _count(self, name: str):
+        StubUpstreamHandler.counts[name] = StubUpstreamHandler.counts.get(name, 0) + 1
+
+    def _send(self, status: int, body: bytes, content_type: str = "text/html; charset=utf-8"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        monday = self.monday
+        friday = monday + timedelta(days=4)
+        title_range = f"({monday.year}.{monday.month}.{monday.day}~{friday.month}.{friday.day})"
+
+        if self.path.startswith("/kor/life/restaurantView.do"):
+            self._count("seoul")
+            header = "".join(
+                f"<th>{'월화수목금'[offset]}({(monday + timedelta(days=offset)).strftime('%m.%d')})</th>"
+                for offset in range(5)
+            )
+            cells = "".join(
+                "<td><ul>" + "".join(f"<li>메뉴{offset}-{index}</li>" for index in range(6)) + "</ul></td>"
+                for offset in range(5)
+            )
+            body = (
+                '<div class="menu-list-box"><table class="smu-table">'
+                f"<thead><tr><th>구분</th>{header}</tr></thead><tbody><tr><th>중식</th>{cells}</tr></tbody>"
+                "</table></div>"
+            )
+        elif self.path.startswith("/kor/life/restaurantView3.do") or self.path.startswith("/kor/life/restaurantView4.do"):
+            self._count("board")
+            body = (
+                f'<a href="/article/faculty?mode=view" title="교직원식당 주간 메뉴 {title_range}">교직원</a>'
+                f'<a href="/article/student?mode=view" title="주간식단표{title_range}">학생</a>'
+            )
+        elif self.path.startswith("/article/"):
+            self._count("article")
+            body = (
+                f'<div id="jwxe_main_content"><h4>주간 메뉴 {title_range}</h4></div>'
+                f'<div class="fr-view"><img src="/images/{self.path.split("/")[2].split("?")[0]}.jpg"></div>'
+            )
+        elif self.path.startswith("/images/"):
+            self._count("image")
+            self._send(200, self.image_bytes, "image/jpeg")
+            return
+        else:
+            self._send(404, b"not found")
+            return
+
+        self._send(200, body.encode("utf-8"))
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+
+        if self.path.startswith("/ocr"):
+            self._count("ocr")
+            time.sleep(self.latency)
+            words = []
+            for column in range(5):
+                for row in range(6):
+                    words.append({
+                        "MinTop": row * 40,
+                        "Words": [{"WordText": f"김치볶음밥{row}", "Left": column * 300 + 10, "Width": 120}],
+                    })
+            payload = {"IsErroredOnProcessing": False, "ParsedResults": [{"TextOverlay": {"Lines": words}}]}
+            self._send(200, json.dumps(payload).encode("utf-8"), "application/json")
+        elif self.path.startswith("/push/"):
+            self._count("push")
+            self._send(201, b"")
+        else:
+            self._send(404, b"not found")
+
+
+def crawl_from_upstream(backend):
+    """모든 소스를 업스트림에서 다시 크롤링합니다.
+
+    소스별 신선도 기록 때문에 replace 없이 update_menus를 부르면 첫 크롤링 이후에는 업스트림에 요청하지 않습니다.
+    """
+    backend.update_menus(date.today(), False, replace=True)
+
+
+def start_stub_upstream(latency: float) -> ThreadingHTTPServer:
+    buffer = BytesIO()
+    Image.new("L", (1500, 1000), 255).save(buffer, format="JPEG")
+    StubUpstreamHandler.image_bytes = buffer.getvalue()
+    StubUpstreamHandler.latency = latency
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubUpstreamHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def asgi_request(app, method: str, path: str, query: str = "", body: Optional[dict] = None):
+    """ASGI 앱을 직접 호출합니다 (HTTP 서버/클라이언트 오버헤드 없이 앱 자체의 지연만 측정)."""
+    raw_body = json.dumps(body).encode("utf-8") if body is not None else b""
+    headers = [(b"host", b"loadtest")]
+    if body is not None:
+        headers.append((b"content-type", b"application/json"))
+        headers.append((b"content-length", str(len(raw_body)).encode()))
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode("utf-8"),
+        "query_string": query.encode("utf-8"),
+        "root_path": "",
+        "headers": headers,
+        "client": (f"10.0.{random.randint(0, 255)}.{random.randint(1, 254)}", 50000),
+        "server": ("loadtest", 80),
+    }
+    request_sent = False
+    status = 0
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": raw_body, "more_body": False}
+        await asyncio.sleep(3600)
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+class LoadGenerator:
+    def __init__(self, app, push_endpoint_base: str):
+        self.app = app
+        self.push_endpoint_base = push_endpoint_base
+        self.latencies: Dict[str, List[float]] = {name: [] for name, _ in ROUTE_MIX}
+        self.errors: Dict[str, int] = {name: 0 for name, _ in ROUTE_MIX}
+        self._names = [name for name, _ in ROUTE_MIX]
+        self._weights = [weight for _, weight in ROUTE_MIX]
+
+    def _build_request(self, route: str):
+        monday = date.today() - timedelta(days=date.today().weekday())
+        target = monday + timedelta(days=random.randint(0, 4))
+        if route == "today":
+            return "GET", "/api/menus/today", "", None
+        if route == "week":
+            return "GET", "/api/menus/week", f"target_date={target.isoformat()}", None
+        if route == "date":
+            return "GET", f"/api/menus/date/{target.isoformat()}", "", None
+        if route == "restaurant":
+            return "GET", f"/api/menus/restaurant/{random.choice(RESTAURANT_VALUES)}", f"target_date={target.isoformat()}", None
+        endpoint = f"{self.push_endpoint_base}/push/{random.getrandbits(64):x}"
+        return "POST", "/api/push/subscribe", "", {"subscription": generate_subscription(endpoint)}
+
+    async def _user(self, deadline: float):
+        while time.perf_counter() < deadline:
+            route = random.choices(self._names, self._weights)[0]
+            method, path, query, body = self._build_request(route)
+            started = time.perf_counter()
+            try:
+                status = await asgi_request(self.app, method, path, query, body)
+                if status >= 400:
+                    self.errors[route] += 1
+            except Exception:
+                self.errors[route] += 1
+            self.latencies[route].append(time.perf_counter() - started)
+            await asyncio.sleep(0)
+
+    async def run(self, duration: float, concurrency: int) -> float:
+        deadline = time.perf_counter() + duration
+        started = time.perf_counter()
+        await asyncio.gather(*(self._user(deadline) for _ in range(concurrency)))
+        return time.perf_counter() - started
+
+    def report(self, title: str, elapsed: float):
+        print(f"\n== {title} ({elapsed:.1f}s) ==")
+        print(f"{'route':<16}{'count':>8}{'err':>6}{'rps':>9}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}")
+        total = 0
+        for route, samples in self.latencies.items():
+            if not samples:
+                continue
+            total += len(samples)
+            ordered = sorted(samples)
+            quantiles = statistics.quantiles(ordered, n=100) if len(ordered) > 1 else ordered * 99
+            print(
+                f"{route:<16}{len(samples):>8}{self.errors[route]:>6}{len(samples) / elapsed:>9.1f}"
+                f"{quantiles[49] * 1000:>10.2f}{quantiles[94] * 1000:>10.2f}{quantiles[98] * 1000:>10.2f}"
+            )
+        print(f"{'total':<16}{total:>8}{sum(self.errors.values()):>6}{total / elapsed:>9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", choices=["steady", "crawl", "push", "all"], default="all")
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--upstream-latency", type=float, default=100, help="스텁 업스트림 응답 지연 (ms)")
+    parser.add_argument("--subscriptions", type=int, default=200, help="push 시나리오의 구독 수")
+    args = parser.parse_args()
+
+    upstream = start_stub_upstream(args.upstream_latency / 1000)
+    upstream_url = f"http://127.0.0.1:{upstream.server_port}"
+
+    # main import 전에 외부 의존성을 스텁으로 돌림
+    os.environ["SMU_BASE_URL"] = upstream_url
+    os.environ["OCR_SPACE_API_URL"] = f"{upstream_url}/ocr"
+    os.environ.setdefault("OCR_SPACE_API_KEY", "loadtest")
+    os.environ["VAPID_PUBLIC_KEY"] = "loadtest"
+    os.environ["VAPID_PRIVATE_KEY"] = generate_vapid_private_key()
+    # 이전 실행의 신선도 기록으로 크롤링을 건너뛰지 않도록 메모리에만 기록
+    os.environ["FRESHNESS_PATH"] = ""
+
+    import logging
+    import main as backend
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    async def run_all():
+        backend.menu_events.bind_loop(asyncio.get_running_loop())
+        await asyncio.to_thread(crawl_from_upstream, backend)
+        print(f"seeded {len(backend.db.menus)} menus from stub upstream")
+
+        scenarios = ["steady", "crawl", "push"] if args.scenario == "all" else [args.scenario]
+        for scenario in scenarios:
+            background: Optional[threading.Thread] = None
+            stop = threading.Event()
+
+            if scenario == "crawl":
+                def _crawl_loop():
+                    while not stop.is_set():
+                        crawl_from_upstream(backend)
+                background = threading.Thread(target=_crawl_loop, daemon=True)
+            elif scenario == "push":
+                for _ in range(args.subscriptions):
+                    backend.db.upsert_push_subscription(
+                        generate_subscription(f"{upstream_url}/push/{random.getrandbits(64):x}")
+                    )
+
+                def _push_loop():
+                    while not stop.is_set():
+                        backend.send_push_payload({"title": "loadtest", "body": "fan-out", "url": "/"})
+                background = threading.Thread(target=_push_loop, daemon=True)
+
+            StubUpstreamHandler.counts = {}
+            if background:
+                background.start()
+            generator = LoadGenerator(backend.app, upstream_url)
+            elapsed = await generator.run(args.duration, args.concurrency)
+            stop.set()
+            if background:
+                await asyncio.to_thread(background.join)
+
+            generator.report(scenario, elapsed)
+            print(f"upstream requests: {StubUpstreamHandler.counts}")
+
+    asyncio.run(run_all())
+    upstream.shutdown()
+
+
+if __name__ == "__main__":
+    main()
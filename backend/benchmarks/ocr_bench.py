@@ -0,0 +1,170 @@
+"""OCR 엔진 호출 비용 벤치마크
+
+같은 요일 칸 이미지를 엔진별(pytesseract: 호출마다 프로세스 실행, tesserocr: 모델을 한 번만 로드)로
+반복 인식해 첫 호출(모델 로드 포함)과 이후 호출의 지연 시간을 비교하고,
+식단 이미지 한 장 전체(요일 5칸, psm 6/4)를 처리하는 시간과 결과가 엔진 간에 같은지 확인합니다.
+
+    cd backend
+    python benchmarks/ocr_bench.py --calls 20
+    python benchmarks/ocr_bench.py --image ./menu_board.jpg
+    python benchmarks/ocr_bench.py --lang eng
+"""
+import argparse
+import glob
+import os
+import statistics
+import sys
+import time
+from typing import List, Optional
+
+from PIL import Image, ImageDraw, ImageFont
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from crawler import SMUCafeteriaCrawler  # noqa: E402
+from ocr_engine import (  # noqa: E402
+    OCR_LANG,
+    PYTESSERACT_AVAILABLE,
+    TESSEROCR_AVAILABLE,
+    PytesseractEngine,
+    TesserocrEngine,
+)
+
+FONT_PATTERNS = [
+    "/usr/share/fonts/**/NanumGothic*.ttf",
+    "/usr/share/fonts/**/NotoSansCJK*.ttc",
+    "/usr/share/fonts/**/NotoSansKR*.otf",
+    "/Library/Fonts/AppleGothic.ttf",
+    "C:/Windows/Fonts/malgun.ttf",
+]
+SAMPLE_DAYS = [
+    ["쌀밥", "김치찌개", "계란말이", "시금치나물", "배추김치"],
+    ["잡곡밥", "된장국", "제육볶음", "콩나물무침", "깍두기"],
+    ["카레라이스", "미소국", "돈까스", "양배추샐러드", "단무지"],
+    ["쌀밥", "미역국", "고등어구이", "감자조림", "배추김치"],
+    ["비빔밥", "북어국", "떡갈비", "오이무침", "열무김치"],
+]
+
+
+def _find_font(size: int):
+    for pattern in FONT_PATTERNS:
+        for path in glob.glob(pattern, recursive=True):
+            try:
+                return ImageFont.truetype(path, size)
+            except OSError:
+                continue
+    return None
+
+
+def render_sample_board() -> Image.Image:
+    """식단 게시판 이미지와 비슷한 배치(왼쪽 머리글, 요일 5칸)의 합성 이미지"""
+    width, height = 1600, 1000
+    image = Image.new("L", (width, height), 255)
+    draw = ImageDraw.Draw(image)
+    font = _find_font(30)
+    korean = font is not None
+    if not korean:
+        print("Korean font not found, rendering ASCII sample text")
+        font = ImageFont.load_default()
+
+    left, top = int(width * 0.18), int(height * 0.18)
+    column_width = int(width * 0.8) // 5
+    for day, items in enumerate(SAMPLE_DAYS):
+        x = left + day * column_width + 20
+        for row, item in enumerate(items):
+            text = item if korean else f"menu {day}-{row}"
+            draw.text((x, top + 40 + row * 60), text, fill=0, font=font)
+    return image
+
+
+def create_engines(pool_size: int, lang: str = OCR_LANG) -> List:
+    engines = []
+    if PYTESSERACT_AVAILABLE:
+        engines.append(PytesseractEngine(lang=lang))
+    if TESSEROCR_AVAILABLE:
+        engines.append(TesserocrEngine(lang=lang, pool_size=pool_size))
+    return engines
+
+
+def column_crop(board: Image.Image) -> Image.Image:
+    width, height = board.size
+    left, right = int(width * 0.18), int(width * 0.98)
+    top, bottom = int(height * 0.18), int(height * 0.82)
+    return board.crop((left, top, left + (right - left) // 5, bottom))
+
+
+def bench_calls(engine, crop: Image.Image, calls: int, psm: int) -> dict:
+    started = time.perf_counter()
+    engine.image_to_data(crop, psm)
+    first = time.perf_counter() - started
+
+    timings = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        engine.image_to_data(crop, psm)
+        timings.append(time.perf_counter() - started)
+    return {"first": first, "median": statistics.median(timings), "min": min(timings)}
+
+
+def bench_board(crawler: SMUCafeteriaCrawler, engine, board: Image.Image, runs: int) -> tuple:
+    crawler.ocr_engine = engine
+    crawler.ocr_strategy = "both"
+    timings = []
+    result: Optional[List[List[str]]] = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = crawler._extract_day_columns_from_image(board)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--image", help="식단 게시판 이미지 (없으면 합성 이미지 사용)")
+    parser.add_argument("--calls", type=int, default=20, help="엔진별 칸 하나 반복 인식 횟수")
+    parser.add_argument("--runs", type=int, default=3, help="엔진별 이미지 전체 처리 반복 횟수")
+    parser.add_argument("--psm", type=int, default=6)
+    parser.add_argument("--pool-size", type=int, default=1)
+    parser.add_argument("--lang", default=OCR_LANG, help="언어 모델 (kor 학습 데이터가 없으면 eng로 비교)")
+    args = parser.parse_args()
+
+    engines = create_engines(args.pool_size, args.lang)
+    if not engines:
+        print("No local OCR engine available (install tesseract + pytesseract, and tesserocr for the persistent engine)")
+        return
+    if len(engines) == 1:
+        print(f"Only {engines[0].name} is available; install tesserocr to compare the persistent engine")
+
+    board = Image.open(args.image).convert("L") if args.image else render_sample_board()
+    crawler = SMUCafeteriaCrawler()
+    crop = column_crop(board)
+
+    print(f"per-call ({args.calls} calls, psm {args.psm}, lang {args.lang}, crop {crop.width}x{crop.height})")
+    per_call = {}
+    for engine in engines:
+        stats = bench_calls(engine, crop, args.calls, args.psm)
+        per_call[engine.name] = stats
+        print(
+            f"{engine.name:>12}: first {stats['first'] * 1000:8.1f}ms | "
+            f"median {stats['median'] * 1000:8.1f}ms | min {stats['min'] * 1000:8.1f}ms"
+        )
+    if "pytesseract" in per_call and "tesserocr" in per_call:
+        saved = per_call["pytesseract"]["median"] - per_call["tesserocr"]["median"]
+        print(f"{'overhead':>12}: {saved * 1000:8.1f}ms removed per call")
+
+    print(f"full board ({args.runs} runs, 5 columns, psm 6+4)")
+    results = {}
+    for engine in engines:
+        elapsed, results[engine.name] = bench_board(crawler, engine, board, args.runs)
+        print(f"{engine.name:>12}: {elapsed * 1000:8.1f}ms per image")
+    if len(results) > 1:
+        first, *rest = results.values()
+        print(f"{'same output':>12}: {all(result == first for result in rest)}")
+
+    for engine in engines:
+        engine.close()
+
+
+if __name__ == "__main__":
+    main()
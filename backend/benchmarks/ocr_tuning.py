@@ -0,0 +1,231 @@
+"""OCR 전처리/분할/전략 설정 튜닝
+
+정답이 있는 천안 식단 이미지(픽스처)에 설정 조합마다 _extract_day_columns_from_image를 실행해
+처리 시간(wall), CPU 시간(tesseract 자식 프로세스 포함), 최대 메모리, 항목 단위 정확도(정밀도/재현율/F1)를 비교합니다.
+조합마다 새 프로세스에서 실행하므로 최대 메모리는 그 조합만의 값입니다.
+
+픽스처 디렉터리에는 이미지(menu1.jpg)와 같은 이름의 정답 파일(menu1.json)을 둡니다.
+
+    {"days": [["쌀밥", "김치찌개", ...], [...], [...], [...], [...]]}   # 월~금
+
+설정 조합은 --matrix JSON(항목 -> 값 목록)으로 바꿀 수 있고, 항목은 crawler.OCR_TUNING_KEYS와 같습니다.
+가장 좋은 조합(F1이 가장 높고, 같으면 가장 빠른 것)을 --export 파일로 저장하면
+크롤러가 OCR_TUNING_PATH로 읽어 사용합니다.
+
+    cd backend
+    python benchmarks/ocr_tuning.py --fixtures ./fixtures/cheonan
+    python benchmarks/ocr_tuning.py --fixtures ./fixtures/cheonan --matrix '{"ocr_fixed_scale": [null, 1.5, 2.0]}' --export ./data/ocr_tuning.json
+"""
+import argparse
+import glob
+import itertools
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import time
+from typing import Dict, List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from crawler import OCR_TUNING_KEYS, SMUCafeteriaCrawler  # noqa: E402
+from menu_filters import is_dish_item  # noqa: E402
+from search_index import normalize_dish_name  # noqa: E402
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp")
+DEFAULT_MATRIX = {
+    "ocr_autocontrast": [True, False],
+    "ocr_sharpen": [True, False],
+    "ocr_fixed_scale": [None, 1.0, 2.0],
+    "ocr_strategy": ["adaptive", "both"],
+}
+
+
+def load_fixtures(directory: str) -> List[dict]:
+    fixtures = []
+    for path in sorted(glob.glob(os.path.join(directory, "*"))):
+        stem, extension = os.path.splitext(path)
+        if extension.lower() not in IMAGE_EXTENSIONS:
+            continue
+        if not os.path.exists(f"{stem}.json"):
+            print(f"skip {os.path.basename(path)}: no {os.path.basename(stem)}.json")
+            continue
+        with open(f"{stem}.json", encoding="utf-8") as file:
+            days = json.load(file)["days"]
+        if len(days) != 5:
+            raise ValueError(f"{stem}.json: expected 5 days, got {len(days)}")
+        fixtures.append({"name": os.path.basename(path), "image": path, "days": days})
+    return fixtures
+
+
+def expand_matrix(matrix: Dict[str, list]) -> List[dict]:
+    unknown = set(matrix) - set(OCR_TUNING_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown OCR tuning keys: {', '.join(sorted(unknown))}")
+    keys = sorted(matrix)
+    return [dict(zip(keys, values)) for values in itertools.product(*(matrix[key] for key in keys))]
+
+
+def score_day(predicted: List[str], expected: List[str]) -> tuple[int, int, int]:
+    """(맞은 항목 수, 인식한 항목 수, 정답 항목 수). 항목 이름은 검색 색인과 같은 방식으로 정규화해 비교합니다.
+
+    '정보없음'/'미운영' 같은 메뉴 없음 표시와 원산지 안내 문구는 인식한 항목으로 세지 않습니다.
+    """
+    predicted_names = [normalize_dish_name(name) for name in predicted if is_dish_item(name)]
+    remaining = [normalize_dish_name(name) for name in expected]
+    matched = 0
+    for name in predicted_names:
+        if name in remaining:
+            remaining.remove(name)
+            matched += 1
+    return matched, len(predicted_names), len(expected)
+
+
+def _peak_rss_mb() -> float:
+    # 리눅스의 ru_maxrss는 KB, macOS는 바이트
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return max(own, children) / divisor
+
+
+def _cpu_seconds() -> float:
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return time.process_time() + children.ru_utime + children.ru_stime
+
+
+def run_config(config: dict, fixtures: List[dict], runs: int) -> dict:
+    """새 프로세스에서 실행됩니다. 설정 하나로 모든 픽스처를 runs번 처리합니다."""
+    from PIL import Image
+
+    crawler = SMUCafeteriaCrawler()
+    crawler.apply_ocr_tuning(config)
+    if crawler.ocr_engine is None:
+        return {"error": "no local OCR engine (install tesseract + pytesseract or tesserocr)"}
+
+    images = [Image.open(fixture["image"]).convert("L") for fixture in fixtures]
+    matched = predicted = expected = passes = 0
+    per_fixture = {}
+    cpu_started = _cpu_seconds()
+    started = time.perf_counter()
+    for run in range(runs):
+        for fixture, image in zip(fixtures, images):
+            try:
+                days = crawler._extract_day_columns_from_image(image)
+            except Exception as error:
+                # 엔진 예외(TesseractNotFoundError 등)는 부모 프로세스에서 복원되지 않을 수 있으므로 문자열로 반환
+                return {"error": f"{fixture['name']}: {type(error).__name__}: {error}"}
+            passes += sum(stats.get("passes", 0) for stats in crawler.last_ocr_column_stats)
+            if run:
+                continue
+            fixture_matched = 0
+            for predicted_items, expected_items in zip(days, fixture["days"]):
+                day_matched, day_predicted, day_expected = score_day(predicted_items, expected_items)
+                fixture_matched += day_matched
+                matched += day_matched
+                predicted += day_predicted
+                expected += day_expected
+            per_fixture[fixture["name"]] = fixture_matched
+    wall = time.perf_counter() - started
+    cpu = _cpu_seconds() - cpu_started
+
+    precision = matched / predicted if predicted else 0.0
+    recall = matched / expected if expected else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    images_processed = len(fixtures) * runs
+    crawler.ocr_engine.close()
+    return {
+        "wall": wall / images_processed,
+        "cpu": cpu / images_processed,
+        "peak_mb": _peak_rss_mb(),
+        "passes": passes / images_processed,
+        "precision": precision,
+        "recall": recall,
+        "f1": f1,
+        "matched": per_fixture,
+    }
+
+
+def export_tuning(path: str, config: dict, metrics: dict, fixture_names: List[str]):
+    """크롤러가 OCR_TUNING_PATH로 읽는 파일을 저장합니다. config는 기본값과 합친 전체 설정으로 저장합니다."""
+    crawler = SMUCafeteriaCrawler()
+    crawler.apply_ocr_tuning(config)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(
+            {
+                "config": crawler.ocr_tuning(),
+                "metrics": {key: value for key, value in metrics.items() if key != "matched"},
+                "fixtures": fixture_names,
+            },
+            file,
+            ensure_ascii=False,
+            indent=2,
+        )
+
+
+def _format_config(config: dict) -> str:
+    return " ".join(f"{key.removeprefix('ocr_')}={value}" for key, value in config.items())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", required=True, help="이미지와 정답 JSON이 있는 디렉터리")
+    parser.add_argument("--matrix", help="설정 조합 JSON (항목 -> 값 목록) 또는 그 파일 경로")
+    parser.add_argument("--runs", type=int, default=1, help="조합별 픽스처 전체 반복 횟수 (시간 측정용)")
+    parser.add_argument("--export", help="가장 좋은 조합을 저장할 파일 (크롤러의 OCR_TUNING_PATH)")
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.fixtures)
+    if not fixtures:
+        print(f"No labelled fixtures in {args.fixtures}")
+        return
+
+    matrix = DEFAULT_MATRIX
+    if args.matrix:
+        if os.path.exists(args.matrix):
+            with open(args.matrix, encoding="utf-8") as file:
+                matrix = json.load(file)
+        else:
+            matrix = json.loads(args.matrix)
+    configs = expand_matrix(matrix)
+    expected_items = sum(len(items) for fixture in fixtures for items in fixture["days"])
+    print(f"{len(fixtures)} fixtures ({expected_items} items), {len(configs)} configs, {args.runs} runs each")
+
+    # 조합마다 새 프로세스: 최대 메모리와 tesseract 자식 프로세스 CPU 시간을 조합별로 따로 잼
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for config in configs:
+        with context.Pool(1) as pool:
+            try:
+                metrics = pool.apply(run_config, (config, fixtures, args.runs))
+            except ValueError as error:
+                metrics = {"error": str(error)}
+        if "error" in metrics:
+            print(f"{_format_config(config)}: {metrics['error']}")
+            continue
+        results.append((config, metrics))
+        print(
+            f"F1 {metrics['f1']:.3f} (P {metrics['precision']:.3f} R {metrics['recall']:.3f}) | "
+            f"wall {metrics['wall'] * 1000:7.0f}ms | cpu {metrics['cpu'] * 1000:7.0f}ms | "
+            f"peak {metrics['peak_mb']:6.1f}MB | passes {metrics['passes']:4.1f} | {_format_config(config)}"
+        )
+
+    if not results:
+        return
+
+    results.sort(key=lambda result: (-result[1]["f1"], result[1]["wall"]))
+    best_config, best_metrics = results[0]
+    print(f"best: F1 {best_metrics['f1']:.3f}, {best_metrics['wall'] * 1000:.0f}ms per image | {_format_config(best_config)}")
+
+    if args.export:
+        export_tuning(args.export, best_config, best_metrics, [fixture["name"] for fixture in fixtures])
+        print(f"exported to {args.export} (set OCR_TUNING_PATH to use it)")
+
+
+if __name__ == "__main__":
+    main()
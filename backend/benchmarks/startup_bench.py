@@ -0,0 +1,145 @@
+"""서버 시작 성능 벤치마크
+
+main.py import 시간과 uvicorn 시작부터 첫 응답(/api/menus/today)까지의 시간을 비교합니다.
+
+- eager: 지연 import 이전처럼 main보다 먼저 크롤러(requests/bs4/PIL/pytesseract)와 pywebpush를 불러오고
+  크롤러를 만든 기준선 (STARTUP_MODE=full)
+- lazy: 현재 main.py 그대로 (STARTUP_MODE=full)
+- lazy+fast+snapshot: 스냅샷 웜 부트 (STARTUP_MODE=fast, SNAPSHOT_PATH)
+
+시작 크롤링은 loadtest.py의 스텁 업스트림으로 보내므로 실제 학교 홈페이지에는 요청하지 않습니다.
+
+    cd backend
+    python benchmarks/startup_bench.py --runs 5
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from datetime import date, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from database import MenuDatabase  # noqa: E402
+from models import MealType, Menu, MenuItem, Restaurant  # noqa: E402
+from loadtest import StubUpstreamHandler, start_stub_upstream  # noqa: E402
+
+# 지연 import 이전의 main.py가 import 시점에 하던 일
+EAGER_PRELOAD = (
+    "from pywebpush import webpush, WebPushException; "
+    "from crawler import SMUCafeteriaCrawler; "
+    "SMUCafeteriaCrawler(); "
+)
+
+
+def write_sample_snapshot(path: str):
+    today = date.today()
+    monday = today - timedelta(days=today.weekday())
+    database = MenuDatabase()
+    database.save_menus([
+        Menu(
+            date=monday + timedelta(days=offset),
+            restaurant=restaurant,
+            meal_type=meal_type,
+            items=[MenuItem(name=f"메뉴{index}") for index in range(8)],
+        )
+        for offset in range(7)
+        for restaurant in Restaurant
+        for meal_type in (MealType.BREAKFAST, MealType.LUNCH)
+    ])
+    database.save_snapshot(path)
+
+
+def measure_import(env: dict, preload: str = "") -> float:
+    code = f"import time; started = time.perf_counter(); {preload}import main; print(time.perf_counter() - started)"
+    output = subprocess.check_output([sys.executable, "-c", code], cwd=BACKEND_DIR, env=env, stderr=subprocess.DEVNULL)
+    return float(output.decode().strip().splitlines()[-1])
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_first_response(env: dict, preload: str = "", timeout: float = 30.0) -> tuple[float, bool]:
+    port = free_port()
+    started = time.perf_counter()
+    # uvicorn CLI를 같은 인터프리터에서 실행하되, 기준선은 main보다 먼저 preload를 실행
+    launcher = f"{preload}import sys, uvicorn; sys.exit(uvicorn.main())"
+    process = subprocess.Popen(
+        [sys.executable, "-c", launcher, "main:app", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/api/menus/today", timeout=2) as response:
+                    payload = json.loads(response.read())
+                return time.perf_counter() - started, bool(payload.get("success"))
+            except OSError:
+                time.sleep(0.02)
+        raise TimeoutError("server did not respond")
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    upstream = start_stub_upstream(0)
+    upstream_url = f"http://127.0.0.1:{upstream.server_port}"
+    base_env = {
+        **os.environ,
+        "SMU_BASE_URL": upstream_url,
+        "OCR_SPACE_API_URL": f"{upstream_url}/ocr",
+        "OCR_SPACE_API_KEY": "startup-bench",
+        "FRESHNESS_PATH": "",
+        "ARTICLE_INDEX_PATH": "",
+        "SHARED_STORE_DIR": "",
+        "STATIC_EXPORT_DIR": "",
+        "SNAPSHOT_PATH": "",
+    }
+
+    with tempfile.TemporaryDirectory() as workdir:
+        snapshot_path = os.path.join(workdir, "snapshot.json")
+        write_sample_snapshot(snapshot_path)
+
+        modes = {
+            "eager": ({"STARTUP_MODE": "full"}, EAGER_PRELOAD),
+            "lazy": ({"STARTUP_MODE": "full"}, ""),
+            "lazy+fast+snapshot": ({"STARTUP_MODE": "fast", "SNAPSHOT_PATH": snapshot_path}, ""),
+        }
+        baseline = None
+        for name, (overrides, preload) in modes.items():
+            env = {**base_env, **overrides}
+            imports = [measure_import(env, preload) for _ in range(args.runs)]
+            first_responses = [measure_first_response(env, preload) for _ in range(args.runs)]
+            import_ms = statistics.median(imports) * 1000
+            response_ms = statistics.median(item[0] for item in first_responses) * 1000
+            if baseline is None:
+                baseline = (import_ms, response_ms)
+            print(
+                f"{name:>18}: import {import_ms:7.1f}ms ({import_ms - baseline[0]:+7.1f}) | "
+                f"first response {response_ms:7.1f}ms ({response_ms - baseline[1]:+7.1f}) | "
+                f"menus served on first response: {all(item[1] for item in first_responses)}"
+            )
+
+    upstream.shutdown()
+    print(f"stub upstream requests: {StubUpstreamHandler.counts}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""JSON / MessagePack 응답 형식 벤치마크
+
+한 주(월~금, 전체 식당, 조식/중식/석식) 메뉴로 /api/menus/week 응답을 만들어
+기본 JSON과 Accept: application/msgpack 압축 표현의 크기(원본/gzip), 인코딩·디코딩 시간을 비교합니다.
+인코딩은 서버가 응답을 만드는 경로(model_dump + 직렬화)를, parse는 본문 해석만, decode는 메뉴 객체까지 되돌리는 경로를 잽니다.
+
+    cd backend
+    python benchmarks/wire_bench.py --rounds 500
+"""
+import argparse
+import gzip
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from models import MealType, Menu, MenuItem, MenuResponse, Restaurant  # noqa: E402
+from wire_format import MSGPACK_AVAILABLE, decode_menu_payload, encode_menu_payload  # noqa: E402
+
+if MSGPACK_AVAILABLE:
+    import msgpack
+
+SAMPLE_ITEMS = [
+    "쌀밥", "잡곡밥", "김치찌개", "된장국", "미역국", "제육볶음", "돈까스", "고등어구이",
+    "계란말이", "시금치나물", "콩나물무침", "감자조림", "배추김치", "깍두기", "요구르트",
+]
+
+
+def build_week(monday: date) -> list:
+    menus = []
+    for offset in range(5):
+        for restaurant in Restaurant:
+            for meal_index, meal_type in enumerate(MealType):
+                items = [
+                    MenuItem(name=SAMPLE_ITEMS[(offset * 3 + meal_index + index) % len(SAMPLE_ITEMS)])
+                    for index in range(7)
+                ]
+                if restaurant == Restaurant.SEOUL_FOODCOURT:
+                    # 푸드코트는 가격이 있는 메뉴
+                    items = [MenuItem(name=item.name, price=5000 + index * 500) for index, item in enumerate(items)]
+                menus.append(Menu(
+                    date=monday + timedelta(days=offset),
+                    restaurant=restaurant,
+                    meal_type=meal_type,
+                    items=items,
+                ))
+    return menus
+
+
+def encode_json(payload: MenuResponse) -> bytes:
+    # starlette JSONResponse.render와 같은 설정
+    return json.dumps(
+        payload.model_dump(mode="json"),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def encode_msgpack(payload: MenuResponse) -> bytes:
+    fields = payload.model_dump(mode="json", exclude={"data"})
+    return encode_menu_payload(fields, "data", payload.data)
+
+
+def decode_json(content: bytes) -> list:
+    return [Menu(**item) for item in json.loads(content)["data"]]
+
+
+def decode_msgpack(content: bytes) -> list:
+    return decode_menu_payload(content, "data")[1]
+
+
+def measure(function, argument, rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        function(argument)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=300)
+    args = parser.parse_args()
+
+    if not MSGPACK_AVAILABLE:
+        print("msgpack is not installed (pip install msgpack)")
+        return
+
+    today = date.today()
+    monday = today - timedelta(days=today.weekday())
+    menus = build_week(monday)
+    payload = MenuResponse(success=True, data=menus, message=f"{monday} ~ {monday + timedelta(days=4)} 메뉴 {len(menus)}개")
+
+    json_body = encode_json(payload)
+    msgpack_body = encode_msgpack(payload)
+    assert decode_json(json_body) == decode_msgpack(msgpack_body), "decoded menus differ"
+
+    print(f"full week: {len(menus)} menus, {sum(len(menu.items) for menu in menus)} items")
+    rows = [
+        ("json", json_body, encode_json, json.loads, decode_json),
+        ("msgpack", msgpack_body, encode_msgpack, msgpack.unpackb, decode_msgpack),
+    ]
+    results = {}
+    for name, body, encode, parse, decode in rows:
+        results[name] = {
+            "bytes": len(body),
+            "gzip": len(gzip.compress(body)),
+            "encode": measure(encode, payload, args.rounds),
+            "parse": measure(parse, body, args.rounds),
+            "decode": measure(decode, body, args.rounds),
+        }
+        stats = results[name]
+        print(
+            f"{name:>8}: {stats['bytes']:7d} B | gzip {stats['gzip']:6d} B | "
+            f"encode {stats['encode'] * 1000:6.2f}ms | parse {stats['parse'] * 1000:6.2f}ms | "
+            f"decode {stats['decode'] * 1000:6.2f}ms"
+        )
+
+    json_stats, msgpack_stats = results["json"], results["msgpack"]
+    print(
+        f"{'ratio':>8}: size {msgpack_stats['bytes'] / json_stats['bytes']:.2f}x | "
+        f"gzip {msgpack_stats['gzip'] / json_stats['gzip']:.2f}x | "
+        f"encode {msgpack_stats['encode'] / json_stats['encode']:.2f}x | "
+        f"parse {msgpack_stats['parse'] / json_stats['parse']:.2f}x | "
+        f"decode {msgpack_stats['decode'] / json_stats['decode']:.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
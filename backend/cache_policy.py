@@ -0,0 +1,145 @@
+import json
+import logging
+from datetime import date, datetime, time, timedelta, timezone
+from email.utils import format_datetime
+from typing import Iterable, List, Optional, Set
+
+from fastapi import Response
+
+from models import Restaurant
+
+logger = logging.getLogger(__name__)
+
+# 모든 메뉴 응답에 붙는 키 (전체 무효화용)
+ALL_MENUS_KEY = "menus"
+
+
+def date_key(target_date: date) -> str:
+    return f"date-{target_date.isoformat()}"
+
+
+def week_key(target_date: date) -> str:
+    monday = target_date - timedelta(days=target_date.weekday())
+    return f"week-{monday.isoformat()}"
+
+
+def restaurant_key(restaurant) -> str:
+    # 헤더 값은 latin-1이어야 하므로 한글 값 대신 enum 이름을 사용
+    return f"restaurant-{Restaurant(restaurant).name.lower()}"
+
+
+def menu_surrogate_keys(target_date: date, restaurant) -> Set[str]:
+    """메뉴 하나가 바뀌었을 때 무효화해야 하는 키 (날짜, 주, 식당)"""
+    return {date_key(target_date), week_key(target_date), restaurant_key(restaurant)}
+
+
+def parse_update_times(value: str) -> List[time]:
+    """'06:30,10:00' 형식의 정기 갱신 시각 목록"""
+    times = []
+    for part in value.split(","):
+        part = part.strip()
+        if part:
+            times.append(time.fromisoformat(part))
+    return sorted(times)
+
+
+class CachePolicy:
+    """메뉴 응답의 Cache-Control/Expires와 surrogate key를 정하고, 바뀐 키를 purge 훅으로 알립니다.
+
+    만료 시각은 (응답한 날/주의 끝, 다음 정기 갱신 시각, 지금 + max_age) 중 가장 이른 시각입니다.
+    CDN(s-maxage)은 purge로 갱신을 받으므로 만료까지 캐시하고, purge할 수 없는 브라우저는
+    browser_max_age까지만 캐시합니다.
+    """
+
+    def __init__(
+        self,
+        update_times: Optional[List[time]] = None,
+        max_age: int = 3600,
+        browser_max_age: int = 300,
+        stale_while_revalidate: int = 60,
+        purge_url: str = "",
+        purge_token: str = "",
+    ):
+        self.update_times = update_times or []
+        self.max_age = max_age
+        self.browser_max_age = browser_max_age
+        self.stale_while_revalidate = stale_while_revalidate
+        self.purge_url = purge_url
+        self.purge_token = purge_token
+
+    def next_update(self, now: datetime) -> Optional[datetime]:
+        for update_time in self.update_times:
+            candidate = datetime.combine(now.date(), update_time)
+            if candidate > now:
+                return candidate
+        if self.update_times:
+            return datetime.combine(now.date() + timedelta(days=1), self.update_times[0])
+        return None
+
+    def expires_at(self, valid_until: Optional[datetime], now: Optional[datetime] = None) -> datetime:
+        now = now or datetime.now()
+        candidates = [now + timedelta(seconds=self.max_age)]
+        if valid_until is not None and valid_until > now:
+            candidates.append(valid_until)
+        next_update = self.next_update(now)
+        if next_update is not None:
+            candidates.append(next_update)
+        return min(candidates)
+
+    def apply(self, response: Response, valid_until: Optional[datetime], keys: Iterable[str]):
+        """응답에 캐시 헤더와 surrogate key를 설정합니다. valid_until은 응답 내용이 유효한 마지막 시각입니다."""
+        now = datetime.now()
+        expires = self.expires_at(valid_until, now)
+        ttl = max(int((expires - now).total_seconds()), 0)
+
+        response.headers["Cache-Control"] = (
+            f"public, max-age={min(ttl, self.browser_max_age)}, s-maxage={ttl}, "
+            f"stale-while-revalidate={self.stale_while_revalidate}"
+        )
+        response.headers["Expires"] = format_datetime(expires.astimezone(timezone.utc), usegmt=True)
+        self._set_keys(response, keys)
+
+    def apply_no_store(self, response: Response):
+        """메뉴가 아직 없는 응답(크롤링 대기 중)은 캐시하지 않습니다."""
+        response.headers["Cache-Control"] = "no-store"
+
+    def _set_keys(self, response: Response, keys: Iterable[str]):
+        ordered = sorted({ALL_MENUS_KEY, *keys})
+        # Fastly 등은 공백 구분 Surrogate-Key, Cloudflare/Netlify는 쉼표 구분 Cache-Tag를 사용
+        response.headers["Surrogate-Key"] = " ".join(ordered)
+        response.headers["Cache-Tag"] = ",".join(ordered)
+
+    def purge(self, keys: Iterable[str]) -> bool:
+        """purge_url로 {"keys": [...]}를 POST합니다. 설정되지 않았으면 아무것도 하지 않습니다."""
+        keys = sorted(set(keys))
+        if not self.purge_url or not keys:
+            return False
+
+        import requests
+
+        headers = {"Content-Type": "application/json"}
+        if self.purge_token:
+            headers["Authorization"] = f"Bearer {self.purge_token}"
+        try:
+            response = requests.post(
+                self.purge_url,
+                data=json.dumps({"keys": keys}),
+                headers=headers,
+                timeout=10,
+            )
+            response.raise_for_status()
+        except Exception as error:
+            logger.warning(f"Cache purge failed for {len(keys)} keys: {error}")
+            return False
+
+        logger.info(f"Cache purge requested: {' '.join(keys)}")
+        return True
+
+
+def end_of_day(target_date: date) -> datetime:
+    return datetime.combine(target_date + timedelta(days=1), time.min)
+
+
+def end_of_week(target_date: date) -> datetime:
+    monday = target_date - timedelta(days=target_date.weekday())
+    return datetime.combine(monday + timedelta(days=7), time.min)
@@ -0,0 +1,70 @@
+import logging
+import threading
+import time
+from datetime import date
+from typing import Callable, Dict, Iterable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationCoalescer:
+    """짧은 시간에 몰린 메뉴 갱신 알림을 모아 한 번에 보냅니다.
+
+    add()가 호출될 때마다 debounce초 뒤로 발송을 미루되, 첫 알림이 쌓인 뒤 max_delay초가 지나면
+    더 미루지 않고 보냅니다. 쌓인 내용은 주제 -> 바뀐 날짜 집합으로 합쳐져 flush 콜백에 전달됩니다.
+    debounce가 0이면 모으지 않고 바로 보냅니다.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[Dict[str, Set[date]]], None],
+        debounce: float = 30,
+        max_delay: float = 120,
+    ):
+        self._flush = flush
+        self.debounce = debounce
+        self.max_delay = max(max_delay, debounce)
+        self._pending: Dict[str, Set[date]] = {}
+        self._first_added_at: Optional[float] = None
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def add(self, topic_dates: Dict[str, Iterable[date]]):
+        if not topic_dates:
+            return
+        if self.debounce <= 0:
+            self._send({topic: set(dates) for topic, dates in topic_dates.items()})
+            return
+
+        with self._lock:
+            for topic, dates in topic_dates.items():
+                self._pending.setdefault(topic, set()).update(dates)
+
+            now = time.monotonic()
+            if self._first_added_at is None:
+                self._first_added_at = now
+            delay = min(self.debounce, self._first_added_at + self.max_delay - now)
+
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(max(delay, 0), self.flush_now)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush_now(self):
+        """쌓인 알림을 바로 보냅니다 (서버 종료 시에도 호출)."""
+        with self._lock:
+            pending = self._pending
+            self._pending = {}
+            self._first_added_at = None
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if pending:
+            self._send(pending)
+
+    def _send(self, pending: Dict[str, Set[date]]):
+        try:
+            self._flush(pending)
+        except Exception as error:
+            logger.warning(f"Coalesced notification failed: {error}")
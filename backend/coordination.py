@@ -0,0 +1,130 @@
+import json
+import logging
+import os
+from contextlib import contextmanager
+from datetime import date, timedelta
+from typing import Optional, Tuple
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def file_lock(path: str):
+    """프로세스 간 배타 락 (fcntl.flock)"""
+    if not FCNTL_AVAILABLE:
+        raise RuntimeError("File locking requires fcntl (POSIX only)")
+
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+def write_json_atomic(path: str, payload) -> None:
+    """임시 파일에 쓴 뒤 rename하여 읽는 쪽이 절반만 쓰인 파일을 보지 않도록 합니다."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump(payload, file, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def file_stamp(path: str) -> Optional[Tuple[int, int, int]]:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+class CrawlLeader:
+    """여러 워커 중 크롤링을 담당할 리더 하나를 파일 락으로 선출합니다.
+
+    리더는 락 파일을 프로세스가 살아 있는 동안 잡고 있으며, 리더가 죽으면
+    커널이 락을 풀어 주므로 다른 워커가 다음 시도에서 리더가 됩니다.
+    리더가 아닌 워커의 크롤링 요청은 요청 큐 파일에 쌓였다가 리더가 처리합니다.
+    """
+
+    def __init__(self, directory: str):
+        if not FCNTL_AVAILABLE:
+            raise RuntimeError("Shared store mode requires fcntl (POSIX only)")
+
+        os.makedirs(directory, exist_ok=True)
+        self.lock_path = os.path.join(directory, "leader.lock")
+        self.requests_path = os.path.join(directory, "crawl_requests.json")
+        self.requests_lock_path = os.path.join(directory, "crawl_requests.lock")
+        self._leader_fd: Optional[int] = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._leader_fd is not None
+
+    def try_acquire(self) -> bool:
+        if self._leader_fd is not None:
+            return True
+
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._leader_fd = fd
+        logger.info(f"Worker {os.getpid()} elected as crawl leader")
+        return True
+
+    def release(self):
+        if self._leader_fd is None:
+            return
+        fcntl.flock(self._leader_fd, fcntl.LOCK_UN)
+        os.close(self._leader_fd)
+        self._leader_fd = None
+
+    def request_crawl(self, target_date: date, notify: bool, replace: bool = False) -> bool:
+        """리더에게 크롤링을 요청합니다. 같은 주의 요청이 이미 있으면 추가하지 않고 notify/replace만 합칩니다."""
+        monday = target_date - timedelta(days=target_date.weekday())
+        with file_lock(self.requests_lock_path):
+            pending = self._read_requests()
+            for item in pending:
+                if item["week"] == monday.isoformat():
+                    item["notify"] = item["notify"] or notify
+                    item["replace"] = item.get("replace", False) or replace
+                    write_json_atomic(self.requests_path, pending)
+                    return False
+
+            pending.append({
+                "week": monday.isoformat(),
+                "date": target_date.isoformat(),
+                "notify": notify,
+                "replace": replace,
+            })
+            write_json_atomic(self.requests_path, pending)
+        return True
+
+    def pop_request(self) -> Optional[Tuple[date, bool, bool]]:
+        """가장 오래된 크롤링 요청 하나를 (기준 날짜, 알림 여부, 교체 여부)로 꺼냅니다."""
+        with file_lock(self.requests_lock_path):
+            pending = self._read_requests()
+            if not pending:
+                return None
+            item = pending.pop(0)
+            write_json_atomic(self.requests_path, pending)
+        return date.fromisoformat(item["date"]), bool(item["notify"]), bool(item.get("replace"))
+
+    def _read_requests(self) -> list:
+        try:
+            with open(self.requests_path, encoding="utf-8") as file:
+                return json.load(file)
+        except (FileNotFoundError, ValueError):
+            return []
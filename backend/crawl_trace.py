@@ -0,0 +1,162 @@
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+_local = threading.local()
+
+
+class CrawlTrace:
+    """크롤링 1회의 단계별 기록 (소스, HTTP 요청, 이미지, OCR 칸 단위 소요 시간과 결과)
+
+    span은 시작 순서대로 쌓이고 depth로 중첩 관계를 나타냅니다.
+    """
+
+    def __init__(self, target_date: date, notify: bool = False):
+        self.run_id = uuid.uuid4().hex[:12]
+        self.target_date = target_date
+        self.notify = notify
+        self.started_at = datetime.now()
+        self.duration_ms: Optional[float] = None
+        self.outcome = "running"
+        self.summary: dict = {}
+        self.spans: List[dict] = []
+        self._started = time.perf_counter()
+        self._depth = 0
+        self._open: List[dict] = []
+
+    def _elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self._started) * 1000, 1)
+
+    @contextmanager
+    def span(self, stage: str, name: str, **detail):
+        entry = {
+            "stage": stage,
+            "name": name,
+            "depth": self._depth,
+            "startMs": self._elapsed_ms(),
+            "durationMs": None,
+            "outcome": "ok",
+            **detail,
+        }
+        self.spans.append(entry)
+        self._open.append(entry)
+        self._depth += 1
+        try:
+            yield entry
+        except Exception as error:
+            entry["outcome"] = "error"
+            entry["error"] = f"{type(error).__name__}: {error}"[:300]
+            raise
+        finally:
+            self._depth -= 1
+            self._open.pop()
+            entry["durationMs"] = round(self._elapsed_ms() - entry["startMs"], 1)
+
+    def annotate(self, **detail):
+        """가장 안쪽의 열린 span에 정보를 덧붙입니다."""
+        if self._open:
+            self._open[-1].update(detail)
+
+    def merge(self, spans: List[dict]):
+        """다른 프로세스(크롤링 워커)에서 기록한 span을 현재 위치 아래에 붙입니다."""
+        offset = self._open[-1]["startMs"] if self._open else 0.0
+        for span in spans:
+            self.spans.append({**span, "depth": span["depth"] + self._depth, "startMs": round(span["startMs"] + offset, 1)})
+
+    def finish(self, outcome: str, **summary):
+        self.outcome = outcome
+        self.summary.update(summary)
+        self.duration_ms = self._elapsed_ms()
+
+    def stage_totals(self) -> Dict[str, float]:
+        """stage별 소요 시간 합계 (같은 stage가 중첩되면 바깥 span만 합산)"""
+        totals: Dict[str, float] = {}
+        ancestors: List[str] = []
+        for span in self.spans:
+            del ancestors[span["depth"]:]
+            if span["stage"] not in ancestors:
+                totals[span["stage"]] = round(totals.get(span["stage"], 0.0) + (span["durationMs"] or 0.0), 1)
+            ancestors.append(span["stage"])
+        return totals
+
+    def timeline(self) -> List[str]:
+        """실행 간 diff로 비교하기 쉬운 한 줄짜리 단계 목록"""
+        lines = [f"crawl {self.target_date.isoformat()} {self.outcome} {self.duration_ms}ms"]
+        for span in self.spans:
+            indent = "  " * (span["depth"] + 1)
+            outcome = span["outcome"] if "error" not in span else f"{span['outcome']} ({span['error']})"
+            lines.append(f"{indent}{span['stage']}:{span['name']} {outcome} {span['durationMs']}ms")
+        return lines
+
+    def to_summary(self) -> dict:
+        return {
+            "runId": self.run_id,
+            "targetDate": self.target_date.isoformat(),
+            "notify": self.notify,
+            "startedAt": self.started_at.isoformat(),
+            "durationMs": self.duration_ms,
+            "outcome": self.outcome,
+            "stageTotals": self.stage_totals(),
+            **self.summary,
+        }
+
+    def to_dict(self) -> dict:
+        return {**self.to_summary(), "spans": self.spans}
+
+
+class CrawlHistory:
+    """최근 max_runs개의 크롤링 기록을 보관하는 링 버퍼"""
+
+    def __init__(self, max_runs: int = 20):
+        self._runs: deque = deque(maxlen=max_runs)
+        self._lock = threading.Lock()
+
+    def add(self, trace: CrawlTrace):
+        with self._lock:
+            self._runs.append(trace)
+
+    def list(self) -> List[CrawlTrace]:
+        with self._lock:
+            return list(reversed(self._runs))
+
+    def get(self, run_id: str) -> Optional[CrawlTrace]:
+        with self._lock:
+            for trace in self._runs:
+                if trace.run_id == run_id:
+                    return trace
+        return None
+
+
+def start_trace(target_date: date, notify: bool = False) -> CrawlTrace:
+    trace = CrawlTrace(target_date, notify)
+    _local.trace = trace
+    return trace
+
+
+def end_trace():
+    _local.trace = None
+
+
+def current_trace() -> Optional[CrawlTrace]:
+    return getattr(_local, "trace", None)
+
+
+@contextmanager
+def trace_span(stage: str, name: str, **detail):
+    """현재 스레드에 진행 중인 크롤링 기록이 있으면 span을 남깁니다. 없으면 아무것도 하지 않습니다."""
+    trace = current_trace()
+    if trace is None:
+        yield dict(detail)
+        return
+    with trace.span(stage, name, **detail) as entry:
+        yield entry
+
+
+def trace_annotate(**detail):
+    trace = current_trace()
+    if trace is not None:
+        trace.annotate(**detail)
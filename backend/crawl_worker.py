@@ -0,0 +1,167 @@
+import logging
+import multiprocessing
+import threading
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
+from crawl_trace import current_trace, end_trace, start_trace
+from models import Menu
+
+logger = logging.getLogger(__name__)
+
+
+def _worker_main(conn, memory_limit_mb: int):
+    """크롤링 워커 프로세스 진입점. 작업을 하나씩 받아 결과를 돌려줍니다."""
+    logging.basicConfig(level=logging.INFO)
+
+    if memory_limit_mb and RESOURCE_AVAILABLE:
+        limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    # 무거운 크롤러/OCR 모듈은 워커 프로세스에서만 로드
+    from crawler import SMUCafeteriaCrawler
+
+    crawler = SMUCafeteriaCrawler()
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if job is None:
+            break
+
+        target_iso, sources = job
+        target_date = date.fromisoformat(target_iso)
+        # 워커에서 기록한 단계별 span은 결과와 함께 돌려보내 API 프로세스의 크롤링 기록에 붙임
+        trace = start_trace(target_date)
+        try:
+            results = crawler.crawl_sources(target_date, sources)
+            payload = {
+                source: {"menus": [menu.model_dump(mode="json") for menu in menus], "fallback": fallback}
+                for source, (menus, fallback) in results.items()
+            }
+            conn.send(("ok", payload, trace.spans))
+        except MemoryError:
+            conn.send(("error", f"memory limit exceeded ({memory_limit_mb}MB)", trace.spans))
+            break
+        except Exception as error:
+            conn.send(("error", str(error), trace.spans))
+        finally:
+            end_trace()
+
+
+class CrawlWorkerClient:
+    """크롤링/OCR을 별도 프로세스에서 실행하는 클라이언트
+
+    SMUCafeteriaCrawler와 같은 crawl_weekly_menu()/crawl_sources() 인터페이스를 제공하므로 API 프로세스는
+    GIL과 메모리를 크롤링과 나눠 쓰지 않습니다. 작업마다 제한 시간이 있으며, 시간 초과나
+    비정상 종료 시 워커를 다시 띄우고, 메모리 상한(RLIMIT_AS)을 워커에 적용합니다.
+    """
+
+    def __init__(self, job_timeout: float = 300, memory_limit_mb: int = 1024, max_jobs_per_worker: int = 50):
+        self.job_timeout = job_timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self._context = multiprocessing.get_context("spawn")
+        self._process: Optional[multiprocessing.Process] = None
+        self._conn = None
+        self._jobs_done = 0
+        self._lock = threading.Lock()
+
+    def crawl_weekly_menu(self, target_date: date) -> List[Menu]:
+        results = self.crawl_sources(target_date)
+        dedup = {}
+        for menus, _ in results.values():
+            for menu in menus:
+                dedup[(menu.date, menu.restaurant, menu.meal_type)] = menu
+        return list(dedup.values())
+
+    def crawl_sources(
+        self,
+        target_date: date,
+        sources: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Tuple[List[Menu], bool]]:
+        with self._lock:
+            self._ensure_started()
+            try:
+                self._conn.send((target_date.isoformat(), list(sources) if sources else None))
+                finished = self._conn.poll(self.job_timeout)
+                result = self._conn.recv() if finished else None
+            except (EOFError, OSError):
+                self._restart("crawl worker exited unexpectedly")
+                raise RuntimeError("Crawl worker crashed")
+
+            if result is None:
+                self._restart(f"crawl job timed out after {self.job_timeout}s")
+                raise TimeoutError(f"Crawl worker timed out after {self.job_timeout}s")
+
+            status, payload, spans = result
+            trace = current_trace()
+            if trace is not None:
+                trace.merge(spans)
+
+            self._jobs_done += 1
+            if not self._process.is_alive() or self._jobs_done >= self.max_jobs_per_worker:
+                self._stop_process()
+
+            if status != "ok":
+                raise RuntimeError(f"Crawl worker failed: {payload}")
+            return {
+                source: ([Menu(**item) for item in result["menus"]], result["fallback"])
+                for source, result in payload.items()
+            }
+
+    def stop(self):
+        with self._lock:
+            self._stop_process()
+
+    def _ensure_started(self):
+        if self._process is not None and self._process.is_alive():
+            return
+
+        self._stop_process()
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.memory_limit_mb),
+            name="smubab-crawl-worker",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+
+        self._process = process
+        self._conn = parent_conn
+        self._jobs_done = 0
+        logger.info(f"Crawl worker started (pid={process.pid})")
+
+    def _restart(self, reason: str):
+        logger.warning(f"Restarting crawl worker: {reason}")
+        self._stop_process(force=True)
+
+    def _stop_process(self, force: bool = False):
+        process, conn = self._process, self._conn
+        self._process = None
+        self._conn = None
+        if process is None:
+            return
+
+        if not force and process.is_alive():
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            process.join(timeout=5)
+
+        if process.is_alive():
+            process.kill()
+            process.join(timeout=5)
+
+        if conn is not None:
+            conn.close()
@@ -1,94 +1,157 @@
+import json
 import logging
 import os
 import re
 import time
-import base64
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import date
 from io import BytesIO
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urljoin
 
 import requests
 from bs4 import BeautifulSoup
 from PIL import Image, ImageOps, ImageFilter
 
-# Optional tesseract import
-try:
-    import pytesseract
-    TESSERACT_AVAILABLE = True
-except (ImportError, Exception):
-    TESSERACT_AVAILABLE = False
-
+from article_index import ArticleIndex
+from crawl_trace import trace_annotate, trace_span
+from http_policy import RETRYABLE_STATUS_CODES, HostPolicy
+from menu_filters import NOTICE_ITEMS, NOTICE_KEYWORDS
 from models import MealType, Menu, MenuItem, Restaurant
+from ocr_engine import create_ocr_engine
+from source_freshness import CRAWL_SOURCES, count_placeholders
 
 logger = logging.getLogger(__name__)
 
+# OCR 전처리/칸 분할/전략 설정 중 OCR_TUNING_PATH 파일(benchmarks/ocr_tuning.py --export)로 바꿀 수 있는 항목
+OCR_TUNING_KEYS = (
+    "ocr_autocontrast",
+    "ocr_sharpen",
+    "ocr_fixed_scale",
+    "target_text_height",
+    "min_ocr_scale",
+    "max_ocr_scale",
+    "ocr_crop",
+    "ocr_strategy",
+    "ocr_primary_psm",
+    "ocr_fallback_psm",
+    "ocr_min_confidence",
+    "ocr_min_quality_score",
+)
+OCR_STRATEGIES = ("adaptive", "both", "fast")
+
 
 class SMUCafeteriaCrawler:
     """상명대 식단 크롤러 (서울 텍스트 + 천안 교직원 이미지 OCR)"""
 
     def __init__(self):
-        self.seoul_menu_url = "https://www.smu.ac.kr/kor/life/restaurantView.do"
-        self.cheonan_faculty_board_url = "https://www.smu.ac.kr/kor/life/restaurantView3.do"
-        self.cheonan_student_board_url = "https://www.smu.ac.kr/kor/life/restaurantView4.do"
+        base_url = os.getenv("SMU_BASE_URL", "https://www.smu.ac.kr").rstrip("/")
+        self.seoul_menu_url = f"{base_url}/kor/life/restaurantView.do"
+        self.cheonan_faculty_board_url = f"{base_url}/kor/life/restaurantView3.do"
+        self.cheonan_student_board_url = f"{base_url}/kor/life/restaurantView4.do"
         self.headers = {
             "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36"
         }
         self.timeout = 20
         self.max_retries = 3
         self.retry_delay = 1.5
+        # 호스트별 적응형 타임아웃/지수 백오프/서킷 브레이커
+        self.http_policy = HostPolicy(
+            failure_threshold=int(os.getenv("HTTP_FAILURE_THRESHOLD", "3")),
+            reset_timeout=float(os.getenv("HTTP_CIRCUIT_RESET_SECONDS", "60")),
+            backoff_base=self.retry_delay,
+        )
+        # 느린 이미지 다운로드에 중복 요청(hedging)을 보낼지 여부와 기본 대기 시간
+        self.hedge_image_requests = os.getenv("HTTP_HEDGE_IMAGES", "0") == "1"
+        self.hedge_delay = float(os.getenv("HTTP_HEDGE_DELAY_SECONDS", "2"))
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        # 로컬 OCR 엔진 (tesserocr는 언어 모델을 한 번만 로드, pytesseract는 호출마다 프로세스 실행)
+        self.ocr_engine = create_ocr_engine(
+            os.getenv("OCR_ENGINE", "auto"),
+            pool_size=int(os.getenv("OCR_ENGINE_POOL_SIZE", "1")),
+        )
         self.ocr_space_api_key = os.getenv("OCR_SPACE_API_KEY", "")
+        self.ocr_space_api_url = os.getenv("OCR_SPACE_API_URL", "https://api.ocr.space/parse/image")
+        self.ocr_space_max_upload_bytes = int(os.getenv("OCR_SPACE_MAX_UPLOAD_BYTES", str(1024 * 1024)))
+        self._ocr_api_session: Optional[requests.Session] = None
+        # 천안 게시판 주차별 게시글 캐시 (ARTICLE_INDEX_PATH 지정 시 파일로 유지)
+        self.article_index = ArticleIndex(os.getenv("ARTICLE_INDEX_PATH") or None)
+        # 이미지 다운로드/디코딩 한도
+        self.max_image_bytes = int(os.getenv("OCR_MAX_IMAGE_BYTES", str(15 * 1024 * 1024)))
+        self.decode_max_side = int(os.getenv("OCR_DECODE_MAX_SIDE", "2400"))
+        # OCR 전처리: 대비 자동 보정, 선명하게, 확대 배율(ocr_fixed_scale이 없으면 글자 높이로 결정)
+        self.ocr_autocontrast = True
+        self.ocr_sharpen = True
+        self.ocr_fixed_scale: Optional[float] = None
+        # OCR 입력에서 목표로 하는 글자 높이(px)와 확대 배율 범위
+        self.target_text_height = int(os.getenv("OCR_TARGET_TEXT_HEIGHT", "32"))
+        self.min_ocr_scale = 0.5
+        self.max_ocr_scale = 3.0
+        # 식단표 본문 영역 (왼쪽, 위, 오른쪽, 아래 비율). 이 영역을 요일 5칸으로 나눔
+        self.ocr_crop = (0.18, 0.18, 0.98, 0.82)
+        # OCR 전략: adaptive(첫 psm 결과가 충분하면 두 번째 psm 생략) | both(항상 두 번) | fast(첫 psm만)
+        self.ocr_strategy = os.getenv("OCR_STRATEGY", "adaptive")
+        self.ocr_primary_psm = 6
+        self.ocr_fallback_psm = 4
+        self.ocr_min_confidence = float(os.getenv("OCR_MIN_CONFIDENCE", "70"))
+        self.ocr_min_quality_score = int(os.getenv("OCR_MIN_QUALITY_SCORE", "20"))
+        self.last_ocr_column_stats: List[dict] = []
+        tuning_path = os.getenv("OCR_TUNING_PATH", "")
+        if tuning_path:
+            self.load_ocr_tuning(tuning_path)
+
+    def ocr_tuning(self) -> dict:
+        """현재 OCR 설정 (apply_ocr_tuning/OCR_TUNING_PATH 형식)"""
+        tuning = {key: getattr(self, key) for key in OCR_TUNING_KEYS}
+        tuning["ocr_crop"] = list(self.ocr_crop)
+        return tuning
+
+    def apply_ocr_tuning(self, tuning: dict):
+        """OCR 설정을 바꿉니다. 모르는 항목이나 잘못된 값이 있으면 아무것도 바꾸지 않고 ValueError를 발생시킵니다."""
+        unknown = set(tuning) - set(OCR_TUNING_KEYS)
+        if unknown:
+            raise ValueError(f"Unknown OCR tuning keys: {', '.join(sorted(unknown))}")
+
+        merged = {**self.ocr_tuning(), **tuning}
+        crop = tuple(float(value) for value in merged["ocr_crop"])
+        if len(crop) != 4 or not (0 <= crop[0] < crop[2] <= 1 and 0 <= crop[1] < crop[3] <= 1):
+            raise ValueError(f"Invalid OCR crop: {merged['ocr_crop']}")
+        if merged["ocr_strategy"] not in OCR_STRATEGIES:
+            raise ValueError(f"Unknown OCR strategy: {merged['ocr_strategy']}")
+
+        fixed_scale = merged["ocr_fixed_scale"]
+        self.ocr_autocontrast = bool(merged["ocr_autocontrast"])
+        self.ocr_sharpen = bool(merged["ocr_sharpen"])
+        self.ocr_fixed_scale = float(fixed_scale) if fixed_scale else None
+        self.target_text_height = int(merged["target_text_height"])
+        self.min_ocr_scale = float(merged["min_ocr_scale"])
+        self.max_ocr_scale = float(merged["max_ocr_scale"])
+        self.ocr_crop = crop
+        self.ocr_strategy = merged["ocr_strategy"]
+        self.ocr_primary_psm = int(merged["ocr_primary_psm"])
+        self.ocr_fallback_psm = int(merged["ocr_fallback_psm"])
+        self.ocr_min_confidence = float(merged["ocr_min_confidence"])
+        self.ocr_min_quality_score = int(merged["ocr_min_quality_score"])
+
+    def load_ocr_tuning(self, path: str) -> bool:
+        """ocr_tuning.py --export로 만든 파일({"config": {...}, ...} 또는 설정만)을 읽어 적용합니다."""
+        try:
+            with open(path, encoding="utf-8") as file:
+                data = json.load(file)
+            self.apply_ocr_tuning(data.get("config", data))
+        except (OSError, ValueError, TypeError, KeyError) as error:
+            logger.warning(f"OCR tuning not loaded from {path}: {error}")
+            return False
+        logger.info(f"OCR tuning loaded from {path}")
+        return True
 
     def crawl_daily_menu(self, target_date: date) -> List[Menu]:
         weekly_menus = self.crawl_weekly_menu(target_date)
         return [menu for menu in weekly_menus if menu.date == target_date]
 
     def crawl_weekly_menu(self, target_date: date) -> List[Menu]:
-        breakfast = self._crawl_by_category(target_date, MealType.BREAKFAST)
-        lunch = self._crawl_by_category(target_date, MealType.LUNCH)
-        try:
-            cheonan_faculty_lunch = self._crawl_cheonan_faculty_lunch(target_date)
-        except Exception as error:
-            logger.warning(f"Cheonan faculty crawl failed, fallback used: {error}")
-            weekday = target_date.weekday()
-            monday = target_date.fromordinal(target_date.toordinal() - weekday)
-            cheonan_faculty_lunch = [
-                Menu(
-                    date=monday.fromordinal(monday.toordinal() + i),
-                    restaurant=Restaurant.CHEONAN_FACULTY,
-                    meal_type=MealType.LUNCH,
-                    items=[MenuItem(name="중식정보없음", price=None)],
-                )
-                for i in range(5)
-            ]
-
-        try:
-            cheonan_student_menus = self._crawl_cheonan_student_menus(target_date)
-        except Exception as error:
-            logger.warning(f"Cheonan student crawl failed, fallback used: {error}")
-            weekday = target_date.weekday()
-            monday = target_date.fromordinal(target_date.toordinal() - weekday)
-            cheonan_student_menus = []
-            for i in range(5):
-                menu_date = monday.fromordinal(monday.toordinal() + i)
-                cheonan_student_menus.append(
-                    Menu(
-                        date=menu_date,
-                        restaurant=Restaurant.CHEONAN_STUDENT,
-                        meal_type=MealType.BREAKFAST,
-                        items=[MenuItem(name="조식정보없음", price=None)],
-                    )
-                )
-                cheonan_student_menus.append(
-                    Menu(
-                        date=menu_date,
-                        restaurant=Restaurant.CHEONAN_STUDENT,
-                        meal_type=MealType.LUNCH,
-                        items=[MenuItem(name="중식정보없음", price=None)],
-                    )
-                )
-
-        all_menus = breakfast + lunch + cheonan_faculty_lunch + cheonan_student_menus
+        results = self.crawl_sources(target_date)
+        all_menus = [menu for menus, _ in results.values() for menu in menus]
 
         # 날짜+식당+식사유형 중복 제거
         dedup = {}
@@ -97,6 +160,74 @@ class SMUCafeteriaCrawler:
 
         return list(dedup.values())
 
+    def crawl_sources(
+        self,
+        target_date: date,
+        sources: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Tuple[List[Menu], bool]]:
+        """소스별로 크롤링합니다. 소스 -> (메뉴 목록, '정보없음' 대체 메뉴를 사용했는지)를 반환합니다.
+
+        sources를 주면 그 소스만 크롤링합니다 (기본은 CRAWL_SOURCES 전체).
+        """
+        results: Dict[str, Tuple[List[Menu], bool]] = {}
+        for source in sources or CRAWL_SOURCES:
+            if source == "seoul_breakfast":
+                with trace_span("source", source) as span:
+                    menus = self._crawl_by_category(target_date, MealType.BREAKFAST)
+                    span.update(self._menu_trace_detail(menus))
+                results[source] = (menus, False)
+            elif source == "seoul_lunch":
+                with trace_span("source", source) as span:
+                    menus = self._crawl_by_category(target_date, MealType.LUNCH)
+                    span.update(self._menu_trace_detail(menus))
+                results[source] = (menus, False)
+            elif source == "cheonan_faculty":
+                try:
+                    with trace_span("source", source) as span:
+                        menus = self._crawl_cheonan_faculty_lunch(target_date)
+                        span.update(self._menu_trace_detail(menus))
+                    results[source] = (menus, False)
+                except Exception as error:
+                    logger.warning(f"Cheonan faculty crawl failed, fallback used: {error}")
+                    results[source] = (self._cheonan_fallback_menus(target_date, Restaurant.CHEONAN_FACULTY, [MealType.LUNCH]), True)
+            elif source == "cheonan_student":
+                try:
+                    with trace_span("source", source) as span:
+                        menus = self._crawl_cheonan_student_menus(target_date)
+                        span.update(self._menu_trace_detail(menus))
+                    results[source] = (menus, False)
+                except Exception as error:
+                    logger.warning(f"Cheonan student crawl failed, fallback used: {error}")
+                    results[source] = (
+                        self._cheonan_fallback_menus(
+                            target_date, Restaurant.CHEONAN_STUDENT, [MealType.BREAKFAST, MealType.LUNCH]
+                        ),
+                        True,
+                    )
+            else:
+                raise ValueError(f"Unknown crawl source: {source}")
+        return results
+
+    def _cheonan_fallback_menus(self, target_date: date, restaurant: Restaurant, meal_types: List[MealType]) -> List[Menu]:
+        """천안 게시판을 읽지 못했을 때 쓰는 평일 '정보없음' 메뉴"""
+        weekday = target_date.weekday()
+        monday = target_date.fromordinal(target_date.toordinal() - weekday)
+        placeholder = {MealType.BREAKFAST: "조식정보없음", MealType.LUNCH: "중식정보없음"}
+        return [
+            Menu(
+                date=monday.fromordinal(monday.toordinal() + i),
+                restaurant=restaurant,
+                meal_type=meal_type,
+                items=[MenuItem(name=placeholder[meal_type], price=None)],
+            )
+            for i in range(5)
+            for meal_type in meal_types
+        ]
+
+    def _menu_trace_detail(self, menus: List[Menu]) -> dict:
+        """크롤링 기록용 요약: 메뉴 수와 '정보없음' 대체 메뉴 수"""
+        return {"menus": len(menus), "placeholders": count_placeholders(menus)}
+
     def _crawl_by_category(self, target_date: date, meal_type: MealType) -> List[Menu]:
         category_value = "B" if meal_type == MealType.BREAKFAST else "L"
         params = {
@@ -211,23 +342,16 @@ class SMUCafeteriaCrawler:
         return items
 
     def _crawl_cheonan_faculty_lunch(self, target_date: date) -> List[Menu]:
-        article_url = self._find_cheonan_faculty_article_url(target_date)
-        if not article_url:
-            return []
-
-        response = self._get_with_retry(article_url)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        title_text = self._extract_article_title(soup)
-        week_dates = self._extract_week_dates_from_title(title_text, target_date)
-
-        image_urls = self._extract_article_image_urls(soup, article_url)
-        if not image_urls:
-            logger.warning("천안 교직원식당 게시글에서 메뉴 이미지를 찾지 못했습니다.")
+        article = self._load_cheonan_article(
+            "cheonan_faculty",
+            target_date,
+            self._find_cheonan_faculty_article_url,
+            "천안 교직원식당 게시글에서 메뉴 이미지를 찾지 못했습니다.",
+        )
+        if not article:
             return []
 
-        weekly_menu_texts = self._extract_weekly_menu_texts_from_images(image_urls)
+        week_dates, weekly_menu_texts = article
         if not weekly_menu_texts:
             return []
 
@@ -254,23 +378,16 @@ class SMUCafeteriaCrawler:
         return menus
 
     def _crawl_cheonan_student_menus(self, target_date: date) -> List[Menu]:
-        article_url = self._find_cheonan_student_article_url(target_date)
-        if not article_url:
-            return []
-
-        response = self._get_with_retry(article_url)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        title_text = self._extract_article_title(soup)
-        week_dates = self._extract_week_dates_from_title(title_text, target_date)
-
-        image_urls = self._extract_article_image_urls(soup, article_url)
-        if not image_urls:
-            logger.warning("천안 학생식당 게시글에서 메뉴 이미지를 찾지 못했습니다.")
+        article = self._load_cheonan_article(
+            "cheonan_student",
+            target_date,
+            self._find_cheonan_student_article_url,
+            "천안 학생식당 게시글에서 메뉴 이미지를 찾지 못했습니다.",
+        )
+        if not article:
             return []
 
-        weekly_day_texts = self._extract_weekly_menu_texts_from_images(image_urls)
+        week_dates, weekly_day_texts = article
         if not weekly_day_texts:
             return []
 
@@ -304,6 +421,76 @@ class SMUCafeteriaCrawler:
         logger.info(f"Cheonan student OCR menus parsed: {len(menus)}")
         return menus
 
+    def _load_cheonan_article(
+        self,
+        source: str,
+        target_date: date,
+        find_article_url,
+        missing_images_message: str,
+    ) -> Optional[tuple[List[date], List[List[str]]]]:
+        """이번 주 게시글의 날짜와 요일별 OCR 결과를 반환합니다.
+
+        이미 찾은 주차는 게시판 목록을 건너뛰고, 게시글은 ETag/Last-Modified로 조건부 요청합니다.
+        게시글이 그대로(304)이거나 이미지 URL이 같으면 이미지를 다시 받지 않고 저장된 OCR 결과를 씁니다.
+        """
+        monday = target_date.fromordinal(target_date.toordinal() - target_date.weekday())
+        cached = self.article_index.get(source, monday)
+
+        if cached:
+            article_url = cached["articleUrl"]
+        else:
+            with trace_span("board", source):
+                article_url = find_article_url(target_date)
+        if not article_url:
+            return None
+
+        conditional_headers = {}
+        if cached and cached.get("dayTexts"):
+            if cached.get("etag"):
+                conditional_headers["If-None-Match"] = cached["etag"]
+            if cached.get("lastModified"):
+                conditional_headers["If-Modified-Since"] = cached["lastModified"]
+
+        response = self._get_with_retry(article_url, headers=conditional_headers or None)
+        if response.status_code == 304 and cached:
+            logger.info(f"{source} article not modified, reusing cached OCR: {article_url}")
+            trace_annotate(articleCache="not_modified")
+            return [date.fromisoformat(item) for item in cached["weekDates"]], cached["dayTexts"]
+
+        response.raise_for_status()
+        soup = BeautifulSoup(response.text, "html.parser")
+
+        title_text = self._extract_article_title(soup)
+        week_dates = self._extract_week_dates_from_title(title_text, target_date)
+
+        image_urls = self._extract_article_image_urls(soup, article_url)
+        if not image_urls:
+            logger.warning(missing_images_message)
+            return None
+
+        if cached and cached.get("dayTexts") and cached.get("imageUrls") == image_urls:
+            logger.info(f"{source} article images unchanged, reusing cached OCR: {article_url}")
+            trace_annotate(articleCache="images_unchanged")
+            day_texts = cached["dayTexts"]
+        else:
+            trace_annotate(articleCache="miss", images=len(image_urls))
+            day_texts = self._extract_weekly_menu_texts_from_images(image_urls)
+
+        # 다른 주의 게시글로 대체된 경우나 OCR이 실패한 결과는 저장하지 않음
+        degraded = not day_texts or any(not items or items == ["중식정보없음"] for items in day_texts)
+        if week_dates and week_dates[0] == monday:
+            self.article_index.put(source, monday, {
+                "articleUrl": article_url,
+                "title": title_text,
+                "weekDates": [item.isoformat() for item in week_dates],
+                "imageUrls": image_urls,
+                "etag": response.headers.get("ETag"),
+                "lastModified": response.headers.get("Last-Modified"),
+                "dayTexts": None if degraded else day_texts,
+            })
+
+        return week_dates, day_texts
+
     def _find_cheonan_faculty_article_url(self, target_date: date) -> Optional[str]:
         response = self._get_with_retry(self.cheonan_faculty_board_url)
         response.raise_for_status()
@@ -445,112 +632,359 @@ class SMUCafeteriaCrawler:
 
         for image_url in image_urls:
             try:
-                response = self._get_with_retry(image_url, timeout=40)
-                response.raise_for_status()
-                image = Image.open(BytesIO(response.content)).convert("L")
-
-                day_texts = self._extract_day_columns_from_image(image)
-                for idx in range(5):
-                    merged[idx].extend(day_texts[idx])
+                with trace_span("image", image_url) as span:
+                    # ru_maxrss는 프로세스 전체의 최댓값이라 이미지별로 나눌 수 없으므로 현재 RSS의 증가분을 기록
+                    baseline_rss = self._current_rss_mb()
+                    buffer = self._download_image(image_url)
+                    downloaded_bytes = buffer.getbuffer().nbytes
+                    with trace_span("decode", "image", bytes=downloaded_bytes) as decode_span:
+                        image = self._decode_image(buffer)
+                        decode_span["size"] = f"{image.width}x{image.height}"
+                    decoded_rss = self._current_rss_mb()
+                    buffer.close()
+
+                    day_texts = self._extract_day_columns_from_image(image)
+                    for idx in range(5):
+                        merged[idx].extend(day_texts[idx])
+                    span["emptyDays"] = sum(1 for items in day_texts if not items or items == ["중식정보없음"])
+
+                rss_delta = (
+                    f"{decoded_rss - baseline_rss:+.1f}MB"
+                    if decoded_rss is not None and baseline_rss is not None else "n/a"
+                )
+                logger.info(
+                    f"Cheonan image OCR done: {image_url} "
+                    f"(bytes={downloaded_bytes}, decoded={image.width}x{image.height}, rss_after_decode={rss_delta})"
+                )
             except Exception as error:
                 logger.warning(f"Cheonan faculty image OCR failed: {image_url} ({error})")
 
         return [self._deduplicate_items(items) for items in merged]
 
-    def _ocr_with_api(self, image: Image.Image) -> str:
-        """OCR.space API를 사용한 OCR"""
-        if not self.ocr_space_api_key:
-            return ""
-        
+    def _download_image(self, image_url: str) -> BytesIO:
+        """이미지를 스트리밍으로 받아 max_image_bytes를 넘지 않는 버퍼에 담습니다."""
+        response = self._get_with_retry(
+            image_url, timeout=40, stream=True, hedge=self.hedge_image_requests, route="image"
+        )
+        try:
+            response.raise_for_status()
+            content_length = response.headers.get("Content-Length")
+            if content_length and content_length.isdigit() and int(content_length) > self.max_image_bytes:
+                raise ValueError(f"image too large ({content_length} bytes)")
+
+            buffer = BytesIO()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                buffer.write(chunk)
+                if buffer.tell() > self.max_image_bytes:
+                    raise ValueError(f"image exceeds {self.max_image_bytes} bytes")
+            buffer.seek(0)
+            return buffer
+        finally:
+            response.close()
+
+    def _decode_image(self, buffer: BytesIO) -> Image.Image:
+        """전체 해상도로 풀지 않고 decode_max_side 이하의 그레이스케일로 바로 디코딩합니다."""
+        image = Image.open(buffer)
+        # 최종 크기는 원본 기준으로 한 번만 정함 (draft 후 다시 나누면 상한보다 훨씬 작아짐)
+        scale = self.decode_max_side / max(image.size)
+        target = None
+        if scale < 1:
+            target = (max(int(image.width * scale), 1), max(int(image.height * scale), 1))
+            # JPEG는 DCT 단계에서 1/2, 1/4, 1/8로 축소 디코딩 (target 이상 크기 유지)
+            image.draft("L", target)
+
+        if image.mode not in ("L", "RGB", "RGBA"):
+            image = image.convert("L")
+
+        if target is not None and image.size != target:
+            image = image.resize(target, Image.Resampling.BOX)
+
+        if image.mode != "L":
+            return image.convert("L")
+        # 호출부에서 버퍼를 바로 닫으므로 지연 로딩된 픽셀을 지금 읽어 둠
+        image.load()
+        return image
+
+    def _crop_box(self, width: int, height: int) -> tuple[int, int, int, int]:
+        crop_left, crop_top, crop_right, crop_bottom = self.ocr_crop
+        return int(width * crop_left), int(height * crop_top), int(width * crop_right), int(height * crop_bottom)
+
+    def _estimate_text_height(self, image: Image.Image) -> Optional[float]:
+        """본문 영역의 가로 투영으로 글자 줄 높이(px)의 중앙값을 추정합니다."""
+        left, top, right, bottom = self._crop_box(*image.size)
+        if right - left < 5 or bottom - top < 5:
+            return None
+
+        column_width = (right - left) // 5
+        run_lengths: List[int] = []
+        for idx in range(5):
+            strip = image.crop((left + idx * column_width, top, left + (idx + 1) * column_width, bottom))
+            ink = strip.point(lambda value: 255 if value < 128 else 0)
+            profile = list(ink.resize((1, ink.height), Image.BOX).getdata())
+
+            run = 0
+            for value in profile + [0]:
+                if value > 10:
+                    run += 1
+                    continue
+                if run >= 3:
+                    run_lengths.append(run)
+                run = 0
+
+        if not run_lengths:
+            return None
+        run_lengths.sort()
+        return float(run_lengths[len(run_lengths) // 2])
+
+    def _choose_ocr_scale(self, image: Image.Image) -> float:
+        text_height = self._estimate_text_height(image)
+        if not text_height:
+            return 2.0
+        scale = self.target_text_height / text_height
+        return min(max(scale, self.min_ocr_scale), self.max_ocr_scale)
+
+    def _current_rss_mb(self) -> Optional[float]:
+        """현재 RSS(MB). /proc이 없는 플랫폼에서는 None"""
         try:
-            # 이미지를 base64로 변환
+            with open("/proc/self/statm") as file:
+                resident_pages = int(file.read().split()[1])
+        except (OSError, ValueError, IndexError):
+            return None
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+    def _encode_for_api(self, image: Image.Image) -> Tuple[bytes, float]:
+        """OCR.space 업로드용 그레이스케일 JPEG로 인코딩합니다 (업로드 한도를 넘으면 품질/크기를 낮춤).
+
+        인코딩한 바이트와 원본 대비 축소 배율(업로드 이미지 너비 / 원본 너비)을 반환합니다.
+        """
+        encoded = image if image.mode == "L" else image.convert("L")
+        quality = 85
+        while True:
             buffer = BytesIO()
-            image.save(buffer, format="PNG")
-            img_base64 = base64.b64encode(buffer.getvalue()).decode()
-            
-            # OCR.space API 호출
-            response = requests.post(
-                "https://api.ocr.space/parse/image",
+            encoded.save(buffer, format="JPEG", quality=quality, optimize=True)
+            if buffer.tell() <= self.ocr_space_max_upload_bytes or encoded.width < 400:
+                return buffer.getvalue(), encoded.width / image.width
+            if quality > 55:
+                quality -= 15
+            else:
+                encoded = encoded.resize((int(encoded.width * 0.75), int(encoded.height * 0.75)))
+
+    def _ocr_overlay_with_api(self, image: Image.Image) -> List[dict]:
+        """OCR.space API에 이미지를 한 번 업로드하고 줄 단위 단어 좌표(TextOverlay.Lines)를 반환합니다.
+
+        업로드 때 이미지를 줄였으면 좌표를 원래 image 기준으로 되돌려 반환합니다.
+        """
+        if not self.ocr_space_api_key:
+            return []
+
+        if self._ocr_api_session is None:
+            self._ocr_api_session = requests.Session()
+
+        try:
+            payload, upload_scale = self._encode_for_api(image)
+            response = self._ocr_api_session.post(
+                self.ocr_space_api_url,
                 data={
                     "apikey": self.ocr_space_api_key,
-                    "base64Image": f"data:image/png;base64,{img_base64}",
                     "language": "kor",
-                    "isOverlayRequired": False,
-                    "detectOrientation": True,
+                    "isOverlayRequired": True,
+                    "detectOrientation": False,
                     "scale": True,
                     "OCREngine": 2,
+                    "filetype": "JPG",
                 },
-                timeout=30,
+                files={"file": ("menu.jpg", payload, "image/jpeg")},
+                timeout=60,
             )
-            
+
             result = response.json()
             if result.get("IsErroredOnProcessing"):
                 logger.warning(f"OCR.space API error: {result.get('ErrorMessage')}")
-                return ""
-            
-            parsed_results = result.get("ParsedResults", [])
-            if parsed_results:
-                return parsed_results[0].get("ParsedText", "")
-            
-            return ""
+                return []
+
+            parsed_results = result.get("ParsedResults") or []
+            if not parsed_results:
+                return []
+            overlay = parsed_results[0].get("TextOverlay") or {}
+            return self._scale_overlay(overlay.get("Lines") or [], 1 / upload_scale)
         except Exception as error:
             logger.warning(f"OCR.space API failed: {error}")
-            return ""
+            return []
+
+    def _scale_overlay(self, lines: List[dict], factor: float) -> List[dict]:
+        """TextOverlay 줄/단어 좌표에 factor를 곱합니다."""
+        if abs(factor - 1.0) < 1e-6:
+            return lines
+
+        scaled_lines = []
+        for line in lines:
+            scaled_line = dict(line)
+            if "MinTop" in line:
+                scaled_line["MinTop"] = float(line["MinTop"]) * factor
+            if "MaxHeight" in line:
+                scaled_line["MaxHeight"] = float(line["MaxHeight"]) * factor
+            scaled_line["Words"] = [
+                {
+                    **word,
+                    **{
+                        key: float(word[key]) * factor
+                        for key in ("Left", "Top", "Width", "Height")
+                        if key in word
+                    },
+                }
+                for word in line.get("Words") or []
+            ]
+            scaled_lines.append(scaled_line)
+        return scaled_lines
+
+    def _assign_overlay_to_columns(self, lines: List[dict], column_edges: List[int]) -> List[str]:
+        """단어 중심의 x 좌표로 요일 칸을 정하고, 칸별로 위에서 아래 순서의 텍스트를 만듭니다."""
+        column_lines: List[List[tuple]] = [[] for _ in range(len(column_edges) - 1)]
+        for line in lines:
+            words_by_column: dict = {}
+            for word in line.get("Words") or []:
+                text = (word.get("WordText") or "").strip()
+                if not text:
+                    continue
+                center_x = float(word.get("Left", 0)) + float(word.get("Width", 0)) / 2
+                column = 0
+                while column < len(column_edges) - 2 and center_x >= column_edges[column + 1]:
+                    column += 1
+                words_by_column.setdefault(column, []).append((float(word.get("Left", 0)), text))
+
+            top = float(line.get("MinTop", 0))
+            for column, words in words_by_column.items():
+                words.sort()
+                column_lines[column].append((top, " ".join(text for _, text in words)))
+
+        return ["\n".join(text for _, text in sorted(entries)) for entries in column_lines]
+
+    def _extract_day_columns_with_api(self, image: Image.Image) -> List[List[str]]:
+        """OCR.space API: 본문 영역을 한 번만 업로드하고 단어 좌표로 요일 칸을 나눕니다.
+
+        tesseract용 확대/선명화는 업로드 크기만 키우므로 원본 해상도의 본문을 그대로 보냅니다.
+        """
+        processed = ImageOps.autocontrast(image) if self.ocr_autocontrast else image
+        left, top, right, bottom = self._crop_box(*processed.size)
+        body = processed.crop((left, top, right, bottom))
+
+        columns = 5
+        column_width = max(body.width // columns, 1)
+        column_edges = [idx * column_width for idx in range(columns)] + [body.width]
+        with trace_span("ocr", "ocr_space") as span:
+            lines = self._ocr_overlay_with_api(body)
+            span["lines"] = len(lines)
+            if not lines:
+                span["outcome"] = "empty"
+
+        day_items: List[List[str]] = []
+        for text_api in self._assign_overlay_to_columns(lines, column_edges):
+            parsed_api = self._parse_menu_lines_from_ocr(text_api)
+            day_items.append(self._finalize_day_items(parsed_api, [text_api]))
+        return day_items
 
     def _extract_day_columns_from_image(self, image: Image.Image) -> List[List[str]]:
-        if not TESSERACT_AVAILABLE and not self.ocr_space_api_key:
+        if self.ocr_engine is None and not self.ocr_space_api_key:
             logger.warning("No OCR method available (tesseract or API key)")
+            with trace_span("ocr", "unavailable") as span:
+                span["outcome"] = "skipped"
             return [["중식정보없음"] for _ in range(5)]
-        
-        processed = ImageOps.autocontrast(image)
-        processed = processed.resize((processed.width * 2, processed.height * 2))
-        processed = processed.filter(ImageFilter.SHARPEN)
 
-        width, height = processed.size
-        left = int(width * 0.18)
-        right = int(width * 0.98)
-        top = int(height * 0.18)
-        bottom = int(height * 0.82)
+        if self.ocr_engine is None:
+            return self._extract_day_columns_with_api(image)
+
+        with trace_span("preprocess", "image") as span:
+            processed = ImageOps.autocontrast(image) if self.ocr_autocontrast else image
+            scale = self.ocr_fixed_scale or self._choose_ocr_scale(processed)
+            if abs(scale - 1.0) > 0.05:
+                processed = processed.resize((max(int(processed.width * scale), 1), max(int(processed.height * scale), 1)))
+            if self.ocr_sharpen:
+                processed = processed.filter(ImageFilter.SHARPEN)
+            span["scale"] = round(scale, 2)
+
+        left, top, right, bottom = self._crop_box(*processed.size)
 
         columns = 5
         column_width = max((right - left) // columns, 1)
         day_items: List[List[str]] = [[] for _ in range(columns)]
+        column_stats: List[dict] = []
 
         for idx in range(columns):
             crop_left = left + idx * column_width
             crop_right = right if idx == columns - 1 else left + (idx + 1) * column_width
             crop = processed.crop((crop_left, top, crop_right, bottom))
 
-            if TESSERACT_AVAILABLE:
-                # Use local tesseract
-                text_psm6 = pytesseract.image_to_string(crop, lang="kor+eng", config="--oem 3 --psm 6")
-                text_psm4 = pytesseract.image_to_string(crop, lang="kor+eng", config="--oem 3 --psm 4")
-                parsed6 = self._parse_menu_lines_from_ocr(text_psm6)
-                parsed4 = self._parse_menu_lines_from_ocr(text_psm4)
-                parsed = parsed4 if self._ocr_quality_score(parsed4) > self._ocr_quality_score(parsed6) else parsed6
-                day_items[idx] = self._finalize_day_items(parsed, [text_psm6, text_psm4])
-            else:
-                # Use OCR.space API
-                text_api = self._ocr_with_api(crop)
-                parsed_api = self._parse_menu_lines_from_ocr(text_api)
-                day_items[idx] = self._finalize_day_items(parsed_api, [text_api])
+            # Use local tesseract
+            with trace_span("ocr", f"column{idx}") as span:
+                parsed, raw_texts, stats = self._ocr_column_adaptive(crop)
+                stats["column"] = idx
+                column_stats.append(stats)
+                day_items[idx] = self._finalize_day_items(parsed, raw_texts)
+                span.update(stats)
+                if day_items[idx] == ["중식정보없음"]:
+                    span["outcome"] = "empty"
+
+        self.last_ocr_column_stats = column_stats
+        if column_stats:
+            second_passes = sum(1 for stats in column_stats if stats["passes"] > 1)
+            winners = ", ".join(stats["strategy"] for stats in column_stats)
+            logger.info(f"OCR strategy ({self.ocr_strategy}): second passes={second_passes}/{len(column_stats)} [{winners}]")
 
         return day_items
 
+    def _run_tesseract(self, image: Image.Image, psm: int) -> tuple[str, float]:
+        """tesseract를 실행해 줄 단위 텍스트와 단어 평균 신뢰도를 반환합니다."""
+        data = self.ocr_engine.image_to_data(image, psm)
+
+        lines: dict = {}
+        confidences: List[float] = []
+        for index, word in enumerate(data["text"]):
+            word = word.strip()
+            if not word:
+                continue
+            line_key = (data["block_num"][index], data["par_num"][index], data["line_num"][index])
+            lines.setdefault(line_key, []).append(word)
+            confidence = float(data["conf"][index])
+            if confidence >= 0:
+                confidences.append(confidence)
+
+        text = "\n".join(" ".join(words) for words in lines.values())
+        mean_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+        return text, mean_confidence
+
+    def _ocr_column_adaptive(self, crop: Image.Image) -> tuple[List[str], List[str], dict]:
+        """첫 psm(기본 6)을 먼저 실행하고, 신뢰도와 품질 점수가 기준 미달일 때만 두 번째 psm(기본 4)을 추가로 실행합니다."""
+        primary, fallback = self.ocr_primary_psm, self.ocr_fallback_psm
+        text6, confidence6 = self._run_tesseract(crop, primary)
+        parsed6 = self._parse_menu_lines_from_ocr(text6)
+        score6 = self._ocr_quality_score(parsed6)
+        stats = {"confidence": round(confidence6, 1), "score": score6, "passes": 1, "strategy": f"psm{primary}"}
+
+        good_enough = confidence6 >= self.ocr_min_confidence and score6 >= self.ocr_min_quality_score
+        if self.ocr_strategy == "fast" or (self.ocr_strategy == "adaptive" and good_enough):
+            return parsed6, [text6], stats
+
+        text4, confidence4 = self._run_tesseract(crop, fallback)
+        parsed4 = self._parse_menu_lines_from_ocr(text4)
+        score4 = self._ocr_quality_score(parsed4)
+        stats["passes"] = 2
+        if score4 > score6:
+            stats.update({"confidence": round(confidence4, 1), "score": score4, "strategy": f"psm{fallback}"})
+            return parsed4, [text6, text4], stats
+
+        stats["strategy"] = f"psm{primary}+{fallback}"
+        return parsed6, [text6, text4], stats
+
     def _parse_menu_lines_from_ocr(self, text: str) -> List[str]:
         lines: List[str] = []
 
-        ignored_keywords = [
-            "식자재 원산지", "메뉴게시판", "별도로 표시", "식단은 식자재 수급", "변경될 수 있습니다",
-        ]
-
         for raw in text.splitlines():
             normalized = re.sub(r"\s+", " ", raw).strip()
             if len(normalized) < 2:
                 continue
             if not re.search(r"[가-힣A-Za-z0-9]", normalized):
                 continue
-            if any(keyword in normalized for keyword in ignored_keywords):
+            if any(keyword in normalized for keyword in NOTICE_KEYWORDS):
                 continue
             if re.fullmatch(r"[ㄱ-ㅎㅏ-ㅣ]+", normalized):
                 continue
@@ -651,12 +1085,8 @@ class SMUCafeteriaCrawler:
         return normalized
 
     def _append_notice_items(self, items: List[str]) -> List[str]:
-        notices = [
-            "* 식자재 원산지는 일일메뉴게시판에 별도로 표시하였습니다.",
-            "* 위 식단은 식자재 수급에 따라 변경될 수 있습니다.",
-        ]
         merged = items[:]
-        for notice in notices:
+        for notice in NOTICE_ITEMS:
             if notice not in merged:
                 merged.append(notice)
         return merged
@@ -709,24 +1139,101 @@ class SMUCafeteriaCrawler:
             result.append(item)
         return result
 
-    def _get_with_retry(self, url: str, params: Optional[dict] = None, timeout: Optional[int] = None) -> requests.Response:
+    def _get_with_retry(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        timeout: Optional[int] = None,
+        stream: bool = False,
+        headers: Optional[dict] = None,
+        hedge: bool = False,
+        route: str = "page",
+    ) -> requests.Response:
+        """호스트별 정책에 따라 GET 요청을 보냅니다.
+
+        연결 오류와 429/5xx 응답을 지수 백오프로 재시도하고, 연속 실패로 서킷이 열린 호스트는
+        요청 없이 CircuitOpenError로 바로 실패합니다. 마지막 시도의 5xx 응답은 그대로 반환합니다.
+        route는 서킷과 응답 시간 기록을 나누는 단위입니다 (이미지 다운로드 실패가 페이지 요청을 막지 않도록).
+        """
         last_error: Optional[Exception] = None
         effective_timeout = timeout or self.timeout
-
-        for attempt in range(1, self.max_retries + 1):
-            try:
-                response = requests.get(
-                    url,
-                    params=params,
-                    headers=self.headers,
-                    timeout=effective_timeout,
+        request_headers = {**self.headers, **headers} if headers else self.headers
+
+        with trace_span("http", url, **({"params": params} if params else {})) as span:
+            for attempt in range(1, self.max_retries + 1):
+                probing = self.http_policy.check(url, route)
+                # half-open 시험 요청은 학습된 짧은 타임아웃 대신 기본 타임아웃으로 보내 느려진 호스트도 회복할 수 있게 함
+                request_timeout = (
+                    effective_timeout if probing else self.http_policy.timeout_for(url, effective_timeout, route)
                 )
-                return response
-            except requests.RequestException as error:
-                last_error = error
-                if attempt < self.max_retries:
-                    time.sleep(self.retry_delay * attempt)
+                started = time.perf_counter()
+                try:
+                    response = self._send_get(url, params, request_headers, request_timeout, stream, hedge, route)
+                except requests.RequestException as error:
+                    timed_out = isinstance(error, requests.Timeout)
+                    self.http_policy.record_failure(url, route, timed_out_after=request_timeout if timed_out else None)
+                    last_error = error
+                    span.setdefault("retries", []).append(f"{type(error).__name__}: {error}"[:200])
+                else:
+                    span.update({"attempts": attempt, "status": response.status_code, "timeout": round(request_timeout, 1)})
+                    if response.status_code not in RETRYABLE_STATUS_CODES:
+                        self.http_policy.record_success(url, time.perf_counter() - started, route)
+                        return response
+
+                    self.http_policy.record_failure(url, route)
+                    span.setdefault("retries", []).append(f"HTTP {response.status_code}")
+                    if attempt == self.max_retries:
+                        return response
+                    response.close()
 
-        if last_error:
-            raise last_error
-        raise RuntimeError("HTTP request failed without explicit exception")
+                if attempt < self.max_retries:
+                    time.sleep(self.http_policy.backoff(attempt))
+
+            span["attempts"] = self.max_retries
+            if last_error:
+                raise last_error
+            raise RuntimeError("HTTP request failed without explicit exception")
+
+    def _send_get(
+        self,
+        url: str,
+        params: Optional[dict],
+        headers: dict,
+        timeout: float,
+        stream: bool,
+        hedge: bool,
+        route: str = "page",
+    ) -> requests.Response:
+        """hedge가 켜져 있으면 첫 요청이 호스트의 p95 응답 시간 안에 오지 않을 때 같은 요청을 하나 더 보내
+        먼저 도착한 응답을 사용합니다."""
+
+        def send() -> requests.Response:
+            return requests.get(url, params=params, headers=headers, timeout=timeout, stream=stream)
+
+        if not hedge:
+            return send()
+
+        if self._hedge_executor is None:
+            self._hedge_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="smubab-hedge")
+
+        primary = self._hedge_executor.submit(send)
+        done, _ = wait([primary], timeout=self.http_policy.hedge_delay(url, self.hedge_delay, route))
+        if done:
+            return primary.result()
+
+        trace_annotate(hedged=True)
+        futures = [primary, self._hedge_executor.submit(send)]
+        error: Optional[BaseException] = None
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                futures.remove(future)
+                error = future.exception()
+                if error is None:
+                    # 늦게 도착한 나머지 응답은 연결만 정리
+                    for other in futures:
+                        other.add_done_callback(
+                            lambda late: late.exception() is None and late.result().close()
+                        )
+                    return future.result()
+        raise error
@@ -1,30 +1,231 @@
-from datetime import date, datetime
-from typing import List, Optional
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from enum import Enum
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 from models import Menu, MenuItem, MealType, Restaurant
+from coordination import file_lock, file_stamp, write_json_atomic
+from push_registry import PushSubscriptionRegistry
+from search_index import MenuSearchIndex
 import json
+import logging
+import os
+import threading
+import time
 
+logger = logging.getLogger(__name__)
 
-class MenuDatabase:
-    """간단한 인메모리 데이터베이스 (추후 SQLite/PostgreSQL로 교체 가능)"""
-    
-    def __init__(self):
-        self.menus: List[Menu] = []
-        self.push_subscriptions: List[dict] = []
-    
-    def save_menus(self, menus: List[Menu]) -> int:
-        """메뉴 목록을 저장합니다."""
+# 삭제 기록(tombstone)을 이 개수까지만 보관하고, 더 오래된 버전의 클라이언트는 전체 재동기화
+MAX_TOMBSTONES = 2000
+
+
+def _enum_value(value) -> str:
+    return value.value if isinstance(value, Enum) else value
+
+
+def _menu_slot(restaurant, meal_type) -> Tuple[str, str]:
+    return (_enum_value(restaurant), _enum_value(meal_type))
+
+
+def _menu_key(menu: Menu) -> Tuple[date, str, str]:
+    return (menu.date, *_menu_slot(menu.restaurant, menu.meal_type))
+
+
+class MenuSnapshot:
+    """한 시점의 메뉴 상태 (날짜별 인덱스, 메뉴별 버전, 삭제 기록, 검색 역색인)
+
+    MenuDatabase에 공개된 스냅샷은 다시 수정하지 않습니다. 갱신은 clone()으로 만든 복사본에서 하는데,
+    복사본은 바뀌지 않은 날짜의 메뉴와 역색인 집합을 원본과 공유하고 처음 수정하는 부분만 복제합니다.
+    """
+
+    def __init__(self, base_version: int):
+        self.menus_by_date: Dict[date, Dict[Tuple[str, str], Menu]] = {}
+        self.menu_versions: Dict[Tuple[date, str, str], int] = {}
+        self.tombstones: Dict[Tuple[date, str, str], int] = {}
+        self.search_index = MenuSearchIndex()
+        self.base_version = base_version
+        self.version = base_version
+        # NDJSON으로 가져온 날짜 (보관 기간 정리에서 제외)
+        self.archived_dates: Set[date] = set()
+        self._owned_dates: Set[date] = set()
+
+    def clone(self) -> "MenuSnapshot":
+        clone = MenuSnapshot(self.base_version)
+        clone.menus_by_date = dict(self.menus_by_date)
+        clone.menu_versions = dict(self.menu_versions)
+        clone.tombstones = dict(self.tombstones)
+        clone.search_index = self.search_index.copy()
+        clone.archived_dates = set(self.archived_dates)
+        clone.version = self.version
+        return clone
+
+    def menus(self) -> List[Menu]:
+        return [
+            menu
+            for target_date in sorted(self.menus_by_date)
+            for menu in self.menus_by_date[target_date].values()
+        ]
+
+    def _daily_for_write(self, target_date: date) -> Dict[Tuple[str, str], Menu]:
+        if target_date not in self._owned_dates:
+            self.menus_by_date[target_date] = dict(self.menus_by_date.get(target_date, {}))
+            self._owned_dates.add(target_date)
+        return self.menus_by_date[target_date]
+
+    def save(self, menus: Iterable[Menu]) -> int:
         saved_count = 0
         for menu in menus:
-            # 중복 체크 (같은 날짜, 식당, 식사 타입)
-            existing = self.get_menu(menu.date, menu.restaurant, menu.meal_type)
-            if existing:
-                # 기존 메뉴 업데이트
-                self.menus.remove(existing)
-            
-            self.menus.append(menu)
+            # 같은 날짜, 식당, 식사 타입의 기존 메뉴는 교체
+            daily = self._daily_for_write(menu.date)
+            slot = _menu_slot(menu.restaurant, menu.meal_type)
+            existing = daily.get(slot)
+            daily[slot] = menu
             saved_count += 1
-        
+
+            # 내용이 그대로면 버전을 올리지 않음
+            if existing is None or existing.items != menu.items:
+                key = _menu_key(menu)
+                self.version += 1
+                self.menu_versions[key] = self.version
+                self.tombstones.pop(key, None)
+                if existing is not None:
+                    self.search_index.remove(key, existing)
+                self.search_index.add(key, menu)
+
         return saved_count
+
+    def remove_date(self, target_date: date) -> int:
+        daily = self.menus_by_date.pop(target_date, {})
+        self._owned_dates.discard(target_date)
+        for menu in daily.values():
+            self._record_removal(_menu_key(menu), menu)
+        return len(daily)
+
+    def remove_dates_before(self, before_date: date) -> int:
+        """before_date 이전 날짜의 메뉴를 삭제합니다 (가져온 날짜는 남김)."""
+        return sum(
+            self.remove_date(target_date)
+            for target_date in [
+                item for item in self.menus_by_date
+                if item < before_date and item not in self.archived_dates
+            ]
+        )
+
+    def remove_slots(self, target_date: date, slots: Iterable[Tuple[str, str]]):
+        daily = self._daily_for_write(target_date)
+        for slot in slots:
+            menu = daily.pop(slot)
+            self._record_removal((target_date, *slot), menu)
+        if not daily:
+            del self.menus_by_date[target_date]
+            self._owned_dates.discard(target_date)
+
+    def _record_removal(self, key: Tuple[date, str, str], menu: Menu):
+        self.search_index.remove(key, menu)
+        self.version += 1
+        self.menu_versions.pop(key, None)
+        self.tombstones[key] = self.version
+
+        if len(self.tombstones) > MAX_TOMBSTONES:
+            # 오래된 삭제 기록을 절반 정리하고, 그 이전 버전의 클라이언트는 전체 재동기화하도록 함
+            ordered = sorted(self.tombstones.items(), key=lambda item: item[1])
+            dropped = ordered[: len(ordered) // 2]
+            for dropped_key, _ in dropped:
+                del self.tombstones[dropped_key]
+            self.base_version = max(self.base_version, dropped[-1][1])
+
+
+class MenuDatabase:
+    """간단한 인메모리 데이터베이스 (추후 SQLite/PostgreSQL로 교체 가능)
+
+    메뉴는 날짜별 인덱스(날짜 -> (식당, 식사 타입) -> 메뉴)로 보관하고, 메뉴 이름 검색용 역색인을 함께 갱신합니다.
+    메뉴가 추가/변경/삭제될 때마다 version이 1씩 증가하며, changes_since()로 증분을 조회할 수 있습니다.
+    version은 시작 시각(ms)에서 출발하므로 서버가 재시작되어도 줄어들지 않습니다.
+
+    모든 상태는 하나의 MenuSnapshot에 들어 있습니다. 쓰기는 현재 스냅샷의 복사본을 고친 뒤
+    참조 하나를 바꿔 공개하므로, 읽기는 락 없이 항상 완성된 스냅샷 하나만 봅니다.
+    """
+    
+    def __init__(self):
+        self._snapshot = MenuSnapshot(int(time.time() * 1000))
+        self._write_lock = threading.Lock()
+        self.push_registry = PushSubscriptionRegistry()
+
+    @contextmanager
+    def _update(self) -> Iterator[MenuSnapshot]:
+        """현재 스냅샷의 복사본을 넘겨주고, 블록이 끝나면 복사본을 공개합니다 (예외가 나면 버림)."""
+        with self._write_lock:
+            draft = self._snapshot.clone()
+            yield draft
+            self._snapshot = draft
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    @property
+    def base_version(self) -> int:
+        return self._snapshot.base_version
+
+    @property
+    def search_index(self) -> MenuSearchIndex:
+        return self._snapshot.search_index
+
+    @property
+    def push_subscriptions(self) -> List[dict]:
+        return self.push_registry.all()
+
+    @push_subscriptions.setter
+    def push_subscriptions(self, subscriptions: List[dict]):
+        self.push_registry.replace_all(subscriptions)
+
+    @property
+    def menus(self) -> List[Menu]:
+        return self._snapshot.menus()
+
+    @menus.setter
+    def menus(self, menus: List[Menu]):
+        with self._update() as draft:
+            for target_date in list(draft.menus_by_date):
+                draft.remove_date(target_date)
+            draft.save(menus)
+    
+    def save_menus(self, menus: List[Menu], clear_before: Optional[date] = None, archive: bool = False) -> int:
+        """메뉴 목록을 저장합니다. clear_before를 주면 그 이전 날짜의 메뉴도 같은 갱신에서 삭제합니다.
+
+        archive면 저장한 날짜를 이후 clear_before 정리에서 제외합니다 (가져온 지난 메뉴 보존).
+        """
+        with self._update() as draft:
+            saved_count = draft.save(menus)
+            if archive:
+                draft.archived_dates.update(menu.date for menu in menus)
+            if clear_before is not None:
+                draft.remove_dates_before(clear_before)
+            return saved_count
+
+    def replace_menus(
+        self,
+        menus: List[Menu],
+        start_date: date,
+        end_date: date,
+        clear_before: Optional[date] = None,
+    ) -> int:
+        """start_date~end_date의 메뉴를 menus로 교체합니다 (menus에 없는 메뉴는 삭제).
+
+        삭제와 저장이 한 스냅샷으로 공개되므로 읽는 쪽에서 메뉴가 비는 순간이 없습니다.
+        """
+        with self._update() as draft:
+            keep = {_menu_key(menu) for menu in menus}
+            for target_date in [item for item in draft.menus_by_date if start_date <= item <= end_date]:
+                stale = [
+                    slot for slot in draft.menus_by_date[target_date]
+                    if (target_date, *slot) not in keep
+                ]
+                if stale:
+                    draft.remove_slots(target_date, stale)
+            saved_count = draft.save(menus)
+            if clear_before is not None:
+                draft.remove_dates_before(clear_before)
+            return saved_count
     
     def get_menu(
         self, 
@@ -33,69 +234,287 @@ class MenuDatabase:
         meal_type: Optional[MealType] = None
     ) -> Optional[Menu]:
         """특정 조건의 메뉴를 조회합니다."""
-        for menu in self.menus:
-            if menu.date == target_date:
-                if restaurant and menu.restaurant != restaurant:
-                    continue
-                if meal_type and menu.meal_type != meal_type:
-                    continue
-                return menu
+        daily = self._snapshot.menus_by_date.get(target_date, {})
+        if restaurant and meal_type:
+            return daily.get(_menu_slot(restaurant, meal_type))
+
+        for menu in daily.values():
+            if restaurant and menu.restaurant != restaurant:
+                continue
+            if meal_type and menu.meal_type != meal_type:
+                continue
+            return menu
         return None
     
     def get_daily_menus(self, target_date: date) -> List[Menu]:
         """특정 날짜의 모든 메뉴를 조회합니다."""
-        return [menu for menu in self.menus if menu.date == target_date]
+        return list(self._snapshot.menus_by_date.get(target_date, {}).values())
     
     def get_weekly_menus(self, start_date: date, end_date: date) -> List[Menu]:
         """특정 기간의 메뉴를 조회합니다."""
-        return [
-            menu for menu in self.menus 
-            if start_date <= menu.date <= end_date
-        ]
+        return self.get_menus_for_dates(
+            start_date + timedelta(days=offset)
+            for offset in range((end_date - start_date).days + 1)
+        )
+
+    def get_menus_for_dates(
+        self,
+        dates: Iterable[date],
+        restaurants: Optional[Iterable[Restaurant]] = None,
+        meal_types: Optional[Iterable[MealType]] = None,
+    ) -> List[Menu]:
+        """여러 날짜의 메뉴를 날짜 인덱스에서 한 번에 조회합니다."""
+        menus_by_date = self._snapshot.menus_by_date
+        restaurant_filter = {_enum_value(item) for item in restaurants} if restaurants else None
+        meal_type_filter = {_enum_value(item) for item in meal_types} if meal_types else None
+
+        result: List[Menu] = []
+        for target_date in dates:
+            daily = menus_by_date.get(target_date)
+            if not daily:
+                continue
+            for (restaurant, meal_type), menu in daily.items():
+                if restaurant_filter is not None and restaurant not in restaurant_filter:
+                    continue
+                if meal_type_filter is not None and meal_type not in meal_type_filter:
+                    continue
+                result.append(menu)
+        return result
     
+    def iter_menus(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        restaurants: Optional[Iterable[Restaurant]] = None,
+    ) -> Iterator[Menu]:
+        """기간/식당 조건에 맞는 메뉴를 날짜순으로 하나씩 돌려줍니다 (전체 목록을 만들지 않음).
+
+        호출한 시점의 스냅샷을 끝까지 읽으므로 도중에 갱신이 공개되어도 결과가 섞이지 않습니다.
+        """
+        restaurant_filter = {_enum_value(item) for item in restaurants} if restaurants else None
+        return self._iter_snapshot(self._snapshot.menus_by_date, start_date, end_date, restaurant_filter)
+
+    @staticmethod
+    def _iter_snapshot(menus_by_date, start_date, end_date, restaurant_filter) -> Iterator[Menu]:
+        for target_date in sorted(menus_by_date):
+            if start_date and target_date < start_date:
+                continue
+            if end_date and target_date > end_date:
+                break
+            for (restaurant, _), menu in menus_by_date[target_date].items():
+                if restaurant_filter is None or restaurant in restaurant_filter:
+                    yield menu
+
+    def import_ndjson(
+        self,
+        lines: Iterable[Union[str, bytes]],
+        batch_size: int = 500,
+        first_line: int = 1,
+    ) -> Tuple[int, List[str]]:
+        """한 줄에 메뉴 하나인 NDJSON을 batch_size개씩 저장합니다. (저장한 수, 건너뛴 줄의 오류)를 반환합니다.
+
+        가져온 날짜는 보관 기간 정리(clear_before)에서 제외되어 이후 크롤링에도 남습니다.
+        """
+        imported = 0
+        errors: List[str] = []
+        batch: List[Menu] = []
+        for line_number, line in enumerate(lines, start=first_line):
+            if not line.strip():
+                continue
+            try:
+                batch.append(Menu.model_validate_json(line))
+            except ValueError as error:
+                errors.append(f"line {line_number}: {str(error).splitlines()[0]}")
+                continue
+            if len(batch) >= batch_size:
+                imported += self.save_menus(batch, archive=True)
+                batch = []
+        if batch:
+            imported += self.save_menus(batch, archive=True)
+        return imported, errors
+
+    def search_menus(self, query: str) -> List[Tuple[str, List[Tuple[date, str, str]]]]:
+        """메뉴 이름에 query가 포함된 항목과 제공된 (날짜, 식당, 식사 타입) 목록을 역색인에서 찾습니다."""
+        return self._snapshot.search_index.search(query)
+
     def get_menus_by_restaurant(self, restaurant: Restaurant, target_date: date = None) -> List[Menu]:
         """특정 식당의 메뉴를 조회합니다."""
-        menus = [menu for menu in self.menus if menu.restaurant == restaurant]
-        if target_date:
-            menus = [menu for menu in menus if menu.date == target_date]
-        return menus
+        dates = [target_date] if target_date else sorted(self._snapshot.menus_by_date)
+        return self.get_menus_for_dates(dates, restaurants=[restaurant])
     
     def clear_old_menus(self, before_date: date) -> int:
         """특정 날짜 이전의 메뉴를 삭제합니다."""
-        old_menus = [menu for menu in self.menus if menu.date < before_date]
-        for menu in old_menus:
-            self.menus.remove(menu)
-        return len(old_menus)
+        if not any(item < before_date for item in self._snapshot.menus_by_date):
+            return 0
+        with self._update() as draft:
+            return draft.remove_dates_before(before_date)
 
-    def upsert_push_subscription(self, subscription: dict) -> bool:
-        endpoint = subscription.get("endpoint")
-        if not endpoint:
-            return False
+    def changes_since(self, since: int) -> Tuple[List[Menu], List[Tuple[date, str, str]], bool]:
+        """since 이후 추가/변경된 메뉴와 삭제된 메뉴 키를 반환합니다.
 
-        existing = next(
-            (item for item in self.push_subscriptions if item.get("endpoint") == endpoint),
-            None,
-        )
-        if existing:
-            self.push_subscriptions.remove(existing)
+        since가 보관 중인 기록보다 오래되었으면 (전체 메뉴, [], True)를 반환하며,
+        클라이언트는 가지고 있던 메뉴를 모두 교체해야 합니다.
+        """
+        snapshot = self._snapshot
+        if since < snapshot.base_version:
+            return snapshot.menus(), [], True
+        if since >= snapshot.version:
+            return [], [], False
+
+        changed = [
+            snapshot.menus_by_date[key[0]][key[1:]]
+            for key, version in sorted(snapshot.menu_versions.items(), key=lambda item: item[1])
+            if version > since
+        ]
+        removed = [key for key, version in snapshot.tombstones.items() if version > since]
+        return changed, removed, False
+
+    def dump_state(self) -> dict:
+        """메뉴와 버전 정보를 JSON으로 직렬화할 수 있는 형태로 반환합니다."""
+        snapshot = self._snapshot
+        menus = snapshot.menus()
+        return {
+            "version": snapshot.version,
+            "baseVersion": snapshot.base_version,
+            "menus": [menu.model_dump(mode="json") for menu in menus],
+            "menuVersions": [snapshot.menu_versions.get(_menu_key(menu), snapshot.base_version) for menu in menus],
+            "tombstones": [
+                [key[0].isoformat(), key[1], key[2], version]
+                for key, version in snapshot.tombstones.items()
+            ],
+            "archivedDates": [item.isoformat() for item in sorted(snapshot.archived_dates)],
+        }
+
+    def load_state(self, state: dict):
+        """dump_state()로 만든 상태를 그대로 복원합니다."""
+        menus = [Menu(**item) for item in state.get("menus", [])]
+        snapshot = MenuSnapshot(state.get("baseVersion", self.base_version))
+        snapshot.version = state.get("version", snapshot.base_version)
+        versions = state.get("menuVersions") or [snapshot.version] * len(menus)
+
+        for menu, version in zip(menus, versions):
+            snapshot.menus_by_date.setdefault(menu.date, {})[_menu_slot(menu.restaurant, menu.meal_type)] = menu
+            snapshot.menu_versions[_menu_key(menu)] = version
+            snapshot.search_index.add(_menu_key(menu), menu)
+
+        snapshot.tombstones = {
+            (date.fromisoformat(item[0]), item[1], item[2]): item[3]
+            for item in state.get("tombstones", [])
+        }
+        snapshot.archived_dates = {date.fromisoformat(item) for item in state.get("archivedDates", [])}
+        with self._write_lock:
+            self._snapshot = snapshot
+
+    def save_snapshot(self, path: str):
+        """메뉴 상태를 파일에 기록합니다 (재시작 시 load_snapshot으로 복원)."""
+        write_json_atomic(path, self.dump_state())
+
+    def load_snapshot(self, path: str) -> bool:
+        """save_snapshot()으로 기록한 파일을 복원합니다.
 
-        self.push_subscriptions.append(subscription)
+        파일이 없거나 잘렸거나 형식이 맞지 않으면 (JSON/pydantic 검증 오류 포함) 기존 상태를 그대로 두고 False를 반환합니다.
+        """
+        try:
+            with open(path, encoding="utf-8") as file:
+                self.load_state(json.load(file))
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError, KeyError, TypeError, AttributeError, IndexError) as error:
+            logger.warning(f"Ignoring unreadable snapshot {path}: {type(error).__name__}: {error}")
+            return False
         return True
 
+    def upsert_push_subscription(self, subscription: dict) -> bool:
+        return self.push_registry.upsert(subscription)
+
     def remove_push_subscription(self, endpoint: str) -> bool:
-        existing = next(
-            (item for item in self.push_subscriptions if item.get("endpoint") == endpoint),
-            None,
-        )
-        if not existing:
-            return False
+        return self.push_registry.remove(endpoint)
+
+    def get_push_subscriptions(self, topics: Optional[Iterable[str]] = None) -> List[dict]:
+        """구독 목록을 반환합니다. topics를 주면 그 중 하나라도 구독한 구독만 주제별 인덱스에서 찾습니다."""
+        if topics is None:
+            return self.push_registry.all()
+        return self.push_registry.for_topics(topics)
+
+
+class SharedMenuDatabase(MenuDatabase):
+    """여러 워커 프로세스가 공유하는 파일 기반 데이터베이스
+
+    메뉴는 크롤링 리더만 기록(publish_menus)하고, 나머지 워커는 sync()로 다시 읽습니다.
+    푸시 구독은 어느 워커에서든 파일 락을 잡고 읽기-수정-쓰기로 갱신합니다.
+    """
+
+    def __init__(self, directory: str):
+        super().__init__()
+        os.makedirs(directory, exist_ok=True)
+        self.menus_path = os.path.join(directory, "menus.json")
+        self.subscriptions_path = os.path.join(directory, "push_subscriptions.json")
+        self.subscriptions_lock_path = os.path.join(directory, "push_subscriptions.lock")
+        self._sync_lock = threading.Lock()
+        self._menus_stamp = None
+        self._subscriptions_stamp = None
+        self.sync()
+
+    def publish_menus(self, last_update: Optional[dict] = None):
+        """현재 메뉴를 공유 파일에 기록합니다 (크롤링 리더 전용)."""
+        payload = self.dump_state()
+        payload["lastUpdate"] = last_update
+        with self._sync_lock:
+            write_json_atomic(self.menus_path, payload)
+            self._menus_stamp = file_stamp(self.menus_path)
+
+    def sync(self) -> Optional[dict]:
+        """공유 파일이 바뀌었으면 다시 읽습니다. 메뉴가 바뀐 경우 마지막 갱신 정보를 반환합니다."""
+        self._sync_subscriptions()
+
+        with self._sync_lock:
+            stamp = file_stamp(self.menus_path)
+            if stamp is None or stamp == self._menus_stamp:
+                return None
+
+            with open(self.menus_path, encoding="utf-8") as file:
+                payload = json.load(file)
+            self.load_state(payload)
+            self._menus_stamp = stamp
+            return payload.get("lastUpdate") or {}
+
+    def _sync_subscriptions(self, force: bool = False):
+        stamp = file_stamp(self.subscriptions_path)
+        if stamp is None or (stamp == self._subscriptions_stamp and not force):
+            return
+
+        with open(self.subscriptions_path, encoding="utf-8") as file:
+            self.push_subscriptions = json.load(file)
+        self._subscriptions_stamp = stamp
+
+    def _modify_subscriptions(self, operation) -> bool:
+        with file_lock(self.subscriptions_lock_path):
+            self._sync_subscriptions(force=True)
+            changed = operation()
+            if changed:
+                write_json_atomic(self.subscriptions_path, self.push_subscriptions)
+                self._subscriptions_stamp = file_stamp(self.subscriptions_path)
+        return changed
+
+    def upsert_push_subscription(self, subscription: dict) -> bool:
+        upsert = super().upsert_push_subscription
+        return self._modify_subscriptions(lambda: upsert(subscription))
+
+    def remove_push_subscription(self, endpoint: str) -> bool:
+        remove = super().remove_push_subscription
+        return self._modify_subscriptions(lambda: remove(endpoint))
+
+    def get_push_subscriptions(self, topics: Optional[Iterable[str]] = None) -> List[dict]:
+        self._sync_subscriptions()
+        return super().get_push_subscriptions(topics)
 
-        self.push_subscriptions.remove(existing)
-        return True
 
-    def get_push_subscriptions(self) -> List[dict]:
-        return list(self.push_subscriptions)
+def create_database() -> MenuDatabase:
+    shared_store_dir = os.getenv("SHARED_STORE_DIR", "")
+    if shared_store_dir:
+        return SharedMenuDatabase(shared_store_dir)
+    return MenuDatabase()
 
 
 # 전역 데이터베이스 인스턴스
-db = MenuDatabase()
+db = create_database()
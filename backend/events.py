@@ -0,0 +1,102 @@
+import asyncio
+import json
+import logging
+from collections import deque
+from typing import Deque, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def format_sse(event: str, data: dict, event_id: Optional[int] = None) -> str:
+    """Server-Sent Events 메시지 문자열을 만듭니다."""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    for line in payload.splitlines() or [""]:
+        lines.append(f"data: {line}")
+    return "\n".join(lines) + "\n\n"
+
+
+class MenuEventBroker:
+    """메뉴 갱신 이벤트를 SSE 구독자들에게 전달하는 브로커
+
+    구독자마다 작은 asyncio.Queue 하나만 두므로 유휴 연결 비용이 거의 없습니다.
+    publish()는 크롤링 스레드에서도 호출할 수 있습니다.
+    최근 이벤트 history_size개를 보관해 Last-Event-ID로 재연결한 구독자에게 놓친 이벤트를 다시 보냅니다.
+    """
+
+    def __init__(self, queue_size: int = 8, history_size: int = 32):
+        self.queue_size = queue_size
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._last_event_id = 0
+        self._history: Deque[Tuple[int, str]] = deque(maxlen=history_size)
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self, last_event_id: Optional[int] = None) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        if last_event_id is not None:
+            for message in self.missed_messages(last_event_id)[-self.queue_size:]:
+                queue.put_nowait(message)
+        self._subscribers.add(queue)
+        return queue
+
+    def missed_messages(self, last_event_id: int) -> list:
+        """last_event_id 이후에 보낸 이벤트 (재연결한 클라이언트가 놓친 것)
+
+        ID가 보관 중인 마지막 이벤트보다 크면 (서버 재시작 등으로 ID를 알 수 없으면) 마지막 이벤트를 보냅니다.
+        """
+        missed = [message for event_id, message in self._history if event_id > last_event_id]
+        if not missed and self._history and last_event_id > self._history[-1][0]:
+            missed = [self._history[-1][1]]
+        return missed
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self._subscribers.discard(queue)
+
+    def publish(self, event: str, data: dict, event_id: Optional[int] = None):
+        """이벤트를 보냅니다. event_id를 주지 않으면 이 브로커에서 1씩 증가하는 ID를 씁니다.
+
+        메뉴 갱신은 저장소 version을 ID로 주므로 워커나 재시작과 관계없이 같은 갱신은 같은 ID를 가집니다.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is loop:
+            self._dispatch(event, data, event_id)
+        else:
+            loop.call_soon_threadsafe(self._dispatch, event, data, event_id)
+
+    def _dispatch(self, event: str, data: dict, event_id: Optional[int] = None):
+        self._last_event_id = event_id if event_id is not None else self._last_event_id + 1
+        message = format_sse(event, data, self._last_event_id)
+        self._history.append((self._last_event_id, message))
+
+        for queue in list(self._subscribers):
+            if queue.full():
+                # 느린 구독자는 가장 오래된 이벤트를 버리고 최신 이벤트를 받음
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+            queue.put_nowait(message)
+
+        logger.info(f"SSE event '{event}' sent to {len(self._subscribers)} subscribers")
+
+
+# 전역 이벤트 브로커 인스턴스
+menu_events = MenuEventBroker()
@@ -0,0 +1,123 @@
+import random
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+# 재시도할 HTTP 상태 코드 (서버 과부하/일시 장애)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(RuntimeError):
+    """호스트의 서킷 브레이커가 열려 있어 요청을 보내지 않고 바로 실패합니다."""
+
+
+class _HostState:
+    def __init__(self, window: int):
+        self.latencies: deque = deque(maxlen=window)
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.probing = False
+
+
+class HostPolicy:
+    """호스트별 지연 시간 기록을 바탕으로 타임아웃, 재시도 간격, 서킷 브레이커를 정합니다.
+
+    - 타임아웃: 최근 응답 시간 p95 × timeout_multiplier (min_timeout ~ 호출부 기본값 사이).
+      시간 초과된 요청도 그 타임아웃 값을 표본으로 기록해 호스트가 느려지면 타임아웃이 함께 늘어납니다.
+    - 재시도 간격: 지터를 준 지수 백오프 (0 ~ backoff_base × 2^(n-1), 최대 backoff_cap)
+    - 서킷 브레이커: 연속 failure_threshold회 실패하면 reset_timeout 동안 요청을 막고,
+      이후 한 건만 시험 삼아(호출부 기본 타임아웃으로) 보내 성공하면 다시 닫습니다.
+
+    기록과 서킷은 (호스트, route)별로 따로 둡니다. 같은 호스트라도 이미지 다운로드(route="image")
+    실패가 페이지 요청을 막지 않습니다.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: float = 60,
+        min_timeout: float = 3,
+        timeout_multiplier: float = 4,
+        min_samples: int = 5,
+        window: int = 50,
+        backoff_base: float = 1.5,
+        backoff_cap: float = 10,
+        min_hedge_delay: float = 0.25,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.min_timeout = min_timeout
+        self.timeout_multiplier = timeout_multiplier
+        self.min_samples = min_samples
+        self.window = window
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.min_hedge_delay = min_hedge_delay
+        self._hosts: Dict[Tuple[str, str], _HostState] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, url: str, route: str) -> _HostState:
+        key = (urlsplit(url).netloc, route)
+        state = self._hosts.get(key)
+        if state is None:
+            state = self._hosts[key] = _HostState(self.window)
+        return state
+
+    def check(self, url: str, route: str = "page") -> bool:
+        """서킷이 열려 있으면 CircuitOpenError를 발생시킵니다. 이번 요청이 half-open 시험 요청이면 True."""
+        with self._lock:
+            state = self._state(url, route)
+            if state.opened_at is None:
+                return False
+            remaining = state.opened_at + self.reset_timeout - time.monotonic()
+            if remaining > 0 or state.probing:
+                raise CircuitOpenError(
+                    f"Circuit open for {urlsplit(url).netloc} ({route}, "
+                    f"{state.consecutive_failures} consecutive failures, retry in {max(remaining, 0):.0f}s)"
+                )
+            # half-open: 한 건만 통과시켜 회복 여부를 확인
+            state.probing = True
+            return True
+
+    def record_success(self, url: str, latency: float, route: str = "page"):
+        with self._lock:
+            state = self._state(url, route)
+            state.latencies.append(latency)
+            state.consecutive_failures = 0
+            state.opened_at = None
+            state.probing = False
+
+    def record_failure(self, url: str, route: str = "page", timed_out_after: Optional[float] = None):
+        """실패를 기록합니다. 시간 초과였다면 timed_out_after(그 요청의 타임아웃)를 응답 시간 표본으로 남깁니다."""
+        with self._lock:
+            state = self._state(url, route)
+            if timed_out_after is not None:
+                state.latencies.append(timed_out_after)
+            state.consecutive_failures += 1
+            if state.probing or state.consecutive_failures >= self.failure_threshold:
+                state.opened_at = time.monotonic()
+            state.probing = False
+
+    def latency_percentile(self, url: str, quantile: float, route: str = "page") -> Optional[float]:
+        with self._lock:
+            samples = sorted(self._state(url, route).latencies)
+        if len(samples) < self.min_samples:
+            return None
+        index = min(int(len(samples) * quantile), len(samples) - 1)
+        return samples[index]
+
+    def timeout_for(self, url: str, default: float, route: str = "page") -> float:
+        p95 = self.latency_percentile(url, 0.95, route)
+        if p95 is None:
+            return default
+        return min(default, max(self.min_timeout, p95 * self.timeout_multiplier))
+
+    def hedge_delay(self, url: str, default: float, route: str = "page") -> float:
+        """중복 요청을 보내기 전까지 기다릴 시간 (해당 호스트의 p95 응답 시간)"""
+        p95 = self.latency_percentile(url, 0.95, route)
+        return default if p95 is None else max(p95, self.min_hedge_delay)
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1)))
@@ -1,23 +1,46 @@
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from datetime import date, datetime, timedelta
-from typing import Optional
+from typing import List, Optional
+from collections import OrderedDict
+import asyncio
 import threading
 import logging
 import os
 import json
+import secrets
 import time
 
-from pywebpush import webpush, WebPushException
-
 from models import (
     MenuResponse, DailyMenuResponse,
-    Restaurant,
+    Menu, MenuItem, MealType, Restaurant,
     PushSubscribeRequest,
     PushUnsubscribeRequest,
 )
-from crawler import SMUCafeteriaCrawler
+from crawl_worker import CrawlWorkerClient
 from database import db
+from coordination import CrawlLeader
+from admission import CrawlAdmission
+from static_export import StaticMenuFiles, StaticPublisher, export_static_snapshot
+from events import menu_events
+from coalescer import NotificationCoalescer
+from push_registry import TOPIC_DAILY_DIGEST, normalize_topics, topics_for_menu
+from menu_filters import is_dish_item
+from crawl_trace import CrawlHistory, end_trace, start_trace, trace_span
+from source_freshness import CRAWL_SOURCES, SourceFreshness, source_of
+from wire_format import MSGPACK_MEDIA_TYPE, encode_menu_payload, wants_msgpack
+from cache_policy import (
+    ALL_MENUS_KEY,
+    CachePolicy,
+    date_key,
+    end_of_day,
+    end_of_week,
+    menu_surrogate_keys,
+    parse_update_times,
+    restaurant_key,
+    week_key,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -37,34 +60,139 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-crawler = SMUCafeteriaCrawler()
+# CRAWL_WORKER_MODE=process이면 크롤링/OCR을 별도 워커 프로세스에서 실행
+CRAWL_WORKER_MODE = os.getenv("CRAWL_WORKER_MODE", "thread")
+_crawler = None
 _update_lock = threading.Lock()
 _is_updating = False
 
+# 대기 중인 크롤링 (주 월요일 -> (기준 날짜, 알림 여부, 교체 여부)), 한 번에 하나씩 순서대로 처리
+CRAWL_QUEUE_SIZE = int(os.getenv("CRAWL_QUEUE_SIZE", "4"))
+_pending_crawls: "OrderedDict[date, tuple]" = OrderedDict()
+_current_crawl_week: Optional[date] = None
+
+# 저장소에 남겨 두는 지난 메뉴 기간 (이보다 오래된 날짜는 갱신 때 삭제)
+MENU_RETENTION_DAYS = 7
+
+# 캐시 미스로 인한 크롤링 허용 정책
+# 보관 기간보다 오래된 날짜는 크롤링해도 바로 삭제되므로 허용 범위를 보관 기간으로 제한
+crawl_admission = CrawlAdmission(
+    past_days=min(int(os.getenv("CRAWL_WINDOW_PAST_DAYS", str(MENU_RETENTION_DAYS))), MENU_RETENTION_DAYS),
+    future_days=int(os.getenv("CRAWL_WINDOW_FUTURE_DAYS", "14")),
+    empty_ttl=float(os.getenv("CRAWL_EMPTY_TTL_SECONDS", "1800")),
+    failure_ttl=float(os.getenv("CRAWL_FAILURE_TTL_SECONDS", "300")),
+    rate_per_minute=float(os.getenv("CRAWL_TRIGGER_RATE_PER_MINUTE", "2")),
+    burst=int(os.getenv("CRAWL_TRIGGER_BURST", "2")),
+)
+
+# 앞단 리버스 프록시 수 (X-Forwarded-For에서 오른쪽부터 이만큼의 값만 신뢰)
+TRUSTED_PROXY_COUNT = int(os.getenv("TRUSTED_PROXY_COUNT", "0"))
+
+# 멀티 워커 모드: 워커들이 SHARED_STORE_DIR의 파일을 공유하고 크롤링 리더 하나만 크롤링
+SHARED_STORE_DIR = os.getenv("SHARED_STORE_DIR", "")
+
+# STARTUP_MODE=fast: 스냅샷에 이번 주 메뉴가 있으면 시작 시 크롤링을 생략
+STARTUP_MODE = os.getenv("STARTUP_MODE", "full")
+SNAPSHOT_PATH = os.getenv("SNAPSHOT_PATH", "")
+SHARED_STORE_POLL_SECONDS = float(os.getenv("SHARED_STORE_POLL_SECONDS", "2"))
+crawl_leader = CrawlLeader(SHARED_STORE_DIR) if SHARED_STORE_DIR else None
+
 VAPID_PUBLIC_KEY = os.getenv("VAPID_PUBLIC_KEY", "")
 VAPID_PRIVATE_KEY = os.getenv("VAPID_PRIVATE_KEY", "")
 VAPID_CLAIMS_SUB = os.getenv("VAPID_CLAIMS_SUB", "mailto:admin@smubab.app")
+SSE_KEEPALIVE_SECONDS = float(os.getenv("SSE_KEEPALIVE_SECONDS", "15"))
+SSE_RETRY_MILLISECONDS = int(os.getenv("SSE_RETRY_MILLISECONDS", "5000"))
+BATCH_MAX_DAYS = int(os.getenv("BATCH_MAX_DAYS", "62"))
+# NDJSON 내보내기/가져오기 시 한 번에 처리하는 메뉴 수
+EXPORT_CHUNK_MENUS = 200
+IMPORT_BATCH_MENUS = 500
+
+# 갱신 후 날짜/주/식당별 정적 JSON(.gz/.br 포함)을 기록할 디렉토리
+STATIC_EXPORT_DIR = os.getenv("STATIC_EXPORT_DIR", "")
+
+# 메뉴 응답 캐시 정책 (정기 갱신 시각, 최대 캐시 시간, CDN purge 훅)
+cache_policy = CachePolicy(
+    update_times=parse_update_times(os.getenv("CACHE_UPDATE_TIMES", "")),
+    max_age=int(os.getenv("CACHE_MAX_AGE_SECONDS", "3600")),
+    browser_max_age=int(os.getenv("CACHE_BROWSER_MAX_AGE_SECONDS", "300")),
+    purge_url=os.getenv("CACHE_PURGE_URL", ""),
+    purge_token=os.getenv("CACHE_PURGE_TOKEN", ""),
+)
+
+# 소스별 재크롤링 주기: 서울 식단은 매일 바뀔 수 있고 천안 게시판은 주 1회 게시됨
+source_freshness = SourceFreshness(
+    intervals={
+        "seoul_breakfast": float(os.getenv("FRESHNESS_SEOUL_SECONDS", "10800")),
+        "seoul_lunch": float(os.getenv("FRESHNESS_SEOUL_SECONDS", "10800")),
+        "cheonan_faculty": float(os.getenv("FRESHNESS_CHEONAN_SECONDS", "86400")),
+        "cheonan_student": float(os.getenv("FRESHNESS_CHEONAN_SECONDS", "86400")),
+    },
+    degraded_retry=float(os.getenv("FRESHNESS_DEGRADED_RETRY_SECONDS", "1800")),
+    path=os.getenv("FRESHNESS_PATH") or None,
+)
+
+# 내보낸 정적 파일을 올릴 CDN/정적 호스팅 원본 (PUT/DELETE, 비워두면 백엔드의 /static/menus에서만 제공)
+STATIC_PUBLISH_URL = os.getenv("STATIC_PUBLISH_URL", "")
+static_publisher = StaticPublisher(
+    STATIC_PUBLISH_URL,
+    token=os.getenv("STATIC_PUBLISH_TOKEN", ""),
+    cache_control=f"public, max-age={cache_policy.browser_max_age}",
+) if STATIC_PUBLISH_URL else None
+
+# 최근 크롤링 실행 기록 (단계별 소요 시간) 및 관리용 엔드포인트 토큰
+crawl_history = CrawlHistory(max_runs=int(os.getenv("CRAWL_HISTORY_SIZE", "20")))
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+if STATIC_EXPORT_DIR:
+    os.makedirs(STATIC_EXPORT_DIR, exist_ok=True)
+    app.mount(
+        "/static/menus",
+        StaticMenuFiles(directory=STATIC_EXPORT_DIR, cache_policy=cache_policy),
+        name="static-menus",
+    )
 
 
 def is_push_enabled() -> bool:
     return bool(VAPID_PUBLIC_KEY and VAPID_PRIVATE_KEY)
 
 
-def send_push_payload(payload: dict):
+def get_crawler():
+    """크롤러를 처음 사용할 때 생성합니다 (requests/bs4/PIL/tesseract 로딩을 첫 크롤링까지 미룸)."""
+    global _crawler
+    if _crawler is None:
+        if CRAWL_WORKER_MODE == "process":
+            _crawler = CrawlWorkerClient(
+                job_timeout=float(os.getenv("CRAWL_JOB_TIMEOUT_SECONDS", "300")),
+                memory_limit_mb=int(os.getenv("CRAWL_WORKER_MEMORY_MB", "1024")),
+            )
+        else:
+            from crawler import SMUCafeteriaCrawler
+            _crawler = SMUCafeteriaCrawler()
+    return _crawler
+
+
+def send_push_payload(
+    payload: dict,
+    topics: Optional[List[str]] = None,
+    subscriptions: Optional[List[dict]] = None,
+):
+    """구독자에게 푸시를 보냅니다. topics를 주면 해당 주제 구독자에게만, subscriptions를 주면 그 구독에만 보냅니다."""
     if not is_push_enabled():
         logger.info("Push disabled: missing VAPID keys")
         return {"sent": 0, "removed": 0, "total": 0}
 
-    subscriptions = db.get_push_subscriptions()
+    if subscriptions is None:
+        subscriptions = db.get_push_subscriptions(topics)
     if not subscriptions:
         return {"sent": 0, "removed": 0, "total": 0}
 
+    from pywebpush import webpush, WebPushException
+
     removed_count = 0
     sent_count = 0
     for subscription in subscriptions:
         try:
             webpush(
-                subscription_info=subscription,
+                subscription_info={key: value for key, value in subscription.items() if key != "topics"},
                 data=json.dumps(payload, ensure_ascii=False),
                 vapid_private_key=VAPID_PRIVATE_KEY,
                 vapid_claims={"sub": VAPID_CLAIMS_SUB},
@@ -85,16 +213,74 @@ def send_push_payload(payload: dict):
     return {"sent": sent_count, "removed": removed_count, "total": len(subscriptions)}
 
 
-def send_menu_update_notification(target_date: date, saved_count: int):
-    title = "🍚 학식 메뉴 업데이트"
-    body = f"{target_date} 기준 메뉴가 새로 업데이트되었습니다. ({saved_count}건)"
+def send_menu_update_notification(changed_menus: List[Menu]):
+    """바뀐 메뉴의 주제(캠퍼스/식당/식사 타입)별 날짜를 알림 대기열에 넣습니다.
+
+    PUSH_DEBOUNCE_SECONDS 동안 이어지는 갱신은 모아서 구독자마다 한 번만 보냅니다.
+    """
+    topic_dates: dict = {}
+    for menu in changed_menus:
+        for topic in topics_for_menu(menu.restaurant, menu.meal_type):
+            topic_dates.setdefault(topic, set()).add(menu.date)
+    notification_coalescer.add(topic_dates)
+
+
+def _format_menu_dates(dates: List[date]) -> str:
+    return ", ".join(f"{item.month}/{item.day}({'월화수목금토일'[item.weekday()]})" for item in dates)
+
+
+def flush_menu_update_notifications(pending: dict):
+    """모인 알림을 구독자별로 합쳐, 같은 날짜 목록을 받는 구독자끼리 한 번에 보냅니다."""
+    subscriptions_by_endpoint: dict = {}
+    dates_by_endpoint: dict = {}
+    for topic, dates in pending.items():
+        for subscription in db.get_push_subscriptions([topic]):
+            endpoint = subscription["endpoint"]
+            subscriptions_by_endpoint[endpoint] = subscription
+            dates_by_endpoint.setdefault(endpoint, set()).update(dates)
+
+    groups: dict = {}
+    for endpoint, dates in dates_by_endpoint.items():
+        groups.setdefault(tuple(sorted(dates)), []).append(subscriptions_by_endpoint[endpoint])
+
+    for dates, subscriptions in groups.items():
+        first, last = dates[0].isoformat(), dates[-1].isoformat()
+        payload = {
+            "title": "🍚 학식 메뉴 업데이트",
+            "body": f"{_format_menu_dates(list(dates))} 메뉴가 새로 업데이트되었습니다.",
+            "url": "/",
+            "tag": f"menu-update-{first}" if first == last else f"menu-update-{first}~{last}",
+            "dates": [item.isoformat() for item in dates],
+        }
+        send_push_payload(payload, subscriptions=subscriptions)
+
+
+notification_coalescer = NotificationCoalescer(
+    flush_menu_update_notifications,
+    debounce=float(os.getenv("PUSH_DEBOUNCE_SECONDS", "30")),
+    max_delay=float(os.getenv("PUSH_MAX_DELAY_SECONDS", "120")),
+)
+
+
+def send_daily_digest(target_date: date):
+    """digest:daily 구독자에게 해당 날짜의 식당별 메뉴 요약을 보냅니다."""
+    menus = db.get_daily_menus(target_date)
+    if not menus:
+        return {"sent": 0, "removed": 0, "total": 0}
+
+    lines = []
+    for menu in sorted(menus, key=lambda item: (item.restaurant, item.meal_type)):
+        names = [item.name for item in menu.items if is_dish_item(item.name)]
+        if names:
+            lines.append(f"{menu.restaurant} {menu.meal_type}: {', '.join(names[:3])}")
+
     payload = {
-        "title": title,
-        "body": body,
+        "title": f"🍱 {target_date} 오늘의 학식",
+        "body": "\n".join(lines) or "오늘은 등록된 메뉴가 없습니다.",
         "url": "/",
-        "tag": f"menu-update-{target_date.isoformat()}",
+        "tag": f"menu-digest-{target_date.isoformat()}",
     }
-    send_push_payload(payload)
+    return send_push_payload(payload, [TOPIC_DAILY_DIGEST])
 
 
 def trigger_test_push_notification(delay_seconds: int = 10):
@@ -113,56 +299,308 @@ def trigger_test_push_notification(delay_seconds: int = 10):
     thread.start()
 
 
-def update_menus(target_date: Optional[date] = None, notify: bool = False):
+def update_menus(target_date: Optional[date] = None, notify: bool = False, replace: bool = False):
+    """한 주의 메뉴 중 오래되었거나 '정보없음'으로 대체된 소스만 다시 크롤링해 저장합니다.
+
+    replace면 모든 소스를 다시 크롤링하고, 새로 받은 메뉴에 없는 그 주의 메뉴를 삭제합니다.
+    """
     if target_date is None:
         target_date = date.today()
 
+    trace = start_trace(target_date, notify)
+    try:
+        saved_count = _run_menu_update(target_date, notify, replace)
+        trace.finish("ok", savedCount=saved_count)
+    except Exception as error:
+        trace.finish("error", error=f"{type(error).__name__}: {error}"[:300])
+        raise
+    finally:
+        end_trace()
+        crawl_history.add(trace)
+        logger.info(
+            f"Crawl run {trace.run_id} {trace.outcome} in {trace.duration_ms}ms "
+            f"{json.dumps(trace.stage_totals(), ensure_ascii=False)}"
+        )
+
+
+def _run_menu_update(target_date: date, notify: bool, replace: bool = False) -> int:
+    version_before = db.version
     weekday = target_date.weekday()
     monday = target_date - timedelta(days=weekday)
     friday = monday + timedelta(days=4)
 
-    menus = crawler.crawl_weekly_menu(target_date)
-    saved_count = db.save_menus(menus)
-    db.clear_old_menus(date.today() - timedelta(days=7))
+    sources = list(CRAWL_SOURCES) if replace else due_sources(monday)
+    if not sources:
+        logger.info(f"All sources fresh for {monday} ~ {friday}, skipping crawl")
+        return 0
+
+    with trace_span("crawl", "weekly", mode=CRAWL_WORKER_MODE, sources=",".join(sources)) as span:
+        results = get_crawler().crawl_sources(target_date, sources)
+        menus = collect_source_menus(monday, results, replace)
+        span["menus"] = len(menus)
+    with trace_span("store", "save") as span:
+        # 저장과 오래된 메뉴 정리를 한 스냅샷으로 공개
+        clear_before = date.today() - timedelta(days=MENU_RETENTION_DAYS)
+        if replace:
+            saved_count = db.replace_menus(menus, monday, monday + timedelta(days=6), clear_before)
+        else:
+            saved_count = db.save_menus(menus, clear_before)
+        span["saved"] = saved_count
     logger.info(f"Updated {saved_count} menus for {monday} ~ {friday}")
 
-    if notify and saved_count > 0:
-        send_menu_update_notification(target_date, saved_count)
+    update_event = {
+        "date": target_date.isoformat(),
+        "weekStart": monday.isoformat(),
+        "weekEnd": friday.isoformat(),
+        "savedCount": saved_count,
+    }
+    persist_menus(update_event)
+    purge_menu_caches(version_before)
 
+    if saved_count > 0:
+        menu_events.publish("menus-updated", update_event, event_id=db.version)
 
-def trigger_update_menus(target_date: Optional[date] = None, notify: bool = False) -> bool:
+    if notify and saved_count > 0:
+        with trace_span("notify", "push"):
+            changed_menus, _, _ = db.changes_since(version_before)
+            send_menu_update_notification(changed_menus)
+
+    return saved_count
+
+
+def stored_source_menus(monday: date, sources) -> List[Menu]:
+    return [
+        menu
+        for menu in db.get_weekly_menus(monday, monday + timedelta(days=6))
+        if source_of(menu.restaurant, menu.meal_type) in sources
+    ]
+
+
+def due_sources(monday: date) -> List[str]:
+    """다시 크롤링할 소스: 주기가 지났거나 degraded인 소스, 그리고 저장된 메뉴가 없는 소스"""
+    due = set(source_freshness.due_sources(monday))
+    stored = {source_of(menu.restaurant, menu.meal_type) for menu in stored_source_menus(monday, CRAWL_SOURCES)}
+    return [source for source in CRAWL_SOURCES if source in due or source not in stored]
+
+
+def collect_source_menus(monday: date, results: dict, replace: bool) -> List[Menu]:
+    """소스별 결과의 신선도를 기록하고 저장할 메뉴를 고릅니다.
+
+    이번에 '정보없음'으로 대체됐지만 같은 주에 정상적으로 받은 적이 있는 소스는 저장된 메뉴를 유지합니다.
+    """
+    menus: List[Menu] = []
+    for source, (source_menus, fallback) in results.items():
+        previous = source_freshness.get(source, monday)
+        entry = source_freshness.record(source, monday, source_menus, fallback)
+        if entry["degraded"] and previous and previous.get("lastSuccess"):
+            logger.info(f"Source {source} degraded for {monday}, keeping stored menus")
+            menus.extend(stored_source_menus(monday, [source]))
+        else:
+            menus.extend(source_menus)
+
+    if replace:
+        # 크롤링하지 않은 소스의 메뉴는 교체 대상에서 제외
+        menus.extend(stored_source_menus(monday, [source for source in CRAWL_SOURCES if source not in results]))
+    return menus
+
+
+def persist_menus(update_event: dict):
+    """메뉴 저장 후 공유 파일/스냅샷/정적 파일에 반영합니다."""
+    if crawl_leader is not None:
+        with trace_span("store", "publish_shared"):
+            db.publish_menus(update_event)
+    elif SNAPSHOT_PATH:
+        with trace_span("store", "snapshot") as span:
+            try:
+                db.save_snapshot(SNAPSHOT_PATH)
+            except Exception as error:
+                logger.warning(f"Snapshot save failed: {error}")
+                span.update({"outcome": "error", "error": str(error)})
+
+    if STATIC_EXPORT_DIR:
+        with trace_span("export", "static") as span:
+            try:
+                span["files"] = export_static_snapshot(db.menus, STATIC_EXPORT_DIR, static_publisher)
+            except Exception as error:
+                logger.warning(f"Static snapshot export failed: {error}")
+                span.update({"outcome": "error", "error": str(error)})
+
+
+def purge_menu_caches(since_version: int):
+    """since_version 이후 바뀐 메뉴의 날짜/주/식당 surrogate key를 purge 훅으로 보냅니다."""
+    if not cache_policy.purge_url:
+        return
+
+    changed, removed, reset = db.changes_since(since_version)
+    if reset:
+        keys = {ALL_MENUS_KEY}
+    else:
+        keys = set()
+        for menu in changed:
+            keys |= menu_surrogate_keys(menu.date, menu.restaurant)
+        for menu_date, restaurant, _ in removed:
+            keys |= menu_surrogate_keys(menu_date, restaurant)
+    if not keys:
+        return
+
+    with trace_span("cache", "purge", keys=len(keys)) as span:
+        if not cache_policy.purge(keys):
+            span["outcome"] = "error"
+
+
+def trigger_update_menus(target_date: Optional[date] = None, notify: bool = False, replace: bool = False) -> bool:
+    """크롤링을 대기열에 넣습니다. 같은 주가 이미 대기/진행 중이거나 대기열이 가득 차면 넣지 않습니다.
+
+    replace(강제 갱신)는 같은 주가 진행 중이어도 그 크롤링이 끝난 뒤 모든 소스를 다시 크롤링하도록 대기열에 넣습니다.
+    """
     global _is_updating
+    if target_date is None:
+        target_date = date.today()
+
+    if crawl_leader is not None and not crawl_leader.try_acquire():
+        # 리더가 아닌 워커는 직접 크롤링하지 않고 리더에게 요청만 남김
+        # (같은 주 요청이 이미 있어도 리더가 곧 크롤링하므로 업데이트 중으로 응답)
+        crawl_leader.request_crawl(target_date, notify, replace)
+        return True
+
+    monday = target_date - timedelta(days=target_date.weekday())
     with _update_lock:
-        if _is_updating:
+        if monday == _current_crawl_week and not replace:
+            return True
+        if monday in _pending_crawls:
+            queued_date, queued_notify, queued_replace = _pending_crawls[monday]
+            _pending_crawls[monday] = (queued_date, queued_notify or notify, queued_replace or replace)
+            return True
+        if len(_pending_crawls) >= CRAWL_QUEUE_SIZE:
+            logger.info(f"Crawl queue full, dropping request for {target_date}")
             return False
+
+        _pending_crawls[monday] = (target_date, notify, replace)
+        if _is_updating:
+            return True
         _is_updating = True
 
-    def _task():
-        global _is_updating
+    thread = threading.Thread(target=_drain_crawl_queue, daemon=True)
+    thread.start()
+    return True
+
+
+def _drain_crawl_queue():
+    global _is_updating, _current_crawl_week
+    while True:
+        with _update_lock:
+            if not _pending_crawls:
+                _is_updating = False
+                _current_crawl_week = None
+                return
+            _current_crawl_week, (target_date, notify, replace) = _pending_crawls.popitem(last=False)
+
         try:
-            update_menus(target_date, notify)
+            update_menus(target_date, notify, replace)
+            crawl_admission.record_result(target_date, found=bool(db.get_weekly_menus(
+                _current_crawl_week, _current_crawl_week + timedelta(days=4)
+            )))
         except Exception as error:
             logger.warning(f"Menu update failed: {error}")
-        finally:
-            with _update_lock:
-                _is_updating = False
+            crawl_admission.record_result(target_date, found=False, failed=True)
+
+
+def _client_key(request: Request) -> str:
+    """크롤링 요청 제한에 쓰는 클라이언트 주소
+
+    X-Forwarded-For의 왼쪽 값은 클라이언트가 마음대로 보낼 수 있으므로, TRUSTED_PROXY_COUNT개의
+    신뢰하는 프록시가 오른쪽에 덧붙인 값만 사용합니다. 설정하지 않으면 연결한 주소를 사용합니다.
+    """
+    if TRUSTED_PROXY_COUNT > 0:
+        hops = [hop.strip() for hop in request.headers.get("x-forwarded-for", "").split(",") if hop.strip()]
+        if hops:
+            return hops[-min(TRUSTED_PROXY_COUNT, len(hops))]
+    return request.client.host if request.client else "unknown"
+
+
+def is_crawl_queued(target_date: date) -> bool:
+    """target_date가 속한 주를 이 워커가 크롤링 중이거나 대기열에 넣어 두었는지"""
+    monday = target_date - timedelta(days=target_date.weekday())
+    with _update_lock:
+        return monday == _current_crawl_week or monday in _pending_crawls
+
+
+def trigger_update_on_miss(target_date: date, request: Request) -> bool:
+    """조회 결과가 없을 때 허용 정책을 통과한 경우에만 크롤링을 요청합니다."""
+    if target_date.weekday() >= 5:
+        # 주말은 메뉴가 없으므로 해당 주 평일 메뉴가 이미 있으면 크롤링하지 않음
+        monday = target_date - timedelta(days=target_date.weekday())
+        if db.get_weekly_menus(monday, monday + timedelta(days=4)):
+            return False
+
+    if is_crawl_queued(target_date):
+        # 이미 크롤링 중/대기 중인 주는 요청 한도를 쓰지 않고 업데이트 중으로 응답 (알림 여부만 합침)
+        return trigger_update_menus(target_date, notify=True)
+
+    reason = crawl_admission.check(target_date, _client_key(request))
+    if reason:
+        logger.info(f"Crawl for {target_date} not admitted: {reason}")
+        return False
+    return trigger_update_menus(target_date, notify=True)
+
+
+def sync_shared_store():
+    """리더는 쌓인 크롤링 요청을 처리하고, 나머지 워커는 공유 파일의 변경을 반영합니다."""
+    if crawl_leader.try_acquire():
+        if not _is_updating:
+            request = crawl_leader.pop_request()
+            if request:
+                trigger_update_menus(*request)
+        return
+
+    last_update = db.sync()
+    if last_update is not None:
+        menu_events.publish("menus-updated", last_update, event_id=db.version)
+
+
+async def _shared_store_loop():
+    while True:
+        await asyncio.sleep(SHARED_STORE_POLL_SECONDS)
+        try:
+            await asyncio.to_thread(sync_shared_store)
+        except Exception as error:
+            logger.warning(f"Shared store sync failed: {error}")
 
-    thread = threading.Thread(target=_task, daemon=True)
-    thread.start()
-    return True
+
+def should_crawl_on_startup() -> bool:
+    if STARTUP_MODE != "fast":
+        return True
+    today = date.today()
+    monday = today - timedelta(days=today.weekday())
+    return not db.get_weekly_menus(monday, monday + timedelta(days=4))
 
 
 @app.on_event("startup")
 async def startup_event():
     """서버 시작 시 실행"""
     logger.info("Starting SMU-Bab API server...")
-    trigger_update_menus(date.today(), notify=False)
+    menu_events.bind_loop(asyncio.get_running_loop())
+    if crawl_leader is None:
+        if SNAPSHOT_PATH and db.load_snapshot(SNAPSHOT_PATH):
+            logger.info(f"Warm boot from snapshot: {len(db.menus)} menus")
+        if should_crawl_on_startup():
+            trigger_update_menus(date.today(), notify=False)
+    else:
+        # 모든 워커가 시작 크롤링을 요청하지 않도록 리더만 크롤링
+        if crawl_leader.try_acquire() and should_crawl_on_startup():
+            trigger_update_menus(date.today(), notify=False)
+        asyncio.create_task(_shared_store_loop())
     logger.info("Server started successfully")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """서버 종료 시 실행"""
+    if crawl_leader is not None:
+        crawl_leader.release()
+    if isinstance(_crawler, CrawlWorkerClient):
+        _crawler.stop()
+    notification_coalescer.flush_now()
     logger.info("Server shutdown")
 
 
@@ -185,54 +623,77 @@ async def health_check():
     }
 
 
+def msgpack_response(response: Response, content: bytes) -> Response:
+    # 직접 만든 응답에는 주입된 response의 헤더(캐시 정책 등)가 자동으로 붙지 않으므로 옮겨 줌
+    headers = {key: value for key, value in response.headers.items() if key != "content-length"}
+    return Response(content=content, media_type=MSGPACK_MEDIA_TYPE, headers=headers)
+
+
+def negotiate_menus(request: Request, response: Response, menus_key: str, payload):
+    """Accept: application/msgpack이면 메뉴 목록을 압축 표현의 MessagePack으로, 아니면 그대로(JSON) 반환합니다."""
+    response.headers["Vary"] = "Accept"
+    if not wants_msgpack(request.headers.get("accept")):
+        return payload
+    fields = payload.model_dump(mode="json", exclude={menus_key})
+    return msgpack_response(response, encode_menu_payload(fields, menus_key, getattr(payload, menus_key)))
+
+
 @app.get("/api/menus/today", response_model=DailyMenuResponse)
-async def get_today_menus():
+async def get_today_menus(request: Request, response: Response):
     """오늘의 메뉴를 조회합니다."""
     today = date.today()
     menus = db.get_daily_menus(today)
 
     if not menus:
-        trigger_update_menus(today, notify=True)
-        return DailyMenuResponse(
+        cache_policy.apply_no_store(response)
+        updating = trigger_update_on_miss(today, request)
+        return negotiate_menus(request, response, "menus", DailyMenuResponse(
             success=False,
             date=today,
             menus=[],
             error="메뉴 업데이트 중입니다. 잠시 후 다시 시도해 주세요.",
-        )
+            message=None if updating else "메뉴 정보가 없습니다",
+        ))
 
-    return DailyMenuResponse(
+    cache_policy.apply(response, end_of_day(today), [date_key(today), week_key(today)])
+    return negotiate_menus(request, response, "menus", DailyMenuResponse(
         success=True,
         date=today,
         menus=menus,
         message=f"총 {len(menus)}개의 메뉴"
-    )
+    ))
 
 
 @app.get("/api/menus/date/{target_date}", response_model=DailyMenuResponse)
-async def get_menus_by_date(target_date: date):
+async def get_menus_by_date(target_date: date, request: Request, response: Response):
     """특정 날짜의 메뉴를 조회합니다."""
     menus = db.get_daily_menus(target_date)
 
     if not menus:
-        trigger_update_menus(target_date, notify=True)
-        return DailyMenuResponse(
+        cache_policy.apply_no_store(response)
+        updating = trigger_update_on_miss(target_date, request)
+        return negotiate_menus(request, response, "menus", DailyMenuResponse(
             success=False,
             date=target_date,
             menus=[],
             error="메뉴 업데이트 중입니다. 잠시 후 다시 시도해 주세요.",
-        )
+            message=None if updating else "메뉴 정보가 없습니다",
+        ))
 
-    return DailyMenuResponse(
+    cache_policy.apply(response, end_of_day(target_date), [date_key(target_date), week_key(target_date)])
+    return negotiate_menus(request, response, "menus", DailyMenuResponse(
         success=True,
         date=target_date,
         menus=menus,
         message=f"총 {len(menus)}개의 메뉴" if menus else "메뉴 정보가 없습니다"
-    )
+    ))
 
 
 @app.get("/api/menus/week", response_model=MenuResponse)
 async def get_weekly_menus(
-    target_date: Optional[date] = Query(None, description="기준 날짜 (기본값: 오늘, 해당 주의 월~금 반환)")
+    request: Request,
+    response: Response,
+    target_date: Optional[date] = Query(None, description="기준 날짜 (기본값: 오늘, 해당 주의 월~금 반환)"),
 ):
     """주간 메뉴를 조회합니다 (해당 주의 월~금)."""
     if target_date is None:
@@ -247,22 +708,27 @@ async def get_weekly_menus(
     menus = db.get_weekly_menus(monday, friday)
 
     if not menus:
-        trigger_update_menus(target_date, notify=True)
-        return MenuResponse(
+        cache_policy.apply_no_store(response)
+        updating = trigger_update_on_miss(target_date, request)
+        return negotiate_menus(request, response, "data", MenuResponse(
             success=False,
             data=[],
             error="메뉴 업데이트 중입니다. 잠시 후 다시 시도해 주세요.",
-        )
+            message=None if updating else "메뉴 정보가 없습니다",
+        ))
 
-    return MenuResponse(
+    cache_policy.apply(response, end_of_week(monday), [week_key(monday)])
+    return negotiate_menus(request, response, "data", MenuResponse(
         success=True,
         data=menus,
         message=f"{monday} ~ {friday} 메뉴 {len(menus)}개"
-    )
+    ))
 
 
 @app.get("/api/menus/restaurant/{restaurant}", response_model=MenuResponse)
 async def get_menus_by_restaurant(
+    request: Request,
+    response: Response,
     restaurant: Restaurant,
     target_date: Optional[date] = Query(None, description="날짜 (기본값: 오늘)")
 ):
@@ -271,11 +737,255 @@ async def get_menus_by_restaurant(
         target_date = date.today()
     
     menus = db.get_menus_by_restaurant(restaurant, target_date)
+    if menus:
+        cache_policy.apply(response, end_of_day(target_date), [date_key(target_date), restaurant_key(restaurant)])
+    else:
+        cache_policy.apply_no_store(response)
     
-    return MenuResponse(
+    return negotiate_menus(request, response, "data", MenuResponse(
         success=True,
         data=menus,
         message=f"{restaurant.value} 메뉴 {len(menus)}개"
+    ))
+
+
+def parse_date_specs(specs: List[str]) -> List[date]:
+    """'YYYY-MM-DD' 또는 'YYYY-MM-DD~YYYY-MM-DD' 형식(쉼표 구분 가능)의 날짜 목록을 펼칩니다."""
+    dates: List[date] = []
+    seen = set()
+    for spec in specs:
+        for part in spec.split(","):
+            part = part.strip()
+            if not part:
+                continue
+            try:
+                if "~" in part:
+                    start_text, end_text = part.split("~", 1)
+                    start_date = date.fromisoformat(start_text.strip())
+                    end_date = date.fromisoformat(end_text.strip())
+                else:
+                    start_date = end_date = date.fromisoformat(part)
+            except ValueError:
+                raise HTTPException(status_code=400, detail=f"잘못된 날짜 형식: {part}")
+
+            if end_date < start_date:
+                raise HTTPException(status_code=400, detail=f"잘못된 날짜 범위: {part}")
+
+            current = start_date
+            while current <= end_date:
+                if current not in seen:
+                    seen.add(current)
+                    dates.append(current)
+                    if len(dates) > BATCH_MAX_DAYS:
+                        raise HTTPException(status_code=400, detail=f"한 번에 최대 {BATCH_MAX_DAYS}일까지 조회할 수 있습니다")
+                current += timedelta(days=1)
+
+    return sorted(dates)
+
+
+def _compact_item(item: MenuItem):
+    if item.price is None and item.calories is None:
+        return item.name
+    return [item.name, item.price, item.calories]
+
+
+def group_menus_compact(menus: List[Menu]) -> dict:
+    """메뉴를 날짜 -> 식당 -> 식사 타입 -> 항목 이름 목록 형태로 묶습니다.
+
+    가격/칼로리가 없는 항목은 이름 문자열만, 있는 항목은 [이름, 가격, 칼로리]로 표현합니다.
+    """
+    grouped: dict = {}
+    for menu in menus:
+        by_restaurant = grouped.setdefault(menu.date.isoformat(), {})
+        by_meal = by_restaurant.setdefault(menu.restaurant, {})
+        by_meal[menu.meal_type] = [_compact_item(item) for item in menu.items]
+    return grouped
+
+
+@app.get("/api/menus/batch")
+async def get_menus_batch(
+    request: Request,
+    response: Response,
+    dates: List[str] = Query(..., description="날짜 또는 날짜 범위 (예: 2026-03-02, 2026-03-02~2026-03-06)"),
+    restaurants: Optional[List[Restaurant]] = Query(None, description="식당 필터"),
+    meal_types: Optional[List[MealType]] = Query(None, description="식사 타입 필터"),
+):
+    """여러 날짜/식당의 메뉴를 한 번에 조회합니다."""
+    target_dates = parse_date_specs(dates)
+    menus = db.get_menus_for_dates(target_dates, restaurants, meal_types)
+
+    missing_dates = [
+        target_date for target_date in target_dates
+        if target_date.weekday() < 5 and not db.get_daily_menus(target_date)
+    ]
+    if missing_dates:
+        cache_policy.apply_no_store(response)
+        trigger_update_on_miss(missing_dates[0], request)
+    else:
+        cache_policy.apply(response, None, [date_key(target_date) for target_date in target_dates])
+
+    fields = {
+        "success": True,
+        "missingDates": [target_date.isoformat() for target_date in missing_dates],
+        "message": f"{len(target_dates)}일 메뉴 {len(menus)}개",
+    }
+    response.headers["Vary"] = "Accept"
+    if wants_msgpack(request.headers.get("accept")):
+        return msgpack_response(response, encode_menu_payload(fields, "data", menus))
+    return {**fields, "data": group_menus_compact(menus)}
+
+
+@app.get("/api/menus/search")
+async def search_menus(
+    q: str = Query(..., min_length=1, max_length=50, description="메뉴 이름 (공백 무시, 부분 일치)"),
+    restaurant: Optional[Restaurant] = Query(None, description="식당 필터"),
+    limit: int = Query(50, ge=1, le=200, description="최대 결과 수"),
+):
+    """저장된 전체 기간에서 메뉴 이름으로 어느 식당이 언제 제공했는지 찾습니다."""
+    restaurant_value = restaurant.value if restaurant else None
+
+    grouped: dict = {}
+    for name, keys in db.search_menus(q):
+        for menu_date, menu_restaurant, meal_type in keys:
+            if restaurant_value and menu_restaurant != restaurant_value:
+                continue
+            grouped.setdefault((name, menu_restaurant, meal_type), []).append(menu_date)
+
+    results = sorted(grouped.items(), key=lambda item: max(item[1]), reverse=True)
+    return {
+        "success": True,
+        "query": q,
+        "data": [
+            {
+                "name": name,
+                "restaurant": menu_restaurant,
+                "meal_type": meal_type,
+                "dates": [menu_date.isoformat() for menu_date in sorted(dates)],
+            }
+            for (name, menu_restaurant, meal_type), dates in results[:limit]
+        ],
+        "message": f"'{q}' 검색 결과 {len(results)}건",
+    }
+
+
+@app.get("/api/menus/export")
+async def export_menus(
+    start_date: Optional[date] = Query(None, description="시작 날짜 (포함)"),
+    end_date: Optional[date] = Query(None, description="끝 날짜 (포함)"),
+    restaurants: Optional[List[Restaurant]] = Query(None, description="식당 필터"),
+):
+    """저장된 메뉴를 한 줄에 하나씩 NDJSON으로 스트리밍합니다."""
+
+    def generate():
+        lines: List[str] = []
+        for menu in db.iter_menus(start_date, end_date, restaurants):
+            lines.append(menu.model_dump_json(exclude_none=True))
+            if len(lines) >= EXPORT_CHUNK_MENUS:
+                yield "\n".join(lines) + "\n"
+                lines = []
+        if lines:
+            yield "\n".join(lines) + "\n"
+
+    filename = f"menus-{start_date or 'all'}-{end_date or 'all'}.ndjson"
+    return StreamingResponse(
+        generate(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@app.post("/api/menus/import")
+async def import_menus(request: Request):
+    """/api/menus/export 형식의 NDJSON 본문을 스트리밍으로 읽어 일괄 저장합니다."""
+    require_admin(request)
+    if crawl_leader is not None and not crawl_leader.try_acquire():
+        raise HTTPException(status_code=409, detail="메뉴 가져오기는 크롤링 리더 워커에서만 할 수 있습니다")
+
+    version_before = db.version
+    imported = 0
+    errors: List[str] = []
+    line_offset = 0
+    pending = b""
+    lines: List[bytes] = []
+
+    def flush():
+        nonlocal imported, line_offset
+        count, batch_errors = db.import_ndjson(lines, first_line=line_offset + 1)
+        imported += count
+        errors.extend(batch_errors)
+        line_offset += len(lines)
+        lines.clear()
+
+    async for chunk in request.stream():
+        pending += chunk
+        *complete, pending = pending.split(b"\n")
+        lines.extend(complete)
+        if len(lines) >= IMPORT_BATCH_MENUS:
+            flush()
+    if pending.strip():
+        lines.append(pending)
+    flush()
+
+    if imported:
+        persist_menus({"date": date.today().isoformat(), "savedCount": imported, "source": "import"})
+        purge_menu_caches(version_before)
+        menu_events.publish("menus-updated", {"savedCount": imported, "source": "import"}, event_id=db.version)
+
+    return {
+        "success": not errors,
+        "imported": imported,
+        "errors": errors[:20],
+        "message": f"메뉴 {imported}개를 가져왔습니다" + (f" (오류 {len(errors)}줄 건너뜀)" if errors else ""),
+    }
+
+
+@app.get("/api/menus/changes")
+async def get_menu_changes(
+    since: int = Query(0, ge=0, description="클라이언트가 마지막으로 받은 version (처음이면 0)")
+):
+    """since 이후 추가/변경/삭제된 메뉴만 반환합니다."""
+    version = db.version
+    changed, removed, reset = db.changes_since(since)
+    return {
+        "success": True,
+        "version": version,
+        "reset": reset,
+        "changed": [menu.model_dump(mode="json", exclude_none=True) for menu in changed],
+        "removed": [
+            {"date": key[0].isoformat(), "restaurant": key[1], "meal_type": key[2]}
+            for key in removed
+        ],
+    }
+
+
+@app.get("/api/menus/stream")
+async def stream_menu_events(request: Request):
+    """메뉴 갱신 이벤트(menus-updated)를 Server-Sent Events로 전달합니다."""
+    last_event_id = request.headers.get("last-event-id")
+    queue = menu_events.subscribe(int(last_event_id) if last_event_id and last_event_id.isdigit() else None)
+
+    async def _event_stream():
+        try:
+            yield f"retry: {SSE_RETRY_MILLISECONDS}\n\n"
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": keepalive\n\n"
+                    continue
+                yield message
+        finally:
+            menu_events.unsubscribe(queue)
+
+    return StreamingResponse(
+        _event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
     )
 
 
@@ -303,16 +1013,71 @@ async def get_restaurants():
 
 @app.post("/api/menus/refresh")
 async def refresh_menus():
-    """메뉴 정보를 강제로 갱신합니다."""
-    try:
-        db.menus = []
-        update_menus(date.today(), notify=True)
-        return {
-            "success": True,
-            "message": "메뉴 정보가 갱신되었습니다"
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"메뉴 갱신 실패: {str(e)}")
+    """이번 주 메뉴를 강제로 다시 크롤링하도록 대기열에 넣습니다.
+
+    다른 크롤링과 같은 대기열에서 순서대로 실행되며, 끝나면 menus-updated 이벤트가 전달됩니다.
+    """
+    if not trigger_update_menus(date.today(), notify=True, replace=True):
+        raise HTTPException(status_code=503, detail="크롤링 대기열이 가득 찼습니다. 잠시 후 다시 시도해 주세요.")
+    return {
+        "success": True,
+        "message": "메뉴 갱신을 시작했습니다"
+    }
+
+
+def require_admin(request: Request):
+    """관리용 엔드포인트 인증. ADMIN_TOKEN이 설정되지 않았으면 모든 요청을 거절합니다."""
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=503, detail="Admin endpoints are disabled (ADMIN_TOKEN is not set)")
+    if not secrets.compare_digest(request.headers.get("X-Admin-Token", ""), ADMIN_TOKEN):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+
+@app.get("/api/admin/crawls")
+async def list_crawl_runs(request: Request):
+    """최근 크롤링 실행 기록을 최신순으로 반환합니다."""
+    require_admin(request)
+    return {
+        "success": True,
+        "data": [trace.to_summary() for trace in crawl_history.list()],
+    }
+
+
+@app.get("/api/admin/crawls/{run_id}")
+async def get_crawl_run(run_id: str, request: Request):
+    """크롤링 1회의 단계별 기록(소스/HTTP 요청/이미지/OCR 칸)을 반환합니다."""
+    require_admin(request)
+    trace = crawl_history.get(run_id)
+    if trace is None:
+        raise HTTPException(status_code=404, detail="Crawl run not found")
+    return {"success": True, "data": trace.to_dict()}
+
+
+@app.get("/api/admin/crawls/{run_id}/timeline", response_class=PlainTextResponse)
+async def get_crawl_run_timeline(run_id: str, request: Request):
+    """실행 간 diff로 비교할 수 있는 텍스트 타임라인을 반환합니다."""
+    require_admin(request)
+    trace = crawl_history.get(run_id)
+    if trace is None:
+        raise HTTPException(status_code=404, detail="Crawl run not found")
+    return "\n".join(trace.timeline()) + "\n"
+
+
+@app.get("/api/admin/freshness")
+async def get_source_freshness(
+    request: Request,
+    target_date: Optional[date] = Query(None, description="기준 날짜 (기본값: 오늘, 해당 주의 기록 반환)"),
+):
+    """해당 주의 소스별 크롤링 신선도와 다음 갱신 때 다시 크롤링할 소스를 반환합니다."""
+    require_admin(request)
+    target_date = target_date or date.today()
+    monday = target_date - timedelta(days=target_date.weekday())
+    return {
+        "success": True,
+        "weekStart": monday.isoformat(),
+        "sources": source_freshness.week_status(monday),
+        "due": due_sources(monday),
+    }
 
 
 @app.get("/api/push/public-key")
@@ -335,16 +1100,49 @@ async def subscribe_push(request: PushSubscribeRequest):
     if not is_push_enabled():
         raise HTTPException(status_code=503, detail="Push notifications are not configured")
 
-    saved = db.upsert_push_subscription(request.subscription.model_dump())
+    try:
+        topics = normalize_topics(request.topics)
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error))
+
+    saved = db.upsert_push_subscription({**request.subscription.model_dump(), "topics": topics})
     if not saved:
         raise HTTPException(status_code=400, detail="Invalid subscription")
 
     return {
         "success": True,
+        "topics": topics,
         "message": "Push subscription registered",
     }
 
 
+@app.get("/api/push/topics")
+async def get_push_topics():
+    """구독할 수 있는 알림 주제 목록"""
+    return {
+        "success": True,
+        "data": normalize_topics(
+            ["all", TOPIC_DAILY_DIGEST, "campus:seoul", "campus:cheonan"]
+            + [f"restaurant:{item.value}" for item in Restaurant]
+            + [f"meal:{item.value}" for item in MealType]
+        ),
+    }
+
+
+@app.post("/api/push/digest")
+async def send_push_digest(
+    request: Request,
+    target_date: Optional[date] = Query(None, description="요약할 날짜 (기본값: 오늘)"),
+):
+    """digest:daily 구독자에게 하루 메뉴 요약을 보냅니다 (외부 cron에서 호출)."""
+    require_admin(request)
+    if not is_push_enabled():
+        raise HTTPException(status_code=503, detail="Push notifications are not configured")
+
+    result = await asyncio.to_thread(send_daily_digest, target_date or date.today())
+    return {"success": True, **result}
+
+
 @app.post("/api/push/unsubscribe")
 async def unsubscribe_push(request: PushUnsubscribeRequest):
     removed = db.remove_push_subscription(request.endpoint)
@@ -0,0 +1,37 @@
+import re
+
+# 천안 식단 아래에 항상 붙이는 안내 문구
+NOTICE_ITEMS = (
+    "* 식자재 원산지는 일일메뉴게시판에 별도로 표시하였습니다.",
+    "* 위 식단은 식자재 수급에 따라 변경될 수 있습니다.",
+)
+# OCR 결과나 메뉴 항목에서 안내 문구로 보는 키워드
+NOTICE_KEYWORDS = (
+    "식자재 원산지", "메뉴게시판", "별도로 표시", "식단은 식자재 수급", "변경될 수 있습니다",
+)
+# 메뉴가 없음을 나타내는 대체 항목 ('조식정보없음', '중식 미운영' 등)
+PLACEHOLDER_ITEMS = ("조식제공X",)
+CLOSED_KEYWORDS = ("미운영", "휴무", "연휴")
+
+
+def is_placeholder_item(name: str) -> bool:
+    """'정보없음'/'조식제공X'/'미운영' 같은 메뉴 없음 표시"""
+    name = name.strip()
+    return (
+        name.endswith("정보없음")
+        or name in PLACEHOLDER_ITEMS
+        or any(keyword in name for keyword in CLOSED_KEYWORDS)
+    )
+
+
+def is_notice_item(name: str) -> bool:
+    """원산지/식단 변경 안내 같은 안내 문구"""
+    name = name.strip()
+    return name.startswith("*") or any(keyword in name for keyword in NOTICE_KEYWORDS) or bool(
+        re.match(r"^\(?원산지\)?\s*[:：]", name)
+    )
+
+
+def is_dish_item(name: str) -> bool:
+    """검색/통계에 쓸 실제 메뉴 항목인지"""
+    return not is_placeholder_item(name) and not is_notice_item(name)
@@ -65,6 +65,8 @@ class PushSubscription(BaseModel):
 
 class PushSubscribeRequest(BaseModel):
     subscription: PushSubscription
+    # 알림 주제 (없으면 all): all, digest:daily, campus:seoul, restaurant:천안_교직원식당, meal:lunch 등
+    topics: Optional[List[str]] = None
 
 
 class PushUnsubscribeRequest(BaseModel):
@@ -0,0 +1,147 @@
+import logging
+import queue
+import threading
+from typing import Dict, List
+
+from PIL import Image
+
+# Optional tesseract imports
+try:
+    import pytesseract
+    PYTESSERACT_AVAILABLE = True
+except (ImportError, Exception):
+    PYTESSERACT_AVAILABLE = False
+
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except (ImportError, Exception):
+    TESSEROCR_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+OCR_LANG = "kor+eng"
+# tesseract TSV 출력의 열 (GetTSVText는 머리글 줄 없이 본문만 반환)
+TSV_COLUMNS = [
+    "level", "page_num", "block_num", "par_num", "line_num", "word_num",
+    "left", "top", "width", "height", "conf", "text",
+]
+
+
+def tsv_to_dict(tsv: str) -> Dict[str, list]:
+    """tesseract TSV를 pytesseract.image_to_data(output_type=DICT)와 같은 형태로 변환합니다.
+
+    숫자 열은 pytesseract와 똑같이 int(float(값))으로 바꾸므로 엔진이 달라도 결과가 같습니다.
+    """
+    rows = [row.split("\t") for row in tsv.strip().split("\n") if row]
+    if rows and rows[0][0] == TSV_COLUMNS[0]:
+        rows.pop(0)
+    if not rows:
+        return {}
+    if len(rows[-1]) < len(TSV_COLUMNS):
+        # 마지막 단어가 비어 있으면 text 칸이 빠져 있음
+        rows[-1].append("")
+
+    text_index = len(TSV_COLUMNS) - 1
+    result: Dict[str, list] = {}
+    for index, column in enumerate(TSV_COLUMNS):
+        values = []
+        for row in rows:
+            if len(row) <= index:
+                continue
+            value = row[index]
+            if index != text_index:
+                try:
+                    value = int(float(value))
+                except ValueError:
+                    pass
+            values.append(value)
+        result[column] = values
+    return result
+
+
+class PytesseractEngine:
+    """호출마다 tesseract 프로세스를 실행하는 기본 엔진
+
+    매번 이미지를 임시 파일로 쓰고 언어 모델을 다시 읽으므로 호출당 고정 비용이 큽니다.
+    """
+
+    name = "pytesseract"
+
+    def __init__(self, lang: str = OCR_LANG):
+        self.lang = lang
+
+    def image_to_data(self, image: Image.Image, psm: int) -> Dict[str, list]:
+        return pytesseract.image_to_data(
+            image,
+            lang=self.lang,
+            config=f"--oem 3 --psm {psm}",
+            output_type=pytesseract.Output.DICT,
+        )
+
+    def close(self):
+        pass
+
+
+class TesserocrEngine:
+    """언어 모델을 한 번만 읽어 두고 재사용하는 프로세스 내 엔진 (tesserocr)
+
+    PyTessBaseAPI는 스레드 안전하지 않으므로 최대 pool_size개를 만들어 한 호출에 하나씩 빌려 씁니다.
+    API는 처음 필요할 때 만듭니다 (모델 로드 비용은 인스턴스당 한 번).
+    """
+
+    name = "tesserocr"
+
+    def __init__(self, lang: str = OCR_LANG, pool_size: int = 1):
+        self.lang = lang
+        self.pool_size = max(pool_size, 1)
+        self._idle: "queue.Queue" = queue.Queue()
+        self._apis: List = []
+        self._lock = threading.Lock()
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if len(self._apis) < self.pool_size:
+                api = tesserocr.PyTessBaseAPI(lang=self.lang, oem=tesserocr.OEM.DEFAULT)
+                self._apis.append(api)
+                logger.info(f"Loaded tesserocr engine {len(self._apis)}/{self.pool_size} ({self.lang})")
+                return api
+        return self._idle.get()
+
+    def image_to_data(self, image: Image.Image, psm: int) -> Dict[str, list]:
+        api = self._acquire()
+        try:
+            api.SetPageSegMode(psm)
+            api.SetImage(image)
+            api.Recognize()
+            tsv = api.GetTSVText(0)
+        finally:
+            api.Clear()
+            self._idle.put(api)
+        return tsv_to_dict(tsv)
+
+    def close(self):
+        with self._lock:
+            apis, self._apis = self._apis, []
+        self._idle = queue.Queue()
+        for api in apis:
+            api.End()
+
+
+def create_ocr_engine(name: str = "auto", pool_size: int = 1):
+    """OCR_ENGINE 설정(auto | tesserocr | pytesseract)에 맞는 엔진을 만듭니다. 쓸 수 있는 엔진이 없으면 None.
+
+    auto는 tesserocr가 설치되어 있으면 tesserocr, 없으면 pytesseract를 사용합니다.
+    """
+    if name in ("auto", "tesserocr") and TESSEROCR_AVAILABLE:
+        return TesserocrEngine(pool_size=pool_size)
+    if name == "tesserocr":
+        logger.warning("OCR_ENGINE=tesserocr but tesserocr is not installed, falling back to pytesseract")
+    if PYTESSERACT_AVAILABLE:
+        return PytesseractEngine()
+    return None
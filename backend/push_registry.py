@@ -0,0 +1,135 @@
+import threading
+from typing import Dict, Iterable, List, Optional, Set
+
+from models import MealType, Restaurant
+
+# 주제를 지정하지 않은 구독은 모든 메뉴 갱신 알림을 받음
+TOPIC_ALL = "all"
+TOPIC_DAILY_DIGEST = "digest:daily"
+CAMPUSES = {"서울": "seoul", "천안": "cheonan"}
+
+
+def campus_of(restaurant) -> str:
+    value = Restaurant(restaurant).value
+    return CAMPUSES[value.split("_", 1)[0]]
+
+
+def topics_for_menu(restaurant, meal_type) -> Set[str]:
+    """메뉴 하나가 바뀌었을 때 알림을 받을 주제 (전체, 캠퍼스, 식당, 식사 타입)"""
+    return {
+        TOPIC_ALL,
+        f"campus:{campus_of(restaurant)}",
+        f"restaurant:{Restaurant(restaurant).value}",
+        f"meal:{MealType(meal_type).value}",
+    }
+
+
+def normalize_topics(topics: Optional[Iterable[str]]) -> List[str]:
+    """구독 주제를 검증합니다. 잘못된 주제가 있으면 ValueError를 발생시킵니다.
+
+    - all, digest:daily
+    - campus:seoul | campus:cheonan
+    - restaurant:{식당} (예: restaurant:천안_교직원식당)
+    - meal:{식사 타입} (예: meal:lunch)
+    """
+    if not topics:
+        return [TOPIC_ALL]
+
+    normalized = []
+    for topic in topics:
+        topic = topic.strip()
+        kind, _, value = topic.partition(":")
+        if topic in (TOPIC_ALL, TOPIC_DAILY_DIGEST):
+            pass
+        elif kind == "campus" and value in CAMPUSES.values():
+            pass
+        elif kind == "restaurant" and value in {item.value for item in Restaurant}:
+            pass
+        elif kind == "meal" and value in {item.value for item in MealType}:
+            pass
+        else:
+            raise ValueError(f"Unknown push topic: {topic}")
+        if topic not in normalized:
+            normalized.append(topic)
+    return normalized
+
+
+class PushSubscriptionRegistry:
+    """푸시 구독 목록과 주제별 인덱스 (주제 -> endpoint)
+
+    알림 대상은 관련 주제의 인덱스만 합쳐서 찾으므로 전체 구독을 훑지 않습니다.
+    구독 등록/해제(이벤트 루프)와 알림 발송(푸시 스레드, 알림 묶음 타이머)이 동시에 접근하므로
+    변경과 조회는 락 안에서 하고, 조회 결과는 복사본으로 반환합니다.
+    """
+
+    def __init__(self, subscriptions: Optional[List[dict]] = None):
+        self._by_endpoint: Dict[str, dict] = {}
+        self._topic_index: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        self.replace_all(subscriptions or [])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._by_endpoint)
+
+    def upsert(self, subscription: dict) -> bool:
+        endpoint = subscription.get("endpoint")
+        if not endpoint:
+            return False
+
+        with self._lock:
+            self._remove(endpoint)
+            self._add(endpoint, subscription)
+        return True
+
+    def remove(self, endpoint: str) -> bool:
+        with self._lock:
+            return self._remove(endpoint)
+
+    def replace_all(self, subscriptions: List[dict]):
+        by_endpoint: Dict[str, dict] = {}
+        for subscription in subscriptions:
+            endpoint = subscription.get("endpoint")
+            if endpoint:
+                by_endpoint[endpoint] = subscription
+
+        with self._lock:
+            self._by_endpoint = {}
+            self._topic_index = {}
+            for endpoint, subscription in by_endpoint.items():
+                self._add(endpoint, subscription)
+
+    def all(self) -> List[dict]:
+        with self._lock:
+            return list(self._by_endpoint.values())
+
+    def for_topics(self, topics: Iterable[str]) -> List[dict]:
+        """주제 중 하나라도 구독한 구독 목록 (중복 없음)"""
+        with self._lock:
+            endpoints: Set[str] = set()
+            for topic in topics:
+                endpoints |= self._topic_index.get(topic, set())
+            return [self._by_endpoint[endpoint] for endpoint in endpoints]
+
+    def topic_counts(self) -> Dict[str, int]:
+        with self._lock:
+            return {topic: len(endpoints) for topic, endpoints in sorted(self._topic_index.items())}
+
+    def _add(self, endpoint: str, subscription: dict):
+        self._by_endpoint[endpoint] = subscription
+        for topic in subscription.get("topics") or [TOPIC_ALL]:
+            self._topic_index.setdefault(topic, set()).add(endpoint)
+
+    def _remove(self, endpoint: str) -> bool:
+        existing = self._by_endpoint.pop(endpoint, None)
+        if existing is None:
+            return False
+
+        for topic in existing.get("topics") or [TOPIC_ALL]:
+            endpoints = self._topic_index.get(topic)
+            if endpoints is None:
+                continue
+            endpoints.discard(endpoint)
+            if not endpoints:
+                del self._topic_index[topic]
+        return True
@@ -0,0 +1,119 @@
+from datetime import date
+from typing import Dict, List, Set, Tuple
+
+from menu_filters import is_dish_item
+from models import Menu
+
+MenuKey = Tuple[date, str, str]
+
+
+def normalize_dish_name(name: str) -> str:
+    """공백을 무시하고 소문자로 맞춘 검색용 메뉴 이름"""
+    return "".join(name.split()).lower()
+
+
+def _grams(text: str) -> Set[str]:
+    """한 글자와 두 글자 n-gram. 한글 메뉴 이름은 짧아서 bigram이면 부분 검색에 충분합니다."""
+    grams = set(text)
+    grams.update(text[index:index + 2] for index in range(len(text) - 1))
+    return grams
+
+
+class MenuSearchIndex:
+    """메뉴 항목 이름의 역색인 (n-gram -> 메뉴 이름 -> 제공된 메뉴 키)
+
+    MenuDatabase가 메뉴를 저장/삭제할 때 add()/remove()로 증분 갱신합니다.
+    검색은 질의의 n-gram 후보를 교집합으로 좁힌 뒤 부분 문자열로 확인하므로,
+    전체 메뉴 수가 아니라 후보 메뉴 이름 수에 비례합니다.
+
+    copy()는 내부 집합을 공유하는 복사본을 만들고, 복사본에서 처음 수정하는 집합만 복제합니다
+    (copy-on-write). 원본은 복사본의 수정에 영향을 받지 않습니다.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Set[str]] = {}
+        self._occurrences: Dict[str, Set[MenuKey]] = {}
+        self._display_names: Dict[str, str] = {}
+        self._owned_postings: Set[str] = set()
+        self._owned_occurrences: Set[str] = set()
+
+    def copy(self) -> "MenuSearchIndex":
+        clone = MenuSearchIndex()
+        clone._postings = dict(self._postings)
+        clone._occurrences = dict(self._occurrences)
+        clone._display_names = dict(self._display_names)
+        return clone
+
+    def _posting_for_write(self, gram: str) -> Set[str]:
+        if gram not in self._owned_postings:
+            self._postings[gram] = set(self._postings.get(gram, ()))
+            self._owned_postings.add(gram)
+        return self._postings[gram]
+
+    def _occurrences_for_write(self, normalized: str) -> Set[MenuKey]:
+        if normalized not in self._owned_occurrences:
+            self._occurrences[normalized] = set(self._occurrences.get(normalized, ()))
+            self._owned_occurrences.add(normalized)
+        return self._occurrences[normalized]
+
+    def add(self, key: MenuKey, menu: Menu):
+        for item in menu.items:
+            # '정보없음'/'미운영' 표시나 원산지 안내 문구는 메뉴가 아니므로 색인하지 않음
+            if not is_dish_item(item.name):
+                continue
+            normalized = normalize_dish_name(item.name)
+            if not normalized:
+                continue
+            if normalized not in self._occurrences:
+                for gram in _grams(normalized):
+                    self._posting_for_write(gram).add(normalized)
+            self._occurrences_for_write(normalized).add(key)
+            self._display_names[normalized] = item.name
+
+    def remove(self, key: MenuKey, menu: Menu):
+        for item in menu.items:
+            normalized = normalize_dish_name(item.name)
+            if key not in self._occurrences.get(normalized, ()):
+                continue
+            occurrences = self._occurrences_for_write(normalized)
+            occurrences.discard(key)
+            if occurrences:
+                continue
+
+            del self._occurrences[normalized]
+            self._owned_occurrences.discard(normalized)
+            self._display_names.pop(normalized, None)
+            for gram in _grams(normalized):
+                if gram not in self._postings:
+                    continue
+                names = self._posting_for_write(gram)
+                names.discard(normalized)
+                if not names:
+                    del self._postings[gram]
+                    self._owned_postings.discard(gram)
+
+    def search(self, query: str) -> List[Tuple[str, List[MenuKey]]]:
+        """질의를 포함하는 메뉴 이름과 그 메뉴가 나온 (날짜, 식당, 식사 타입) 목록을 반환합니다."""
+        normalized_query = normalize_dish_name(query)
+        if not normalized_query:
+            return []
+
+        if len(normalized_query) == 1:
+            grams = [normalized_query]
+        else:
+            grams = [normalized_query[index:index + 2] for index in range(len(normalized_query) - 1)]
+
+        candidates = None
+        for gram in sorted(set(grams), key=lambda item: len(self._postings.get(item, ()))):
+            names = self._postings.get(gram)
+            if not names:
+                return []
+            candidates = set(names) if candidates is None else candidates & names
+            if not candidates:
+                return []
+
+        return [
+            (self._display_names[name], sorted(self._occurrences[name]))
+            for name in sorted(candidates)
+            if normalized_query in name
+        ]
@@ -0,0 +1,140 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from models import MealType, Menu, Restaurant
+
+logger = logging.getLogger(__name__)
+
+# 크롤러가 따로 가져오는 소스 (서울은 조식/중식 페이지, 천안은 식당별 게시판 이미지)
+CRAWL_SOURCES = ("seoul_breakfast", "seoul_lunch", "cheonan_faculty", "cheonan_student")
+
+
+def source_of(restaurant, meal_type) -> str:
+    """메뉴가 어느 소스에서 왔는지"""
+    restaurant = Restaurant(restaurant)
+    if restaurant == Restaurant.CHEONAN_FACULTY:
+        return "cheonan_faculty"
+    if restaurant == Restaurant.CHEONAN_STUDENT:
+        return "cheonan_student"
+    return "seoul_breakfast" if MealType(meal_type) == MealType.BREAKFAST else "seoul_lunch"
+
+
+def content_hash(menus: Iterable[Menu]) -> str:
+    payload = sorted(
+        json.dumps(menu.model_dump(mode="json"), ensure_ascii=False, sort_keys=True)
+        for menu in menus
+    )
+    return hashlib.sha256("\n".join(payload).encode("utf-8")).hexdigest()[:16]
+
+
+def count_placeholders(menus: Iterable[Menu]) -> int:
+    """'정보없음' 대체 메뉴 수 (대체 메뉴 뒤에 게시판 안내 문구가 붙어 있을 수 있음)"""
+    return sum(
+        1 for menu in menus
+        if any(item.name.endswith("정보없음") for item in menu.items)
+    )
+
+
+class SourceFreshness:
+    """소스별·주차별 크롤링 신선도 (마지막 시도/성공 시각, 내용 해시, '정보없음' 대체 여부)
+
+    대체 메뉴를 썼거나 '정보없음' 칸이 있으면 degraded로 보고 degraded_retry초마다 다시 크롤링하고,
+    정상이면 소스별 주기(intervals)가 지났을 때만 다시 크롤링합니다. 지난 주의 정상 기록은 다시 크롤링하지 않습니다.
+    path를 지정하면 JSON 파일로 저장해 서버를 재시작해도 유지됩니다.
+    """
+
+    def __init__(
+        self,
+        intervals: Dict[str, float],
+        degraded_retry: float = 1800,
+        path: Optional[str] = None,
+        max_weeks: int = 12,
+    ):
+        self.intervals = intervals
+        self.degraded_retry = degraded_retry
+        self.path = path
+        self.max_weeks = max_weeks
+        self._entries: Dict[str, Dict[str, dict]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def get(self, source: str, monday: date) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(monday.isoformat(), {}).get(source)
+            return dict(entry) if entry else None
+
+    def record(self, source: str, monday: date, menus: List[Menu], fallback: bool, now: Optional[float] = None) -> dict:
+        """크롤링 결과를 기록하고 새 기록을 반환합니다. degraded이면 이전 성공 시각과 해시는 그대로 둡니다."""
+        now = now if now is not None else time.time()
+        placeholders = count_placeholders(menus)
+        degraded = fallback or placeholders > 0
+
+        with self._lock:
+            weeks = self._entries.setdefault(monday.isoformat(), {})
+            previous = weeks.get(source) or {}
+            entry = {
+                "lastAttempt": now,
+                "lastSuccess": previous.get("lastSuccess"),
+                "contentHash": previous.get("contentHash"),
+                "fallback": fallback,
+                "degraded": degraded,
+                "menus": len(menus),
+                "placeholders": placeholders,
+                "changed": False,
+            }
+            if not degraded:
+                digest = content_hash(menus)
+                entry.update(lastSuccess=now, contentHash=digest, changed=digest != previous.get("contentHash"))
+            weeks[source] = entry
+
+            # 오래된 주차부터 정리
+            for week in sorted(self._entries)[: max(len(self._entries) - self.max_weeks, 0)]:
+                del self._entries[week]
+            self._save()
+            return dict(entry)
+
+    def is_due(self, source: str, monday: date, now: Optional[float] = None, today: Optional[date] = None) -> bool:
+        now = now if now is not None else time.time()
+        today = today or date.today()
+        entry = self.get(source, monday)
+        if entry is None:
+            return True
+        if entry["degraded"]:
+            return now - entry["lastAttempt"] >= self.degraded_retry
+        if monday + timedelta(days=7) <= today:
+            return False
+        return now - entry["lastSuccess"] >= self.intervals.get(source, 0)
+
+    def due_sources(self, monday: date, now: Optional[float] = None, today: Optional[date] = None) -> List[str]:
+        return [source for source in CRAWL_SOURCES if self.is_due(source, monday, now, today)]
+
+    def week_status(self, monday: date) -> Dict[str, Optional[dict]]:
+        return {source: self.get(source, monday) for source in CRAWL_SOURCES}
+
+    def _load(self):
+        if not self.path:
+            return
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                self._entries = json.load(file)
+        except FileNotFoundError:
+            pass
+        except ValueError as error:
+            logger.warning(f"Source freshness file is corrupted, starting empty: {error}")
+
+    def _save(self):
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(self._entries, file, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,317 @@
+import gzip
+import json
+import logging
+import os
+import stat
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Set
+
+import anyio
+from fastapi import HTTPException
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import Scope
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+from cache_policy import CachePolicy, date_key, end_of_day, end_of_week, restaurant_key, week_key
+from models import DailyMenuResponse, Menu, MenuResponse, Restaurant
+
+logger = logging.getLogger(__name__)
+
+# 내보내기가 관리하는 하위 디렉토리 (이 아래에서 이번 내보내기에 없는 파일은 삭제)
+EXPORT_SUBDIRS = ("date", "week", "restaurant")
+MANIFEST_NAME = "manifest.json"
+
+# Accept-Encoding 협상 순서 (인코딩, 압축본 확장자)
+PRECOMPRESSED_VARIANTS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def _write_if_changed(path: str, content: bytes) -> bool:
+    """내용이 바뀐 경우에만 원본과 .gz/.br 압축본을 원자적으로 기록합니다."""
+    try:
+        with open(path, "rb") as file:
+            if file.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    variants = [(path, content), (f"{path}.gz", gzip.compress(content, compresslevel=9, mtime=0))]
+    if BROTLI_AVAILABLE:
+        variants.append((f"{path}.br", brotli.compress(content, quality=11)))
+
+    # 압축본을 먼저 쓰고 원본을 마지막에 교체해 원본 기준 비교가 항상 일관되도록 함
+    for variant_path, variant_content in reversed(variants):
+        tmp_path = f"{variant_path}.tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(variant_content)
+        os.replace(tmp_path, variant_path)
+    return True
+
+
+def _variant_paths(path: str) -> List[str]:
+    return [path, f"{path}.gz", f"{path}.br"]
+
+
+def _prune_stale_files(output_dir: str, keep: Set[str]) -> List[str]:
+    """keep에 없는 내보내기 파일(및 압축본, 남은 임시 파일)을 지우고 삭제한 원본 파일 경로를 반환합니다."""
+    removed = []
+    for subdir in EXPORT_SUBDIRS:
+        root_dir = os.path.join(output_dir, subdir)
+        for current_dir, _, filenames in os.walk(root_dir, topdown=False):
+            for filename in filenames:
+                path = os.path.join(current_dir, filename)
+                if path in keep:
+                    continue
+                os.remove(path)
+                if filename.endswith(".json"):
+                    removed.append(path)
+            if current_dir != root_dir and not os.listdir(current_dir):
+                os.rmdir(current_dir)
+    return removed
+
+
+def _relative_url_path(output_dir: str, path: str) -> str:
+    return os.path.relpath(path, output_dir).replace(os.sep, "/")
+
+
+def list_export_files(output_dir: str) -> List[str]:
+    """내보낸 원본 JSON 파일(압축본 제외)의 상대 경로 목록"""
+    paths = []
+    for subdir in EXPORT_SUBDIRS:
+        for current_dir, _, filenames in os.walk(os.path.join(output_dir, subdir)):
+            paths.extend(
+                _relative_url_path(output_dir, os.path.join(current_dir, filename))
+                for filename in filenames
+                if filename.endswith(".json")
+            )
+    if os.path.exists(os.path.join(output_dir, MANIFEST_NAME)):
+        paths.append(MANIFEST_NAME)
+    return sorted(paths)
+
+
+class StaticPublisher:
+    """내보낸 파일을 CDN/정적 호스팅 원본에 PUT/DELETE로 올립니다 (Bunny Storage, R2 업로드 워커, WebDAV 등).
+
+    처음 올릴 때와 직전 업로드가 실패한 뒤에는 전체 파일을, 그 밖에는 바뀐 파일만 올립니다.
+    압축은 CDN이 Accept-Encoding에 맞춰 처리하므로 원본 JSON만 올립니다.
+    """
+
+    def __init__(self, base_url: str, token: str = "", cache_control: str = "", timeout: float = 10):
+        self.base_url = base_url.rstrip("/")
+        self.token = token
+        self.cache_control = cache_control
+        self.timeout = timeout
+        self._synced = False
+
+    def publish(self, output_dir: str, changed: List[str], removed: List[str]) -> int:
+        """바뀐/삭제된 파일(output_dir 기준 상대 경로)을 반영하고 요청한 파일 수를 반환합니다. 실패하면 -1."""
+        import requests
+
+        if not self._synced:
+            changed, removed = list_export_files(output_dir), []
+        if not changed and not removed:
+            return 0
+
+        headers = {}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        try:
+            with requests.Session() as session:
+                for path in changed:
+                    with open(os.path.join(output_dir, path), "rb") as file:
+                        content = file.read()
+                    put_headers = {**headers, "Content-Type": "application/json"}
+                    if self.cache_control:
+                        put_headers["Cache-Control"] = self.cache_control
+                    response = session.put(f"{self.base_url}/{path}", data=content, headers=put_headers, timeout=self.timeout)
+                    response.raise_for_status()
+                for path in removed:
+                    response = session.delete(f"{self.base_url}/{path}", headers=headers, timeout=self.timeout)
+                    if response.status_code != 404:
+                        response.raise_for_status()
+        except Exception as error:
+            # 일부만 올라갔을 수 있으므로 다음 갱신 때 전체를 다시 올림
+            self._synced = False
+            logger.warning(f"Static snapshot publish to {self.base_url} failed: {error}")
+            return -1
+
+        self._synced = True
+        logger.info(f"Static snapshot published: {len(changed)} uploaded, {len(removed)} deleted")
+        return len(changed) + len(removed)
+
+
+def _encode(response) -> bytes:
+    return response.model_dump_json().encode("utf-8")
+
+
+def export_static_snapshot(menus: List[Menu], output_dir: str, publisher: Optional[StaticPublisher] = None) -> int:
+    """API 응답과 같은 형태의 정적 JSON 파일을 날짜/주/식당별로 기록합니다.
+
+    - date/{YYYY-MM-DD}.json: /api/menus/date/{date}
+    - week/{월요일}.json: /api/menus/week?target_date={월요일}
+    - restaurant/{식당}/{YYYY-MM-DD}.json: /api/menus/restaurant/{식당}?target_date={date}
+
+    각 파일 옆에 .gz(및 brotli 설치 시 .br) 압축본을 함께 둡니다.
+    저장소에서 사라진 날짜/주/식당의 파일은 삭제합니다. 기록하거나 삭제한 파일 수를 반환합니다.
+    publisher를 주면 바뀐/삭제된 파일을 CDN 원본에도 반영합니다.
+    """
+    by_date: Dict[date, List[Menu]] = {}
+    for menu in menus:
+        by_date.setdefault(menu.date, []).append(menu)
+
+    keep: Set[str] = set()
+    changed: List[str] = []
+
+    def write(path: str, response) -> bool:
+        keep.update(_variant_paths(path))
+        if not _write_if_changed(path, _encode(response)):
+            return False
+        changed.append(path)
+        return True
+
+    written = 0
+    weeks: Dict[date, List[Menu]] = {}
+    for menu_date, daily_menus in sorted(by_date.items()):
+        daily = DailyMenuResponse(
+            success=True,
+            date=menu_date,
+            menus=daily_menus,
+            message=f"총 {len(daily_menus)}개의 메뉴",
+        )
+        written += write(os.path.join(output_dir, "date", f"{menu_date.isoformat()}.json"), daily)
+
+        by_restaurant: Dict[str, List[Menu]] = {}
+        for menu in daily_menus:
+            by_restaurant.setdefault(menu.restaurant, []).append(menu)
+        for restaurant, restaurant_menus in by_restaurant.items():
+            response = MenuResponse(
+                success=True,
+                data=restaurant_menus,
+                message=f"{restaurant} 메뉴 {len(restaurant_menus)}개",
+            )
+            path = os.path.join(output_dir, "restaurant", restaurant, f"{menu_date.isoformat()}.json")
+            written += write(path, response)
+
+        if menu_date.weekday() < 5:
+            monday = menu_date - timedelta(days=menu_date.weekday())
+            weeks.setdefault(monday, []).extend(daily_menus)
+
+    for monday, weekly_menus in weeks.items():
+        friday = monday + timedelta(days=4)
+        weekly = MenuResponse(
+            success=True,
+            data=weekly_menus,
+            message=f"{monday} ~ {friday} 메뉴 {len(weekly_menus)}개",
+        )
+        written += write(os.path.join(output_dir, "week", f"{monday.isoformat()}.json"), weekly)
+
+    removed = _prune_stale_files(output_dir, keep)
+    written += len(removed)
+
+    manifest = {
+        "generatedAt": datetime.now().isoformat(),
+        "dates": [menu_date.isoformat() for menu_date in sorted(by_date)],
+        "weeks": [monday.isoformat() for monday in sorted(weeks)],
+    }
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    if written:
+        _write_if_changed(manifest_path, json.dumps(manifest, ensure_ascii=False).encode("utf-8"))
+        changed.append(manifest_path)
+
+    logger.info(f"Static snapshot export: {written} files updated in {output_dir}")
+    if publisher is not None:
+        publisher.publish(
+            output_dir,
+            [_relative_url_path(output_dir, path) for path in changed],
+            [_relative_url_path(output_dir, path) for path in removed],
+        )
+    return written
+
+
+def _accepted_encodings(value: str) -> Set[str]:
+    """Accept-Encoding 헤더에서 허용된(q > 0) 인코딩 이름"""
+    accepted = set()
+    for part in value.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, number = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(number)
+                except ValueError:
+                    quality = 0.0
+        if name and quality > 0:
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+class StaticMenuFiles(StaticFiles):
+    """내보낸 정적 파일을 API 응답과 같은 Cache-Control/Expires/surrogate key 헤더로 제공합니다.
+
+    JSON 요청은 Accept-Encoding에 맞춰 .br/.gz 압축본을 Content-Encoding과 함께 보냅니다.
+    """
+
+    def __init__(self, *args, cache_policy: CachePolicy, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_policy = cache_policy
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if path.endswith((".gz", ".br")):
+            # 압축본은 Content-Encoding을 붙일 수 있는 원본 경로의 협상으로만 제공
+            raise HTTPException(status_code=404)
+
+        response = None
+        if path.endswith(".json"):
+            response = await self._precompressed_response(path, scope)
+        if response is None:
+            response = await super().get_response(path, scope)
+        if path.endswith(".json"):
+            response.headers["Vary"] = "Accept-Encoding"
+        if response.status_code in (200, 304):
+            cache = static_cache_rule(path)
+            if cache is None:
+                self.cache_policy.apply_no_store(response)
+            else:
+                self.cache_policy.apply(response, *cache)
+        return response
+
+    async def _precompressed_response(self, path: str, scope: Scope) -> Optional[Response]:
+        if scope["method"] not in ("GET", "HEAD"):
+            return None
+        accepted = _accepted_encodings(Headers(scope=scope).get("accept-encoding", ""))
+        for encoding, suffix in PRECOMPRESSED_VARIANTS:
+            if encoding not in accepted:
+                continue
+            full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path + suffix)
+            if stat_result and stat.S_ISREG(stat_result.st_mode):
+                response = self.file_response(full_path, stat_result, scope)
+                response.headers["Content-Encoding"] = encoding
+                return response
+        return None
+
+
+def static_cache_rule(path: str) -> Optional[tuple]:
+    """정적 파일 경로에 해당하는 API 응답의 (유효 기간 끝, surrogate key). 메뉴 파일이 아니면 None."""
+    parts = path.replace(os.sep, "/").strip("/").split("/")
+    name = parts[-1]
+    if not name.endswith(".json"):
+        return None
+    try:
+        file_date = date.fromisoformat(name.removesuffix(".json"))
+        if len(parts) == 2 and parts[0] == "date":
+            return end_of_day(file_date), [date_key(file_date), week_key(file_date)]
+        if len(parts) == 2 and parts[0] == "week":
+            return end_of_week(file_date), [week_key(file_date)]
+        if len(parts) == 3 and parts[0] == "restaurant":
+            return end_of_day(file_date), [date_key(file_date), restaurant_key(Restaurant(parts[1]))]
+    except ValueError:
+        return None
+    return None
@@ -0,0 +1,55 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCHMARKS_DIR = os.path.join(BACKEND_DIR, "benchmarks")
+sys.path.insert(0, BACKEND_DIR)
+
+import main  # noqa: E402
+from admission import CrawlAdmission  # noqa: E402
+from database import MenuDatabase  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+
+@pytest.fixture
+def fresh_db(monkeypatch):
+    """테스트마다 빈 메뉴 저장소 (startup 크롤링은 실행하지 않음)"""
+    database = MenuDatabase()
+    monkeypatch.setattr(main, "db", database)
+    monkeypatch.setattr(main, "crawl_admission", CrawlAdmission(
+        past_days=main.crawl_admission.past_days,
+        future_days=main.crawl_admission.future_days,
+    ))
+    return database
+
+
+@pytest.fixture
+def client(fresh_db):
+    # with 블록 없이 만들면 startup 이벤트(시작 크롤링)가 실행되지 않음
+    return TestClient(main.app)
+
+
+def _load_benchmark(name: str):
+    """benchmarks/ 스크립트를 sys.path를 바꾸지 않고 모듈로 불러옵니다."""
+    spec = importlib.util.spec_from_file_location(
+        f"benchmarks_{name}", os.path.join(BENCHMARKS_DIR, f"{name}.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def loadtest():
+    """benchmarks/loadtest.py (스텁 업스트림 서버와 크롤링 시나리오)"""
+    return _load_benchmark("loadtest")
+
+
+@pytest.fixture(scope="session")
+def ocr_tuning():
+    """benchmarks/ocr_tuning.py (설정 조합 펼치기, 채점, 내보내기)"""
+    return _load_benchmark("ocr_tuning")
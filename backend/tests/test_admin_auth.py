@@ -0,0 +1,110 @@
+from datetime import date, timedelta
+
+import pytest
+
+import main
+from models import MealType, Menu, MenuItem, Restaurant
+
+ADMIN_READ_ROUTES = [
+    "/api/admin/crawls",
+    "/api/admin/crawls/unknown",
+    "/api/admin/crawls/unknown/timeline",
+    "/api/admin/freshness",
+]
+
+
+@pytest.mark.parametrize("path", ADMIN_READ_ROUTES)
+def test_admin_routes_are_closed_without_configured_token(client, monkeypatch, path):
+    monkeypatch.setattr(main, "ADMIN_TOKEN", "")
+
+    assert client.get(path).status_code == 503
+    assert client.get(path, headers={"X-Admin-Token": ""}).status_code == 503
+
+
+@pytest.mark.parametrize("path", ADMIN_READ_ROUTES)
+def test_admin_routes_require_matching_token(client, monkeypatch, path):
+    monkeypatch.setattr(main, "ADMIN_TOKEN", "secret")
+
+    assert client.get(path).status_code == 401
+    assert client.get(path, headers={"X-Admin-Token": "wrong"}).status_code == 401
+
+
+def test_admin_crawls_with_token(client, monkeypatch):
+    monkeypatch.setattr(main, "ADMIN_TOKEN", "secret")
+
+    response = client.get("/api/admin/crawls", headers={"X-Admin-Token": "secret"})
+
+    assert response.status_code == 200
+    assert response.json()["success"] is True
+
+
+def _import_body() -> bytes:
+    menu = Menu(
+        date=date(2026, 10, 12),
+        restaurant=Restaurant.SEOUL_STUDENT,
+        meal_type=MealType.LUNCH,
+        items=[MenuItem(name="덮어쓴 메뉴")],
+    )
+    return (menu.model_dump_json() + "\n").encode("utf-8")
+
+
+@pytest.mark.parametrize("configured_token, sent_token, status", [
+    ("", None, 503),
+    ("", "", 503),
+    ("secret", None, 401),
+    ("secret", "wrong", 401),
+])
+def test_unauthenticated_import_is_rejected(client, fresh_db, monkeypatch, configured_token, sent_token, status):
+    monkeypatch.setattr(main, "ADMIN_TOKEN", configured_token)
+    headers = {"X-Admin-Token": sent_token} if sent_token is not None else {}
+
+    response = client.post("/api/menus/import", content=_import_body(), headers=headers)
+
+    assert response.status_code == status
+    assert fresh_db.menus == []
+
+
+def test_import_with_token(client, fresh_db, monkeypatch):
+    monkeypatch.setattr(main, "ADMIN_TOKEN", "secret")
+    monkeypatch.setattr(main, "STATIC_EXPORT_DIR", "")
+    monkeypatch.setattr(main, "SNAPSHOT_PATH", "")
+
+    response = client.post("/api/menus/import", content=_import_body(), headers={"X-Admin-Token": "secret"})
+
+    assert response.status_code == 200
+    assert response.json()["imported"] == 1
+    assert [menu.items[0].name for menu in fresh_db.menus] == ["덮어쓴 메뉴"]
+
+
+def test_imported_history_survives_retention_sweep(client, fresh_db, monkeypatch):
+    monkeypatch.setattr(main, "ADMIN_TOKEN", "secret")
+    monkeypatch.setattr(main, "STATIC_EXPORT_DIR", "")
+    monkeypatch.setattr(main, "SNAPSHOT_PATH", "")
+    today = date.today()
+    old_day = today - timedelta(days=90)
+    crawled_old_day = today - timedelta(days=30)
+    fresh_db.save_menus([Menu(date=crawled_old_day, restaurant=Restaurant.SEOUL_STUDENT, meal_type=MealType.LUNCH, items=[MenuItem(name="오래된 크롤링")])])
+    history = Menu(date=old_day, restaurant=Restaurant.SEOUL_STUDENT, meal_type=MealType.LUNCH, items=[MenuItem(name="비빔밥")])
+    response = client.post(
+        "/api/menus/import",
+        content=(history.model_dump_json() + "\n").encode("utf-8"),
+        headers={"X-Admin-Token": "secret"},
+    )
+    assert response.json()["imported"] == 1
+
+    fresh = Menu(date=today, restaurant=Restaurant.SEOUL_STUDENT, meal_type=MealType.LUNCH, items=[MenuItem(name="카레")])
+    monkeypatch.setattr(main, "due_sources", lambda monday: ["seoul_lunch"])
+    monkeypatch.setattr(main, "collect_source_menus", lambda monday, results, replace: [fresh])
+    monkeypatch.setattr(main, "_crawler", type("Crawler", (), {"crawl_sources": lambda self, *args: {}})())
+    main.update_menus(today, False)
+
+    stored = {menu.date for menu in fresh_db.menus}
+    assert old_day in stored
+    assert crawled_old_day not in stored
+    assert today in stored
+    assert [name for name, _ in fresh_db.search_menus("비빔밥")] == ["비빔밥"]
+
+    restored = type(fresh_db)()
+    restored.load_state(fresh_db.dump_state())
+    restored.clear_old_menus(today + timedelta(days=1))
+    assert {menu.date for menu in restored.menus} == {old_day}
@@ -0,0 +1,69 @@
+from datetime import date, timedelta
+
+from starlette.requests import Request
+
+import main
+
+
+def make_request(forwarded_for=None, client_host="10.0.0.9") -> Request:
+    headers = [(b"x-forwarded-for", forwarded_for.encode())] if forwarded_for else []
+    return Request({"type": "http", "headers": headers, "client": (client_host, 1234)})
+
+
+def test_client_key_ignores_forwarded_for_without_trusted_proxies(monkeypatch):
+    monkeypatch.setattr(main, "TRUSTED_PROXY_COUNT", 0)
+
+    assert main._client_key(make_request("1.2.3.4")) == "10.0.0.9"
+
+
+def test_client_key_uses_hop_appended_by_trusted_proxy(monkeypatch):
+    monkeypatch.setattr(main, "TRUSTED_PROXY_COUNT", 1)
+
+    # 클라이언트가 보낸 값(spoofed)은 왼쪽, 프록시가 덧붙인 실제 주소는 오른쪽
+    assert main._client_key(make_request("6.6.6.6, 203.0.113.7")) == "203.0.113.7"
+    assert main._client_key(make_request("7.7.7.7, 203.0.113.7")) == "203.0.113.7"
+
+
+def test_rotating_forwarded_for_does_not_bypass_rate_limit(client, monkeypatch):
+    monkeypatch.setattr(main, "TRUSTED_PROXY_COUNT", 0)
+    queued = []
+    monkeypatch.setattr(main, "trigger_update_menus", lambda target_date, notify: queued.append(target_date) or True)
+
+    target = date.today() - timedelta(days=1)
+    for index in range(5):
+        client.get(f"/api/menus/date/{target.isoformat()}", headers={"X-Forwarded-For": f"198.51.100.{index}"})
+
+    assert len(queued) == main.crawl_admission.burst
+
+
+def test_past_window_does_not_exceed_retention():
+    assert main.crawl_admission.past_days <= main.MENU_RETENTION_DAYS
+    reason = main.crawl_admission.check(date.today() - timedelta(days=main.MENU_RETENTION_DAYS + 1), "client")
+    assert reason == "out_of_window"
+
+
+def test_retry_while_week_is_crawling_reports_updating_without_spending_tokens(client, monkeypatch):
+    target = date.today()
+    monday = target - timedelta(days=target.weekday())
+    monkeypatch.setattr(main, "_pending_crawls", main.OrderedDict())
+    monkeypatch.setattr(main, "_current_crawl_week", monday)
+
+    for _ in range(main.crawl_admission.burst + 3):
+        body = client.get(f"/api/menus/date/{target.isoformat()}").json()
+        assert body["success"] is False
+        assert body["message"] is None
+
+    # 토큰이 남아 있으므로 다른 주 요청은 그대로 허용
+    assert main.crawl_admission.check(target + timedelta(days=7), "testclient") is None
+
+
+def test_queued_week_gains_notification_without_spending_tokens(client, monkeypatch):
+    target = date.today()
+    monday = target - timedelta(days=target.weekday())
+    monkeypatch.setattr(main, "_pending_crawls", main.OrderedDict({monday: (target, False, False)}))
+    monkeypatch.setattr(main, "_current_crawl_week", None)
+
+    for _ in range(main.crawl_admission.burst + 1):
+        assert client.get("/api/menus/today").json()["message"] is None
+
+    assert main._pending_crawls[monday] == (target, True, False)
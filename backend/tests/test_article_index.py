@@ -0,0 +1,114 @@
+from datetime import date, timedelta
+
+import pytest
+
+from article_index import ArticleIndex
+from crawler import SMUCafeteriaCrawler
+
+MONDAY = date(2026, 10, 12)
+TITLE = "주간 메뉴 (2026.10.12~10.16)"
+DAY_TEXTS = [["흑미밥", "김치찌개"] for _ in range(5)]
+
+
+class FakeResponse:
+    def __init__(self, status_code, text="", headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+def article_page(image: str) -> str:
+    return (
+        f'<div id="jwxe_main_content"><h4>{TITLE}</h4></div>'
+        f'<div class="fr-view"><img src="/images/{image}.jpg"></div>'
+    )
+
+
+class ArticleSite:
+    """게시판 목록 조회, 게시글 요청 헤더, 이미지 OCR 횟수를 기록하는 게시판 대역"""
+
+    def __init__(self, crawler: SMUCafeteriaCrawler):
+        self.board_lookups = 0
+        self.ocr_runs = 0
+        self.article_headers = []
+        self.image = "week42"
+        self.etag = '"v1"'
+        self.day_texts = DAY_TEXTS
+        crawler._get_with_retry = self.get
+        crawler._extract_weekly_menu_texts_from_images = self.ocr
+
+    def find_article_url(self, target_date):
+        self.board_lookups += 1
+        return "https://example.com/article/faculty?mode=view"
+
+    def get(self, url, headers=None, **kwargs):
+        self.article_headers.append(headers or {})
+        if headers and headers.get("If-None-Match") == self.etag:
+            return FakeResponse(304)
+        return FakeResponse(200, article_page(self.image), {"ETag": self.etag})
+
+    def ocr(self, image_urls):
+        self.ocr_runs += 1
+        return self.day_texts
+
+
+@pytest.fixture
+def crawler(tmp_path):
+    crawler = SMUCafeteriaCrawler()
+    crawler.article_index = ArticleIndex(str(tmp_path / "article_index.json"))
+    return crawler
+
+
+def load(crawler, site):
+    return crawler._load_cheonan_article("cheonan_faculty", MONDAY + timedelta(days=2), site.find_article_url, "missing")
+
+
+def test_known_week_is_revalidated_without_board_or_images(crawler):
+    site = ArticleSite(crawler)
+
+    week_dates, day_texts = load(crawler, site)
+    assert week_dates[0] == MONDAY and day_texts == DAY_TEXTS
+    assert (site.board_lookups, site.ocr_runs) == (1, 1)
+    assert site.article_headers[0] == {}
+
+    # 게시글이 그대로면 304를 받고 저장된 OCR 결과를 씀
+    assert load(crawler, site) == (week_dates, DAY_TEXTS)
+    assert (site.board_lookups, site.ocr_runs) == (1, 1)
+    assert site.article_headers[-1] == {"If-None-Match": '"v1"'}
+
+    # 게시글이 바뀌어도 이미지가 같으면 OCR을 다시 하지 않음
+    site.etag = '"v2"'
+    assert load(crawler, site)[1] == DAY_TEXTS
+    assert site.ocr_runs == 1
+
+    # 이미지가 바뀌면 다시 OCR
+    site.etag = '"v3"'
+    site.image = "week42-fixed"
+    load(crawler, site)
+    assert site.ocr_runs == 2
+
+
+def test_index_survives_restart(crawler, tmp_path):
+    site = ArticleSite(crawler)
+    load(crawler, site)
+
+    restarted = SMUCafeteriaCrawler()
+    restarted.article_index = ArticleIndex(str(tmp_path / "article_index.json"))
+    restarted_site = ArticleSite(restarted)
+    assert load(restarted, restarted_site)[1] == DAY_TEXTS
+    assert (restarted_site.board_lookups, restarted_site.ocr_runs) == (0, 0)
+
+
+def test_degraded_ocr_is_not_reused(crawler):
+    site = ArticleSite(crawler)
+    site.day_texts = [["중식정보없음"]] * 5
+    load(crawler, site)
+
+    load(crawler, site)
+    assert site.ocr_runs == 2
+    assert site.article_headers[-1] == {}
+    assert site.board_lookups == 1
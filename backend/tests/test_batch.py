@@ -0,0 +1,83 @@
+from datetime import date
+
+import msgpack
+
+import main
+from models import MealType, Menu, MenuItem, Restaurant
+from wire_format import MSGPACK_MEDIA_TYPE
+
+MONDAY = date(2026, 10, 12)
+TUESDAY = date(2026, 10, 13)
+WEDNESDAY = date(2026, 10, 14)
+
+
+def seed(database):
+    database.save_menus([
+        Menu(date=MONDAY, restaurant=Restaurant.SEOUL_STUDENT, meal_type=MealType.LUNCH,
+             items=[MenuItem(name="김치찌개"), MenuItem(name="돈까스", price=5500)]),
+        Menu(date=MONDAY, restaurant=Restaurant.CHEONAN_STUDENT, meal_type=MealType.DINNER,
+             items=[MenuItem(name="카레")]),
+        Menu(date=TUESDAY, restaurant=Restaurant.SEOUL_STUDENT, meal_type=MealType.BREAKFAST,
+             items=[MenuItem(name="토스트")]),
+    ])
+
+
+def test_batch_groups_menus_and_reports_missing_weekdays(client, fresh_db, monkeypatch):
+    seed(fresh_db)
+    requested = []
+    monkeypatch.setattr(main, "trigger_update_on_miss", lambda target_date, request: requested.append(target_date))
+
+    response = client.get("/api/menus/batch", params={"dates": f"{MONDAY}~{WEDNESDAY}"})
+
+    body = response.json()
+    assert body["data"] == {
+        "2026-10-12": {
+            "서울_학생식당": {"lunch": ["김치찌개", ["돈까스", 5500, None]]},
+            "천안_학생식당": {"dinner": ["카레"]},
+        },
+        "2026-10-13": {"서울_학생식당": {"breakfast": ["토스트"]}},
+    }
+    assert body["missingDates"] == ["2026-10-14"]
+    assert requested == [WEDNESDAY]
+    assert response.headers["cache-control"] == "no-store"
+
+
+def test_batch_filters_and_caches_complete_answers(client, fresh_db):
+    seed(fresh_db)
+
+    response = client.get("/api/menus/batch", params=[
+        ("dates", f"{MONDAY},{TUESDAY}"),
+        ("restaurants", Restaurant.SEOUL_STUDENT.value),
+        ("meal_types", "lunch"),
+    ])
+
+    body = response.json()
+    assert body["data"] == {"2026-10-12": {"서울_학생식당": {"lunch": ["김치찌개", ["돈까스", 5500, None]]}}}
+    assert body["missingDates"] == []
+    assert "s-maxage" in response.headers["cache-control"]
+    assert set(response.headers["surrogate-key"].split()) == {"menus", "date-2026-10-12", "date-2026-10-13"}
+
+
+def test_batch_serves_msgpack_on_request(client, fresh_db):
+    seed(fresh_db)
+
+    response = client.get(
+        "/api/menus/batch",
+        params={"dates": str(MONDAY)},
+        headers={"Accept": MSGPACK_MEDIA_TYPE},
+    )
+
+    assert response.headers["content-type"] == MSGPACK_MEDIA_TYPE
+    payload = msgpack.unpackb(response.content, raw=False)
+    assert payload["success"] is True
+    assert len(payload["data"]) == 2
+
+
+def test_batch_rejects_bad_ranges(client, fresh_db, monkeypatch):
+    monkeypatch.setattr(main, "BATCH_MAX_DAYS", 5)
+    monkeypatch.setattr(main, "trigger_update_on_miss", lambda target_date, request: False)
+
+    assert client.get("/api/menus/batch", params={"dates": "2026-10-32"}).status_code == 400
+    assert client.get("/api/menus/batch", params={"dates": f"{TUESDAY}~{MONDAY}"}).status_code == 400
+    assert client.get("/api/menus/batch", params={"dates": "2026-10-01~2026-10-06"}).status_code == 400
+    assert client.get("/api/menus/batch", params={"dates": "2026-10-01~2026-10-05"}).status_code == 200
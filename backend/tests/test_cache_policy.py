@@ -0,0 +1,111 @@
+from datetime import date, datetime, time, timedelta
+from email.utils import parsedate_to_datetime
+
+import pytest
+
+import main
+from cache_policy import CachePolicy
+from models import MealType, Menu, MenuItem, Restaurant
+
+MONDAY = date(2026, 10, 12)
+
+
+def make_menu(menu_date: date, restaurant: Restaurant, name: str) -> Menu:
+    return Menu(date=menu_date, restaurant=restaurant, meal_type=MealType.LUNCH, items=[MenuItem(name=name)])
+
+
+def test_expiry_is_earliest_of_day_end_update_time_and_max_age():
+    policy = CachePolicy(update_times=[time(6, 30), time(10, 0)], max_age=3600)
+    now = datetime(2026, 10, 12, 9, 30)
+
+    assert policy.expires_at(datetime(2026, 10, 13), now) == datetime(2026, 10, 12, 10, 0)
+    assert policy.expires_at(datetime(2026, 10, 12, 9, 45), now) == datetime(2026, 10, 12, 9, 45)
+    assert CachePolicy(max_age=600).expires_at(None, now) == now + timedelta(seconds=600)
+    late = datetime(2026, 10, 12, 22, 0)
+    assert policy.next_update(late) == datetime(2026, 10, 13, 6, 30)
+
+
+@pytest.fixture
+def policy(monkeypatch):
+    policy = CachePolicy(max_age=3600, browser_max_age=300, purge_url="https://cdn.example.com/purge")
+    monkeypatch.setattr(main, "cache_policy", policy)
+    return policy
+
+
+def test_menu_response_headers(client, fresh_db, policy):
+    today = date.today()
+    fresh_db.save_menus([make_menu(today, Restaurant.SEOUL_STUDENT, "카레")])
+
+    response = client.get(f"/api/menus/date/{today.isoformat()}")
+
+    monday = today - timedelta(days=today.weekday())
+    assert response.headers["cache-control"].startswith("public, max-age=300, s-maxage=")
+    s_maxage = int(response.headers["cache-control"].split("s-maxage=")[1].split(",")[0])
+    until_midnight = (datetime.combine(today + timedelta(days=1), time.min) - datetime.now()).total_seconds()
+    assert abs(s_maxage - min(3600, until_midnight)) <= 2
+    expires = parsedate_to_datetime(response.headers["expires"])
+    assert abs((expires - datetime.now(expires.tzinfo)).total_seconds() - s_maxage) <= 2
+    assert response.headers["surrogate-key"] == f"date-{today.isoformat()} menus week-{monday.isoformat()}"
+    assert response.headers["cache-tag"] == f"date-{today.isoformat()},menus,week-{monday.isoformat()}"
+
+
+def test_restaurant_and_empty_responses(client, fresh_db, policy, monkeypatch):
+    today = date.today()
+    fresh_db.save_menus([make_menu(today, Restaurant.CHEONAN_STUDENT, "카레")])
+    monkeypatch.setattr(main, "trigger_update_on_miss", lambda target_date, request: True)
+
+    response = client.get(f"/api/menus/restaurant/{Restaurant.CHEONAN_STUDENT.value}")
+    assert response.headers["surrogate-key"] == f"date-{today.isoformat()} menus restaurant-cheonan_student"
+
+    response = client.get(f"/api/menus/date/{(today + timedelta(days=1)).isoformat()}")
+    assert response.headers["cache-control"] == "no-store"
+    assert "surrogate-key" not in response.headers
+
+
+def test_update_purges_exactly_the_changed_day(fresh_db, policy, monkeypatch):
+    monkeypatch.setattr(main, "STATIC_EXPORT_DIR", "")
+    monkeypatch.setattr(main, "SNAPSHOT_PATH", "")
+    purged = []
+    monkeypatch.setattr(policy, "purge", lambda keys: purged.append(set(keys)) or True)
+    wednesday = MONDAY + timedelta(days=2)
+    fresh_db.save_menus([
+        make_menu(MONDAY + timedelta(days=offset), Restaurant.SEOUL_STUDENT, "카레") for offset in range(5)
+    ])
+
+    # 같은 주를 다시 크롤링했는데 수요일 메뉴만 바뀐 경우
+    crawled = [
+        make_menu(MONDAY + timedelta(days=offset), Restaurant.SEOUL_STUDENT, "비빔밥" if offset == 2 else "카레")
+        for offset in range(5)
+    ]
+    monkeypatch.setattr(main, "due_sources", lambda monday: ["seoul_lunch"])
+    monkeypatch.setattr(main, "collect_source_menus", lambda monday, results, replace: crawled)
+    monkeypatch.setattr(main, "_crawler", type("Crawler", (), {"crawl_sources": lambda self, *args: {}})())
+    monkeypatch.setattr(main, "MENU_RETENTION_DAYS", 10000)
+
+    main.update_menus(MONDAY, False)
+
+    assert purged == [{f"date-{wednesday.isoformat()}", f"week-{MONDAY.isoformat()}", "restaurant-seoul_student"}]
+
+    # 바뀐 것이 없으면 purge하지 않음
+    main.update_menus(MONDAY, False)
+    assert len(purged) == 1
+
+
+def test_purge_posts_keys_to_hook(monkeypatch):
+    import requests
+
+    sent = []
+
+    class FakeResponse:
+        def raise_for_status(self):
+            pass
+
+    monkeypatch.setattr(requests, "post", lambda url, data, headers, timeout: sent.append((url, data, headers)) or FakeResponse())
+    policy = CachePolicy(purge_url="https://cdn.example.com/purge", purge_token="token")
+
+    assert policy.purge(["week-2026-10-12", "date-2026-10-14", "date-2026-10-14"])
+    assert sent == [(
+        "https://cdn.example.com/purge",
+        '{"keys": ["date-2026-10-14", "week-2026-10-12"]}',
+        {"Content-Type": "application/json", "Authorization": "Bearer token"},
+    )]
@@ -0,0 +1,41 @@
+import threading
+from datetime import date
+
+from coalescer import NotificationCoalescer
+
+MONDAY = date(2026, 10, 12)
+TUESDAY = date(2026, 10, 13)
+
+
+def test_burst_is_merged_into_one_flush():
+    sent = []
+    coalescer = NotificationCoalescer(sent.append, debounce=60, max_delay=60)
+    coalescer.add({"menu": [MONDAY]})
+    coalescer.add({"menu": [TUESDAY], "서울_학생식당": [MONDAY]})
+    assert sent == []
+
+    coalescer.flush_now()
+    assert sent == [{"menu": {MONDAY, TUESDAY}, "서울_학생식당": {MONDAY}}]
+
+    coalescer.flush_now()
+    assert len(sent) == 1
+
+
+def test_timer_sends_after_debounce():
+    flushed = threading.Event()
+    sent = []
+
+    def flush(pending):
+        sent.append(pending)
+        flushed.set()
+
+    coalescer = NotificationCoalescer(flush, debounce=0.05, max_delay=1)
+    coalescer.add({"menu": [MONDAY]})
+    assert flushed.wait(2)
+    assert sent == [{"menu": {MONDAY}}]
+
+
+def test_zero_debounce_sends_immediately():
+    sent = []
+    NotificationCoalescer(sent.append, debounce=0).add({"menu": [MONDAY]})
+    assert sent == [{"menu": {MONDAY}}]
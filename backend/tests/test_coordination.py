@@ -0,0 +1,31 @@
+from datetime import date
+
+import main
+from coordination import CrawlLeader
+
+
+def test_follower_miss_reports_update_in_progress(client, monkeypatch, tmp_path):
+    leader = CrawlLeader(str(tmp_path))
+    assert leader.try_acquire()
+    follower = CrawlLeader(str(tmp_path))
+    monkeypatch.setattr(main, "crawl_leader", follower)
+
+    response = client.get(f"/api/menus/date/{date.today().isoformat()}")
+
+    body = response.json()
+    assert body["success"] is False
+    # message가 없으면 업데이트 중 (클라이언트가 잠시 후 재시도)
+    assert body["message"] is None
+    assert follower.pop_request() == (date.today(), True, False)
+    leader.release()
+
+
+def test_follower_refresh_asks_leader_to_replace(client, monkeypatch, tmp_path):
+    leader = CrawlLeader(str(tmp_path))
+    assert leader.try_acquire()
+    follower = CrawlLeader(str(tmp_path))
+    monkeypatch.setattr(main, "crawl_leader", follower)
+
+    assert client.post("/api/menus/refresh").json()["success"] is True
+    assert follower.pop_request() == (date.today(), True, True)
+    leader.release()
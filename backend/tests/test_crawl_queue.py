@@ -0,0 +1,68 @@
+import threading
+from collections import OrderedDict
+from datetime import date, timedelta
+
+import pytest
+
+import main
+
+TODAY = date.today()
+MONDAY = TODAY - timedelta(days=TODAY.weekday())
+
+
+@pytest.fixture
+def queue(fresh_db, monkeypatch):
+    monkeypatch.setattr(main, "crawl_leader", None)
+    monkeypatch.setattr(main, "_pending_crawls", OrderedDict())
+    monkeypatch.setattr(main, "_current_crawl_week", None)
+    monkeypatch.setattr(main, "_is_updating", False)
+    return main._pending_crawls
+
+
+def test_refresh_is_queued_instead_of_crawling_inline(client, queue, monkeypatch):
+    drained = threading.Event()
+    monkeypatch.setattr(main, "update_menus", lambda *args: pytest.fail("refresh must not crawl on the event loop"))
+    monkeypatch.setattr(main, "_drain_crawl_queue", drained.set)
+
+    response = client.post("/api/menus/refresh")
+
+    assert response.json()["success"] is True
+    assert queue == {MONDAY: (TODAY, True, True)}
+    assert drained.wait(5)
+
+
+def test_refresh_during_crawl_runs_after_it_with_replace(client, queue, monkeypatch):
+    crawls = []
+    release = threading.Event()
+
+    def update_menus(target_date, notify, replace):
+        crawls.append(replace)
+        if len(crawls) == 1:
+            release.wait(5)
+
+    monkeypatch.setattr(main, "update_menus", update_menus)
+    monkeypatch.setattr(main.crawl_admission, "record_result", lambda *args, **kwargs: None)
+
+    assert main.trigger_update_menus(TODAY, notify=False)
+    for _ in range(500):
+        if main._current_crawl_week == MONDAY:
+            break
+        threading.Event().wait(0.01)
+    # 같은 주의 일반 요청은 합쳐지고, 강제 갱신은 진행 중인 크롤링 뒤에 다시 실행
+    assert main.trigger_update_menus(TODAY, notify=True)
+    assert client.post("/api/menus/refresh").json()["success"] is True
+    assert queue == {MONDAY: (TODAY, True, True)}
+
+    release.set()
+    for _ in range(500):
+        if not main._is_updating:
+            break
+        threading.Event().wait(0.01)
+    assert crawls == [False, True]
+
+
+def test_refresh_reports_full_queue(client, queue, monkeypatch):
+    monkeypatch.setattr(main, "CRAWL_QUEUE_SIZE", 1)
+    queue[MONDAY + timedelta(days=7)] = (MONDAY + timedelta(days=7), False, False)
+
+    assert client.post("/api/menus/refresh").status_code == 503
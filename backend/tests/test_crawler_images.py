@@ -0,0 +1,79 @@
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from crawler import SMUCafeteriaCrawler
+
+
+@pytest.fixture
+def crawler():
+    return SMUCafeteriaCrawler()
+
+
+def encode(image: Image.Image, format: str) -> BytesIO:
+    buffer = BytesIO()
+    image.save(buffer, format=format)
+    buffer.seek(0)
+    return buffer
+
+
+@pytest.mark.parametrize("format", ["JPEG", "PNG"])
+def test_decode_shrinks_once_to_the_cap(crawler, format):
+    crawler.decode_max_side = 2400
+    image = crawler._decode_image(encode(Image.new("RGB", (6000, 3000), "white"), format))
+
+    assert image.mode == "L"
+    assert image.size == (2400, 1200)
+
+
+def test_decode_keeps_small_images(crawler):
+    image = crawler._decode_image(encode(Image.new("L", (1600, 900), 255), "JPEG"))
+
+    assert image.size == (1600, 900)
+
+
+class FakeOCRSpaceSession:
+    """업로드된 이미지 크기 기준 좌표로 요일 칸마다 단어 하나를 돌려주는 OCR.space 대역"""
+
+    def __init__(self, dishes):
+        self.dishes = dishes
+        self.uploaded_size = None
+
+    def post(self, url, data=None, files=None, timeout=None):
+        uploaded = Image.open(BytesIO(files["file"][1]))
+        self.uploaded_size = uploaded.size
+        column_width = uploaded.width / len(self.dishes)
+        lines = [
+            {
+                "MinTop": 10,
+                "Words": [{"WordText": dish, "Left": column_width * index + 5, "Top": 10, "Width": 30, "Height": 12}],
+            }
+            for index, dish in enumerate(self.dishes)
+        ]
+        return FakeResponse({"ParsedResults": [{"TextOverlay": {"Lines": lines}}]})
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+
+def test_api_overlay_is_mapped_back_to_body_coordinates(crawler):
+    dishes = ["김치찌개", "된장국", "제육볶음", "미역국", "비빔밥"]
+    session = FakeOCRSpaceSession(dishes)
+    crawler.ocr_engine = None
+    crawler.ocr_space_api_key = "test"
+    crawler.ocr_space_max_upload_bytes = 20_000
+    crawler._ocr_api_session = session
+    # 압축이 잘 안 되는 이미지라 업로드 한도를 맞추려고 크게 축소됨
+    image = Image.effect_noise((2000, 1400), 64)
+
+    days = crawler._extract_day_columns_from_image(image)
+
+    body_width = int(2000 * crawler.ocr_crop[2]) - int(2000 * crawler.ocr_crop[0])
+    assert session.uploaded_size[0] <= body_width * 0.5
+    assert [day[0] for day in days] == dishes
@@ -0,0 +1,54 @@
+from datetime import date
+
+from database import MenuDatabase
+from models import MealType, Menu, MenuItem, Restaurant
+
+MONDAY = date(2026, 10, 12)
+TUESDAY = date(2026, 10, 13)
+
+
+def make_menu(target_date: date, meal_type: MealType, name: str) -> Menu:
+    return Menu(date=target_date, restaurant=Restaurant.SEOUL_STUDENT, meal_type=meal_type, items=[MenuItem(name=name)])
+
+
+def test_readers_keep_the_snapshot_they_started_with():
+    db = MenuDatabase()
+    db.save_menus([make_menu(MONDAY, MealType.LUNCH, "김치찌개")])
+    iterator = db.iter_menus()
+
+    db.replace_menus([make_menu(MONDAY, MealType.LUNCH, "된장찌개")], MONDAY, MONDAY)
+
+    assert [menu.items[0].name for menu in iterator] == ["김치찌개"]
+    assert [menu.items[0].name for menu in db.get_daily_menus(MONDAY)] == ["된장찌개"]
+
+
+def test_changes_since_reports_updates_and_removals():
+    db = MenuDatabase()
+    db.save_menus([make_menu(MONDAY, MealType.LUNCH, "김치찌개"), make_menu(MONDAY, MealType.DINNER, "카레")])
+    version = db.version
+
+    db.replace_menus(
+        [make_menu(MONDAY, MealType.LUNCH, "된장찌개"), make_menu(TUESDAY, MealType.LUNCH, "비빔밥")],
+        MONDAY,
+        TUESDAY,
+    )
+
+    changed, removed, reset = db.changes_since(version)
+    assert not reset
+    assert {(menu.date, menu.meal_type, menu.items[0].name) for menu in changed} == {
+        (MONDAY, MealType.LUNCH, "된장찌개"),
+        (TUESDAY, MealType.LUNCH, "비빔밥"),
+    }
+    assert removed == [(MONDAY, Restaurant.SEOUL_STUDENT.value, MealType.DINNER.value)]
+    assert db.changes_since(db.version) == ([], [], False)
+
+
+def test_changes_since_older_than_history_requests_full_reset():
+    db = MenuDatabase()
+    db.save_menus([make_menu(MONDAY, MealType.LUNCH, "김치찌개")])
+    db.load_state(db.dump_state())
+
+    changed, removed, reset = db.changes_since(-1)
+    assert reset
+    assert removed == []
+    assert [menu.items[0].name for menu in changed] == ["김치찌개"]
@@ -0,0 +1,123 @@
+import asyncio
+from datetime import date
+
+import pytest
+
+import main
+from events import MenuEventBroker
+from models import MealType, Menu, MenuItem, Restaurant
+
+
+def publish_all(broker: MenuEventBroker, events):
+    async def run():
+        broker.bind_loop(asyncio.get_running_loop())
+        for event_id, data in events:
+            broker.publish("menus-updated", data, event_id=event_id)
+
+    asyncio.run(run())
+
+
+def test_reconnect_replays_every_missed_event():
+    broker = MenuEventBroker()
+    publish_all(broker, [(3, {"savedCount": 1}), (5, {"savedCount": 2}), (9, {"savedCount": 3})])
+
+    missed = broker.missed_messages(3)
+    assert [message.splitlines()[0] for message in missed] == ["id: 5", "id: 9"]
+    assert broker.missed_messages(9) == []
+    # 알 수 없는 (더 큰) ID면 마지막 이벤트만 보냄
+    assert [message.splitlines()[0] for message in broker.missed_messages(42)] == ["id: 9"]
+
+
+@pytest.fixture
+def event_broker(monkeypatch):
+    broker = MenuEventBroker()
+    monkeypatch.setattr(main, "menu_events", broker)
+    monkeypatch.setattr(main, "SSE_KEEPALIVE_SECONDS", 0.05)
+    return broker
+
+
+async def read_stream_ids(last_event_id: str, count: int):
+    """/api/menus/stream을 ASGI로 직접 호출해 id 줄을 count개 읽고 연결을 끊습니다.
+
+    TestClient는 응답이 끝날 때까지 본문을 모으므로 끝나지 않는 SSE 스트림에는 쓸 수 없습니다.
+    """
+    disconnected = asyncio.Event()
+    received = asyncio.Event()
+    chunks = []
+    start = {}
+
+    async def receive():
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            start.update(message)
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b"").decode())
+            if "".join(chunks).count("id: ") >= count:
+                received.set()
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/menus/stream",
+        "raw_path": b"/api/menus/stream",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"last-event-id", last_event_id.encode())],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    task = asyncio.create_task(main.app(scope, receive, send))
+    try:
+        await asyncio.wait_for(received.wait(), 5)
+    finally:
+        disconnected.set()
+        await asyncio.wait_for(task, 5)
+
+    assert start["status"] == 200
+    assert dict(start["headers"])[b"content-type"].startswith(b"text/event-stream")
+    body = "".join(chunks)
+    assert body.startswith(f"retry: {main.SSE_RETRY_MILLISECONDS}")
+    return [int(line.removeprefix("id: ")) for line in body.splitlines() if line.startswith("id: ")]
+
+
+def test_stream_replays_events_after_last_event_id(fresh_db, event_broker):
+    async def run():
+        event_broker.bind_loop(asyncio.get_running_loop())
+        for event_id in (1, 2, 4):
+            event_broker.publish("menus-updated", {"savedCount": event_id}, event_id=event_id)
+        replayed = await read_stream_ids("1", 2)
+
+        # 연결 중에 보낸 이벤트도 같은 스트림으로 전달
+        live = asyncio.create_task(read_stream_ids("4", 1))
+        while event_broker.subscriber_count == 0:
+            await asyncio.sleep(0.01)
+        event_broker.publish("menus-updated", {"savedCount": 5}, event_id=5)
+        return replayed, await live
+
+    replayed, live = asyncio.run(run())
+    assert replayed == [2, 4]
+    assert live == [5]
+    assert event_broker.subscriber_count == 0
+
+
+def test_update_publishes_store_version_as_event_id(fresh_db, event_broker, monkeypatch):
+    monday = date(2026, 10, 12)
+    menu = Menu(date=monday, restaurant=Restaurant.SEOUL_STUDENT, meal_type=MealType.LUNCH, items=[MenuItem(name="카레")])
+    monkeypatch.setattr(main, "STATIC_EXPORT_DIR", "")
+    monkeypatch.setattr(main, "SNAPSHOT_PATH", "")
+    monkeypatch.setattr(main, "due_sources", lambda monday: ["seoul_lunch"])
+    monkeypatch.setattr(main, "collect_source_menus", lambda monday, results, replace: [menu])
+    monkeypatch.setattr(main, "_crawler", type("Crawler", (), {"crawl_sources": lambda self, *args: {}})())
+
+    async def run():
+        event_broker.bind_loop(asyncio.get_running_loop())
+        main.update_menus(monday, False)
+
+    asyncio.run(run())
+    assert event_broker.missed_messages(0)[0].splitlines()[0] == f"id: {fresh_db.version}"
@@ -0,0 +1,77 @@
+from datetime import date, timedelta
+
+import pytest
+
+import main
+from crawler import SMUCafeteriaCrawler
+from models import MealType, Menu, MenuItem, Restaurant
+from source_freshness import CRAWL_SOURCES, SourceFreshness
+
+MONDAY = date.today() - timedelta(days=date.today().weekday())
+
+
+class FakeCrawler:
+    """소스마다 정상 메뉴 하나를 돌려주고 요청한 소스를 기록하는 크롤러 대역"""
+
+    def __init__(self):
+        self.calls = []
+
+    def crawl_sources(self, target_date, sources=None):
+        sources = list(sources or CRAWL_SOURCES)
+        self.calls.append(sources)
+        restaurants = {
+            "seoul_breakfast": (Restaurant.SEOUL_STUDENT, MealType.BREAKFAST),
+            "seoul_lunch": (Restaurant.SEOUL_STUDENT, MealType.LUNCH),
+            "cheonan_faculty": (Restaurant.CHEONAN_FACULTY, MealType.LUNCH),
+            "cheonan_student": (Restaurant.CHEONAN_STUDENT, MealType.LUNCH),
+        }
+        results = {}
+        for source in sources:
+            restaurant, meal_type = restaurants[source]
+            menu = Menu(date=MONDAY, restaurant=restaurant, meal_type=meal_type, items=[MenuItem(name="김치찌개")])
+            results[source] = ([menu], False)
+        return results
+
+
+@pytest.fixture
+def fresh_sources(fresh_db, monkeypatch):
+    freshness = SourceFreshness(intervals={source: 3600 for source in CRAWL_SOURCES})
+    monkeypatch.setattr(main, "source_freshness", freshness)
+    monkeypatch.setattr(main, "STATIC_EXPORT_DIR", "")
+    monkeypatch.setattr(main, "SNAPSHOT_PATH", "")
+    return freshness
+
+
+def test_fresh_sources_are_skipped_unless_replacing(fresh_sources, monkeypatch):
+    crawler = FakeCrawler()
+    monkeypatch.setattr(main, "_crawler", crawler)
+
+    main.update_menus(MONDAY, False)
+    main.update_menus(MONDAY, False)
+    assert crawler.calls == [list(CRAWL_SOURCES)]
+
+    main.update_menus(MONDAY, False, replace=True)
+    assert crawler.calls[-1] == list(CRAWL_SOURCES)
+    assert len(crawler.calls) == 2
+
+
+def test_loadtest_crawl_scenario_reaches_upstream(fresh_sources, loadtest, monkeypatch):
+    upstream = loadtest.start_stub_upstream(0)
+    try:
+        upstream_url = f"http://127.0.0.1:{upstream.server_port}"
+        monkeypatch.setenv("SMU_BASE_URL", upstream_url)
+        monkeypatch.setenv("OCR_SPACE_API_URL", f"{upstream_url}/ocr")
+        monkeypatch.setenv("OCR_SPACE_API_KEY", "loadtest")
+        crawler = SMUCafeteriaCrawler()
+        crawler.ocr_engine = None
+        monkeypatch.setattr(main, "_crawler", crawler)
+
+        loadtest.crawl_from_upstream(main)
+        loadtest.StubUpstreamHandler.counts = {}
+        loadtest.crawl_from_upstream(main)
+
+        counts = loadtest.StubUpstreamHandler.counts
+        assert counts.get("seoul", 0) > 0
+        assert counts.get("image", 0) > 0
+    finally:
+        upstream.shutdown()
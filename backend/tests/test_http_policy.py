@@ -0,0 +1,66 @@
+import pytest
+import requests
+
+from crawler import SMUCafeteriaCrawler
+from http_policy import CircuitOpenError, HostPolicy
+
+PAGE_URL = "https://www.smu.ac.kr/kor/life/restaurantView.do"
+IMAGE_URL = "https://www.smu.ac.kr/_attach/image/menu.jpg"
+
+
+def test_timeouts_grow_back_when_host_slows_down():
+    policy = HostPolicy(min_samples=5, window=10)
+    for _ in range(10):
+        policy.record_success(PAGE_URL, 0.5)
+    learned = policy.timeout_for(PAGE_URL, 20)
+    assert learned == 3
+
+    for _ in range(3):
+        policy.record_failure(PAGE_URL, timed_out_after=policy.timeout_for(PAGE_URL, 20))
+
+    assert policy.timeout_for(PAGE_URL, 20) > learned
+
+
+def test_half_open_probe_is_reported(monkeypatch):
+    policy = HostPolicy(failure_threshold=2, reset_timeout=60)
+    assert policy.check(PAGE_URL) is False
+    policy.record_failure(PAGE_URL)
+    policy.record_failure(PAGE_URL)
+    with pytest.raises(CircuitOpenError):
+        policy.check(PAGE_URL)
+
+    policy.reset_timeout = 0
+    assert policy.check(PAGE_URL) is True
+    policy.record_success(PAGE_URL, 8.0)
+    assert policy.check(PAGE_URL) is False
+
+
+def test_image_failures_do_not_open_page_circuit():
+    policy = HostPolicy(failure_threshold=2)
+    for _ in range(3):
+        policy.record_failure(IMAGE_URL, route="image")
+
+    with pytest.raises(CircuitOpenError):
+        policy.check(IMAGE_URL, route="image")
+    assert policy.check(PAGE_URL) is False
+
+
+def test_crawler_probe_uses_default_timeout(monkeypatch):
+    crawler = SMUCafeteriaCrawler()
+    crawler.http_policy = HostPolicy(failure_threshold=1, reset_timeout=0, min_samples=1)
+    crawler.http_policy.record_success(PAGE_URL, 0.1)
+    crawler.http_policy.record_failure(PAGE_URL)
+    timeouts = []
+
+    def fake_send(url, params, headers, timeout, stream, hedge, route="page"):
+        timeouts.append(timeout)
+        response = requests.Response()
+        response.status_code = 200
+        return response
+
+    monkeypatch.setattr(crawler, "_send_get", fake_send)
+    crawler._get_with_retry(PAGE_URL, timeout=20)
+    crawler._get_with_retry(PAGE_URL, timeout=20)
+
+    # 시험 요청은 기본 타임아웃, 회복 후에는 다시 학습한 타임아웃
+    assert timeouts == [20, 3]
@@ -0,0 +1,75 @@
+import pytest
+from PIL import Image
+
+from crawler import SMUCafeteriaCrawler
+
+
+class FakeOCREngine:
+    """psm마다 정해 둔 줄과 신뢰도를 image_to_data 형식으로 돌려주는 OCR 엔진 대역"""
+
+    def __init__(self, results):
+        self.results = results
+        self.calls = []
+
+    def image_to_data(self, image, psm):
+        self.calls.append(psm)
+        lines, confidence = self.results[psm]
+        data = {"text": [], "conf": [], "block_num": [], "par_num": [], "line_num": []}
+        for line_number, line in enumerate(lines, start=1):
+            data["text"].append(line)
+            data["conf"].append(confidence)
+            data["block_num"].append(1)
+            data["par_num"].append(1)
+            data["line_num"].append(line_number)
+        return data
+
+
+@pytest.fixture
+def crawler():
+    crawler = SMUCafeteriaCrawler()
+    crawler.ocr_primary_psm, crawler.ocr_fallback_psm = 6, 4
+    crawler.ocr_min_confidence = 70
+    crawler.ocr_min_quality_score = 20
+    return crawler
+
+
+CROP = Image.new("L", (200, 400), 255)
+GOOD = (["흑미밥", "김치찌개", "제육볶음", "배추김치"], 91)
+NOISY = (["oO", "김"], 38)
+
+
+def test_adaptive_skips_second_pass_when_first_is_confident(crawler):
+    crawler.ocr_strategy = "adaptive"
+    crawler.ocr_engine = FakeOCREngine({6: GOOD, 4: NOISY})
+
+    parsed, raw_texts, stats = crawler._ocr_column_adaptive(CROP)
+
+    assert crawler.ocr_engine.calls == [6]
+    assert parsed == GOOD[0]
+    assert raw_texts == ["\n".join(GOOD[0])]
+    assert (stats["confidence"], stats["passes"], stats["strategy"]) == (91.0, 1, "psm6")
+    assert stats["score"] >= crawler.ocr_min_quality_score
+
+
+def test_adaptive_runs_fallback_and_keeps_better_result(crawler):
+    crawler.ocr_strategy = "adaptive"
+    crawler.ocr_engine = FakeOCREngine({6: NOISY, 4: GOOD})
+
+    parsed, raw_texts, stats = crawler._ocr_column_adaptive(CROP)
+
+    assert crawler.ocr_engine.calls == [6, 4]
+    assert parsed == GOOD[0]
+    assert len(raw_texts) == 2
+    assert stats["passes"] == 2 and stats["strategy"] == "psm4"
+
+
+@pytest.mark.parametrize("strategy, calls", [("both", [6, 4]), ("fast", [6])])
+def test_fixed_strategies(crawler, strategy, calls):
+    crawler.ocr_strategy = strategy
+    crawler.ocr_engine = FakeOCREngine({6: GOOD, 4: GOOD})
+
+    parsed, _, stats = crawler._ocr_column_adaptive(CROP)
+
+    assert crawler.ocr_engine.calls == calls
+    assert parsed == GOOD[0]
+    assert stats["passes"] == len(calls)
@@ -0,0 +1,73 @@
+import json
+
+import pytest
+
+from crawler import SMUCafeteriaCrawler
+
+
+def test_expand_matrix_builds_every_combination(ocr_tuning):
+    configs = ocr_tuning.expand_matrix({
+        "ocr_strategy": ["adaptive", "both"],
+        "ocr_fixed_scale": [None, 1.5, 2.0],
+    })
+
+    assert len(configs) == 6
+    assert {"ocr_fixed_scale": 1.5, "ocr_strategy": "both"} in configs
+    assert all(set(config) == {"ocr_fixed_scale", "ocr_strategy"} for config in configs)
+
+
+def test_expand_matrix_rejects_unknown_keys(ocr_tuning):
+    with pytest.raises(ValueError, match="ocr_unknown"):
+        ocr_tuning.expand_matrix({"ocr_unknown": [1], "ocr_sharpen": [True]})
+
+
+def test_score_day_matches_normalized_names_once(ocr_tuning):
+    predicted = ["흑미 밥", "김치찌개", "김치찌개", "OO"]
+    expected = ["흑미밥", "김치찌개", "배추김치"]
+
+    assert ocr_tuning.score_day(predicted, expected) == (2, 4, 3)
+
+
+def test_score_day_ignores_placeholders_and_notices(ocr_tuning):
+    predicted = [
+        "중식정보없음",
+        "중식 미운영",
+        "조식제공X",
+        "* 위 식단은 식자재 수급에 따라 변경될 수 있습니다.",
+        "원산지: 쌀(국내산)",
+        "제육볶음",
+    ]
+
+    assert ocr_tuning.score_day(predicted, ["제육볶음"]) == (1, 1, 1)
+
+
+def test_exported_tuning_round_trips_through_the_crawler(ocr_tuning, tmp_path, monkeypatch):
+    config = {"ocr_strategy": "both", "ocr_fixed_scale": 2.0, "ocr_sharpen": False, "ocr_crop": [0.2, 0.2, 0.9, 0.8]}
+    metrics = {"f1": 0.91, "wall": 0.42, "matched": {"menu1.jpg": 20}}
+    path = tmp_path / "tuning" / "ocr_tuning.json"
+
+    ocr_tuning.export_tuning(str(path), config, metrics, ["menu1.jpg"])
+
+    exported = json.loads(path.read_text(encoding="utf-8"))
+    assert exported["metrics"] == {"f1": 0.91, "wall": 0.42}
+    assert exported["fixtures"] == ["menu1.jpg"]
+
+    expected = SMUCafeteriaCrawler()
+    expected.apply_ocr_tuning(config)
+    assert exported["config"] == expected.ocr_tuning()
+
+    monkeypatch.setenv("OCR_TUNING_PATH", str(path))
+    loaded = SMUCafeteriaCrawler()
+    assert loaded.ocr_tuning() == expected.ocr_tuning()
+    assert loaded.ocr_strategy == "both"
+    assert loaded.ocr_fixed_scale == 2.0
+    assert loaded.ocr_crop == (0.2, 0.2, 0.9, 0.8)
+
+
+def test_invalid_exported_tuning_is_ignored(tmp_path, monkeypatch):
+    default = SMUCafeteriaCrawler().ocr_tuning()
+    path = tmp_path / "ocr_tuning.json"
+    path.write_text(json.dumps({"config": {"ocr_strategy": "slow", "ocr_sharpen": False}}), encoding="utf-8")
+    monkeypatch.setenv("OCR_TUNING_PATH", str(path))
+
+    assert SMUCafeteriaCrawler().ocr_tuning() == default
@@ -0,0 +1,82 @@
+import threading
+from datetime import date
+
+import pytest
+
+import main
+from menu_filters import NOTICE_ITEMS
+from models import MealType, Menu, MenuItem, Restaurant
+from push_registry import TOPIC_ALL, TOPIC_DAILY_DIGEST, PushSubscriptionRegistry
+
+
+def subscription(index: int, topics=None) -> dict:
+    return {"endpoint": f"https://push.example/{index}", "keys": {"p256dh": "p", "auth": "a"}, "topics": topics or [TOPIC_ALL]}
+
+
+@pytest.mark.parametrize("configured_token, headers, status", [
+    ("", {}, 503),
+    ("secret", {}, 401),
+    ("secret", {"X-Admin-Token": "wrong"}, 401),
+])
+def test_digest_requires_admin_token(client, monkeypatch, configured_token, headers, status):
+    monkeypatch.setattr(main, "ADMIN_TOKEN", configured_token)
+    monkeypatch.setattr(main, "VAPID_PUBLIC_KEY", "public")
+    monkeypatch.setattr(main, "VAPID_PRIVATE_KEY", "private")
+    sent = []
+    monkeypatch.setattr(main, "send_daily_digest", lambda target_date: sent.append(target_date) or {})
+
+    response = client.post("/api/push/digest", headers=headers)
+
+    assert response.status_code == status
+    assert sent == []
+
+
+def test_digest_lists_only_dishes(fresh_db, monkeypatch):
+    monday = date(2026, 10, 12)
+
+    def menu(restaurant, meal_type, names):
+        return Menu(date=monday, restaurant=restaurant, meal_type=meal_type, items=[MenuItem(name=name) for name in names])
+
+    fresh_db.save_menus([
+        menu(Restaurant.CHEONAN_FACULTY, MealType.LUNCH, ["* 원산지 안내", *NOTICE_ITEMS]),
+        menu(Restaurant.SEOUL_STUDENT, MealType.BREAKFAST, ["조식제공X"]),
+        menu(Restaurant.CHEONAN_STUDENT, MealType.BREAKFAST, ["조식 미운영"]),
+        menu(Restaurant.CHEONAN_STUDENT, MealType.LUNCH, [NOTICE_ITEMS[0], "김치찌개", "중식정보없음", "제육볶음"]),
+    ])
+    sent = []
+    monkeypatch.setattr(main, "send_push_payload", lambda payload, topics: sent.append((payload, topics)) or {})
+
+    main.send_daily_digest(monday)
+
+    payload, topics = sent[0]
+    assert topics == [TOPIC_DAILY_DIGEST]
+    assert payload["body"] == "천안_학생식당 lunch: 김치찌개, 제육볶음"
+
+
+def test_registry_survives_concurrent_updates_and_reads():
+    registry = PushSubscriptionRegistry([subscription(index) for index in range(200)])
+    errors = []
+    stop = threading.Event()
+
+    def read():
+        while not stop.is_set():
+            try:
+                registry.for_topics([TOPIC_ALL, "campus:seoul"])
+                registry.topic_counts()
+                registry.all()
+            except Exception as error:  # dict changed size, KeyError 등
+                errors.append(error)
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    for index in range(200, 3000):
+        registry.upsert(subscription(index, [TOPIC_ALL, "campus:seoul"]))
+        registry.remove(f"https://push.example/{index - 200}")
+    stop.set()
+    for reader in readers:
+        reader.join()
+
+    assert errors == []
+    assert len(registry) == 200
+    assert len(registry.for_topics([TOPIC_ALL])) == 200
@@ -0,0 +1,39 @@
+from datetime import date
+
+from menu_filters import NOTICE_ITEMS
+from models import MealType, Menu, MenuItem, Restaurant
+from search_index import MenuSearchIndex
+
+MONDAY = date(2026, 10, 12)
+
+
+def index_menu(index: MenuSearchIndex, restaurant: Restaurant, meal_type: MealType, names):
+    menu = Menu(date=MONDAY, restaurant=restaurant, meal_type=meal_type, items=[MenuItem(name=name) for name in names])
+    index.add((MONDAY, restaurant.value, meal_type.value), menu)
+
+
+def test_notices_and_placeholders_are_not_indexed():
+    index = MenuSearchIndex()
+    index_menu(index, Restaurant.CHEONAN_FACULTY, MealType.LUNCH, ["김치찌개", "제육볶음", *NOTICE_ITEMS])
+    index_menu(index, Restaurant.SEOUL_STUDENT, MealType.BREAKFAST, ["조식제공X"])
+    index_menu(index, Restaurant.CHEONAN_STUDENT, MealType.BREAKFAST, ["조식 미운영"])
+    index_menu(index, Restaurant.CHEONAN_STUDENT, MealType.LUNCH, ["중식정보없음"])
+
+    assert index.search("원산지") == []
+    assert index.search("조식") == []
+    assert index.search("정보없음") == []
+    assert [name for name, _ in index.search("김치")] == ["김치찌개"]
+
+
+def test_search_endpoint_skips_origin_notice(client, fresh_db):
+    fresh_db.save_menus([
+        Menu(
+            date=MONDAY,
+            restaurant=Restaurant.CHEONAN_FACULTY,
+            meal_type=MealType.LUNCH,
+            items=[MenuItem(name="된장국"), *(MenuItem(name=notice) for notice in NOTICE_ITEMS)],
+        )
+    ])
+
+    assert client.get("/api/menus/search", params={"q": "원산지"}).json()["data"] == []
+    assert client.get("/api/menus/search", params={"q": "된장"}).json()["data"][0]["name"] == "된장국"
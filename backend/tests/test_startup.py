@@ -0,0 +1,61 @@
+import asyncio
+import json
+from datetime import date, timedelta
+
+import pytest
+
+import main
+from database import MenuDatabase
+from events import MenuEventBroker
+from models import MealType, Menu, MenuItem, Restaurant
+
+MONDAY = date.today() - timedelta(days=date.today().weekday())
+
+
+@pytest.mark.parametrize("content", [
+    '{"version": 3, "menus": [{"date": "2026-10-12", "restaurant": "서울_학생',
+    "[]",
+    '{"menus": 5}',
+    '{"menus": [{"date": "not-a-date", "restaurant": "서울_학생식당", "meal_type": "lunch", "items": []}]}',
+    '{"menus": [], "tombstones": [["2026-10-12", "서울_학생식당"]]}',
+])
+def test_unreadable_snapshot_is_ignored(tmp_path, content):
+    path = tmp_path / "snapshot.json"
+    path.write_text(content, encoding="utf-8")
+    database = MenuDatabase()
+
+    assert database.load_snapshot(str(path)) is False
+    assert database.menus == []
+    assert database.load_snapshot(str(tmp_path / "missing.json")) is False
+
+
+@pytest.fixture
+def startup(fresh_db, monkeypatch, tmp_path):
+    crawls = []
+    monkeypatch.setattr(main, "crawl_leader", None)
+    monkeypatch.setattr(main, "STARTUP_MODE", "fast")
+    monkeypatch.setattr(main, "SNAPSHOT_PATH", str(tmp_path / "snapshot.json"))
+    monkeypatch.setattr(main, "menu_events", MenuEventBroker())
+    monkeypatch.setattr(main, "trigger_update_menus", lambda target_date=None, notify=False: crawls.append(target_date))
+    return tmp_path / "snapshot.json", crawls
+
+
+def test_corrupt_snapshot_falls_back_to_crawl(startup):
+    path, crawls = startup
+    path.write_text('{"version": 1, "menus": [', encoding="utf-8")
+
+    asyncio.run(main.startup_event())
+
+    assert crawls == [date.today()]
+
+
+def test_warm_boot_skips_crawl_when_week_is_stored(startup):
+    path, crawls = startup
+    database = MenuDatabase()
+    database.save_menus([Menu(date=MONDAY, restaurant=Restaurant.SEOUL_STUDENT, meal_type=MealType.LUNCH, items=[MenuItem(name="카레")])])
+    path.write_text(json.dumps(database.dump_state(), ensure_ascii=False), encoding="utf-8")
+
+    asyncio.run(main.startup_event())
+
+    assert crawls == []
+    assert len(main.db.menus) == 1
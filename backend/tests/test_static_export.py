@@ -0,0 +1,144 @@
+import os
+from datetime import date, timedelta
+
+import requests
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from cache_policy import CachePolicy
+from models import MealType, Menu, MenuItem, Restaurant
+from static_export import StaticMenuFiles, StaticPublisher, export_static_snapshot
+
+
+def make_menu(menu_date: date, restaurant: Restaurant, name: str = "쌀밥") -> Menu:
+    return Menu(date=menu_date, restaurant=restaurant, meal_type=MealType.LUNCH, items=[MenuItem(name=name)])
+
+
+def test_export_prunes_files_missing_from_store(tmp_path):
+    monday = date(2026, 10, 12)
+    export_static_snapshot([
+        make_menu(monday, Restaurant.SEOUL_STUDENT),
+        make_menu(monday, Restaurant.CHEONAN_STUDENT),
+        make_menu(monday - timedelta(days=7), Restaurant.SEOUL_STUDENT),
+    ], str(tmp_path))
+    old_week = tmp_path / "week" / f"{monday - timedelta(days=7)}.json"
+    cheonan = tmp_path / "restaurant" / Restaurant.CHEONAN_STUDENT.value / f"{monday}.json"
+    assert old_week.exists() and cheonan.exists()
+
+    changed = export_static_snapshot([make_menu(monday, Restaurant.SEOUL_STUDENT)], str(tmp_path))
+
+    assert changed > 0
+    assert not old_week.exists()
+    assert not os.path.exists(f"{old_week}.gz")
+    assert not cheonan.parent.exists()
+    assert (tmp_path / "week" / f"{monday}.json").exists()
+    assert (tmp_path / "date" / f"{monday}.json").exists()
+
+
+def test_static_files_carry_cache_headers(tmp_path):
+    monday = date(2026, 10, 12)
+    export_static_snapshot([make_menu(monday, Restaurant.SEOUL_STUDENT)], str(tmp_path))
+    app = FastAPI()
+    app.mount("/static/menus", StaticMenuFiles(directory=str(tmp_path), cache_policy=CachePolicy()))
+    client = TestClient(app)
+
+    response = client.get(f"/static/menus/date/{monday}.json")
+    assert response.status_code == 200
+    assert "s-maxage" in response.headers["cache-control"]
+    assert response.headers["surrogate-key"].split() == ["date-2026-10-12", "menus", "week-2026-10-12"]
+
+    response = client.get(f"/static/menus/restaurant/{Restaurant.SEOUL_STUDENT.value}/{monday}.json")
+    assert "restaurant-seoul_student" in response.headers["surrogate-key"]
+
+    assert client.get("/static/menus/manifest.json").headers["cache-control"] == "no-store"
+
+
+def test_static_files_negotiate_precompressed_variants(tmp_path):
+    monday = date(2026, 10, 12)
+    export_static_snapshot([make_menu(monday, Restaurant.SEOUL_STUDENT)], str(tmp_path))
+    app = FastAPI()
+    app.mount("/static/menus", StaticMenuFiles(directory=str(tmp_path), cache_policy=CachePolicy()))
+    client = TestClient(app)
+    path = f"/static/menus/date/{monday}.json"
+    original = (tmp_path / "date" / f"{monday}.json").read_bytes()
+
+    response = client.get(path, headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["content-type"] == "application/json"
+    assert response.content == original
+
+    response = client.get(path, headers={"Accept-Encoding": "gzip;q=0, identity"})
+    assert "content-encoding" not in response.headers
+    assert response.content == original
+
+    assert client.get(f"{path}.gz").status_code == 404
+
+
+class FakePublishSession:
+    requests = []
+    fail = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def _record(self, method, url, **kwargs):
+        FakePublishSession.requests.append((method, url, kwargs.get("data"), kwargs["headers"]))
+        response = requests.Response()
+        response.status_code = 500 if FakePublishSession.fail else 200
+        return response
+
+    def put(self, url, **kwargs):
+        return self._record("PUT", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self._record("DELETE", url, **kwargs)
+
+
+def test_publisher_uploads_everything_first_then_only_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(requests, "Session", FakePublishSession)
+    FakePublishSession.requests = []
+    FakePublishSession.fail = False
+    publisher = StaticPublisher("https://cdn.example.com/menus/", token="secret", cache_control="public, max-age=300")
+    monday = date(2026, 10, 12)
+    last_week = monday - timedelta(days=7)
+
+    export_static_snapshot([make_menu(monday, Restaurant.SEOUL_STUDENT), make_menu(last_week, Restaurant.SEOUL_STUDENT)], str(tmp_path), publisher)
+    uploaded = {url for method, url, _, _ in FakePublishSession.requests if method == "PUT"}
+    assert f"https://cdn.example.com/menus/week/{last_week}.json" in uploaded
+    assert "https://cdn.example.com/menus/manifest.json" in uploaded
+    assert not any(url.endswith((".gz", ".br")) for url in uploaded)
+    _, url, content, headers = FakePublishSession.requests[0]
+    assert content == (tmp_path / url.removeprefix("https://cdn.example.com/menus/")).read_bytes()
+    assert headers["Authorization"] == "Bearer secret"
+    assert headers["Cache-Control"] == "public, max-age=300"
+
+    FakePublishSession.requests = []
+    export_static_snapshot([make_menu(monday, Restaurant.SEOUL_STUDENT, "잡곡밥")], str(tmp_path), publisher)
+    sent = {(method, url.removeprefix("https://cdn.example.com/menus/")) for method, url, _, _ in FakePublishSession.requests}
+    assert sent == {
+        ("PUT", f"date/{monday}.json"),
+        ("PUT", f"week/{monday}.json"),
+        ("PUT", f"restaurant/{Restaurant.SEOUL_STUDENT.value}/{monday}.json"),
+        ("PUT", "manifest.json"),
+        ("DELETE", f"date/{last_week}.json"),
+        ("DELETE", f"week/{last_week}.json"),
+        ("DELETE", f"restaurant/{Restaurant.SEOUL_STUDENT.value}/{last_week}.json"),
+    }
+
+
+def test_publisher_resyncs_everything_after_a_failure(tmp_path, monkeypatch):
+    monkeypatch.setattr(requests, "Session", FakePublishSession)
+    FakePublishSession.requests = []
+    FakePublishSession.fail = True
+    publisher = StaticPublisher("https://cdn.example.com/menus")
+    monday = date(2026, 10, 12)
+    export_static_snapshot([make_menu(monday, Restaurant.SEOUL_STUDENT)], str(tmp_path), publisher)
+
+    FakePublishSession.requests = []
+    FakePublishSession.fail = False
+    assert export_static_snapshot([make_menu(monday, Restaurant.SEOUL_STUDENT)], str(tmp_path), publisher) == 0
+    assert len(FakePublishSession.requests) == 4
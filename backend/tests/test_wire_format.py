@@ -0,0 +1,40 @@
+from datetime import date
+
+import pytest
+
+pytest.importorskip("msgpack")
+
+from models import MealType, Menu, MenuItem, Restaurant
+from wire_format import decode_menu_payload, encode_menu_payload, wants_msgpack
+
+MONDAY = date(2026, 10, 12)
+
+
+def test_menu_payload_round_trip():
+    menus = [
+        Menu(
+            date=MONDAY,
+            restaurant=Restaurant.CHEONAN_FACULTY,
+            meal_type=MealType.LUNCH,
+            items=[MenuItem(name="김치찌개"), MenuItem(name="제육볶음")],
+        ),
+        Menu(
+            date=date(2026, 10, 14),
+            restaurant=Restaurant.SEOUL_STUDENT,
+            meal_type=MealType.DINNER,
+            items=[MenuItem(name="카레")],
+        ),
+    ]
+
+    content = encode_menu_payload({"message": None}, "menus", menus)
+    fields, decoded = decode_menu_payload(content, "menus")
+
+    assert fields["message"] is None
+    assert [menu.model_dump() for menu in decoded] == [menu.model_dump() for menu in menus]
+
+
+def test_wants_msgpack_respects_quality():
+    assert wants_msgpack("application/x-msgpack")
+    assert wants_msgpack("application/json;q=0.5, application/x-msgpack")
+    assert not wants_msgpack("application/x-msgpack;q=0, application/json")
+    assert not wants_msgpack(None)
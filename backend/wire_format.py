@@ -0,0 +1,123 @@
+from datetime import date, datetime
+from typing import List, Optional
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+from models import MealType, Menu, MenuItem, Restaurant
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MSGPACK_MEDIA_TYPES = {MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack"}
+WIRE_VERSION = 1
+
+# 식당/식사 타입은 이 목록의 인덱스로 보냄 (응답 머리글에 같은 목록을 함께 보냄)
+RESTAURANT_CODES = [restaurant.value for restaurant in Restaurant]
+MEAL_TYPE_CODES = [meal_type.value for meal_type in MealType]
+_RESTAURANT_INDEX = {value: index for index, value in enumerate(RESTAURANT_CODES)}
+_MEAL_TYPE_INDEX = {value: index for index, value in enumerate(MEAL_TYPE_CODES)}
+
+
+def _accept_quality(part: str) -> tuple[str, float]:
+    media_type, *params = [item.strip() for item in part.split(";")]
+    quality = 1.0
+    for param in params:
+        key, _, value = param.partition("=")
+        if key.strip() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+    return media_type.lower(), quality
+
+
+def wants_msgpack(accept: Optional[str]) -> bool:
+    """Accept 헤더가 JSON보다 MessagePack을 같거나 더 선호하면 True (msgpack이 설치된 경우만)"""
+    if not accept or not MSGPACK_AVAILABLE:
+        return False
+
+    msgpack_quality = 0.0
+    json_quality = 0.0
+    for part in accept.split(","):
+        media_type, quality = _accept_quality(part)
+        if media_type in MSGPACK_MEDIA_TYPES:
+            msgpack_quality = max(msgpack_quality, quality)
+        elif media_type in ("application/json", "application/*", "*/*"):
+            json_quality = max(json_quality, quality)
+    return msgpack_quality > 0 and msgpack_quality >= json_quality
+
+
+def _pack_item(item: MenuItem):
+    if item.price is None and item.calories is None:
+        return item.name
+    return [item.name, item.price, item.calories]
+
+
+def pack_menus(menus: List[Menu], base_date: date) -> List[list]:
+    """메뉴를 [base_date로부터의 일수, 식당 코드, 식사 타입 코드, 항목] 행으로 바꿉니다.
+
+    항목은 가격/칼로리가 없으면 이름 문자열, 있으면 [이름, 가격, 칼로리]입니다.
+    """
+    return [
+        [
+            (menu.date - base_date).days,
+            _RESTAURANT_INDEX[menu.restaurant],
+            _MEAL_TYPE_INDEX[menu.meal_type],
+            [_pack_item(item) for item in menu.items],
+        ]
+        for menu in menus
+    ]
+
+
+def unpack_menus(
+    rows: List[list],
+    base_date: date,
+    restaurants: List[str] = RESTAURANT_CODES,
+    meal_types: List[str] = MEAL_TYPE_CODES,
+) -> List[Menu]:
+    """pack_menus의 역변환. 코드는 응답 머리글의 restaurants/mealTypes 목록으로 해석합니다."""
+    menus = []
+    for offset, restaurant, meal_type, items in rows:
+        menus.append(Menu(
+            date=date.fromordinal(base_date.toordinal() + offset),
+            restaurant=restaurants[restaurant],
+            meal_type=meal_types[meal_type],
+            items=[
+                MenuItem(name=item) if isinstance(item, str)
+                else MenuItem(name=item[0], price=item[1], calories=item[2])
+                for item in items
+            ],
+        ))
+    return menus
+
+
+def _default(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def encode_menu_payload(fields: dict, menus_key: str, menus: List[Menu], base_date: Optional[date] = None) -> bytes:
+    """응답 필드와 메뉴 목록을 압축 표현의 MessagePack으로 인코딩합니다.
+
+    menus_key 자리에 메뉴 행이 들어가고, 머리글(v, restaurants, mealTypes, baseDate)로 행을 해석합니다.
+    """
+    if base_date is None:
+        base_date = min((menu.date for menu in menus), default=date.today())
+    payload = {
+        "v": WIRE_VERSION,
+        "restaurants": RESTAURANT_CODES,
+        "mealTypes": MEAL_TYPE_CODES,
+        "baseDate": base_date.isoformat(),
+        **fields,
+        menus_key: pack_menus(menus, base_date),
+    }
+    return msgpack.packb(payload, default=_default, use_bin_type=True)
+
+
+def decode_menu_payload(content: bytes, menus_key: str) -> tuple[dict, List[Menu]]:
+    payload = msgpack.unpackb(content, raw=False)
+    base_date = date.fromisoformat(payload["baseDate"])
+    return payload, unpack_menus(payload[menus_key], base_date, payload["restaurants"], payload["mealTypes"])
@@ -1,3 +1,46 @@
+/**
+ * 백엔드가 기록해 CDN에 올린 정적 메뉴 스냅샷과 그 캐시 헤더를 조회 (없거나 실패하면 null)
+ */
+async function fetchStaticSnapshot(path) {
+    const staticBaseUrl = process.env.STATIC_MENU_BASE_URL;
+    if (!staticBaseUrl) {
+        return null;
+    }
+
+    try {
+        const response = await fetch(`${staticBaseUrl.replace(/\/$/, '')}${path}`, {
+            headers: { 'Accept': 'application/json' }
+        });
+        if (!response.ok) {
+            return null;
+        }
+        return { payload: await response.json(), cacheHeaders: pickCacheHeaders(response) };
+    } catch (error) {
+        console.warn('Static snapshot fetch failed:', error);
+        return null;
+    }
+}
+
+/**
+ * 백엔드 응답의 캐시 헤더를 그대로 전달 (Surrogate-Key는 Netlify-Cache-Tag로 변환)
+ */
+function pickCacheHeaders(response) {
+    const cacheHeaders = {};
+    const cacheControl = response.headers.get('cache-control');
+    if (cacheControl) {
+        cacheHeaders['Cache-Control'] = cacheControl;
+    }
+    const expires = response.headers.get('expires');
+    if (expires) {
+        cacheHeaders['Expires'] = expires;
+    }
+    const surrogateKey = response.headers.get('surrogate-key');
+    if (surrogateKey) {
+        cacheHeaders['Netlify-Cache-Tag'] = surrogateKey.split(' ').join(',');
+    }
+    return cacheHeaders;
+}
+
 /**
  * 백엔드 API를 프록시하여 오늘 메뉴를 반환
  */
@@ -14,6 +57,15 @@ exports.handler = async (event) => {
     }
 
     try {
+        const snapshot = await fetchStaticSnapshot(`/date/${new Date().toISOString().split('T')[0]}.json`);
+        if (snapshot) {
+            return {
+                statusCode: 200,
+                headers: { ...headers, ...snapshot.cacheHeaders },
+                body: JSON.stringify(snapshot.payload)
+            };
+        }
+
         const apiBaseUrl = process.env.BACKEND_API_URL || process.env.NETLIFY_BACKEND_API_URL || process.env.VITE_API_URL || 'https://smubab-api.onrender.com';
 
         const normalizedBaseUrl = apiBaseUrl.replace(/\/$/, '');
@@ -34,7 +86,7 @@ exports.handler = async (event) => {
 
         return {
             statusCode: 200,
-            headers,
+            headers: { ...headers, ...pickCacheHeaders(response) },
             body: JSON.stringify(payload)
         };
     } catch (error) {